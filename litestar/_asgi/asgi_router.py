@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import re
 from collections import defaultdict
-from functools import lru_cache
+from itertools import takewhile
 from traceback import format_exc
-from typing import TYPE_CHECKING, Any, Pattern
+from typing import TYPE_CHECKING, Any, Iterable
 
-from litestar._asgi.routing_trie import validate_node
+from litestar._asgi.routing_cache import RoutingCache
+from litestar._asgi.routing_trie.compiler import add_route_to_compiled_trie, compile_route_trie
 from litestar._asgi.routing_trie.mapping import add_route_to_trie
 from litestar._asgi.routing_trie.traversal import parse_path_to_route
-from litestar._asgi.routing_trie.types import create_node
+from litestar._asgi.routing_trie.types import create_mount_trie_node, create_node
 from litestar._asgi.utils import get_route_handlers
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.utils import normalize_path
@@ -18,7 +18,7 @@ __all__ = ("ASGIRouter",)
 
 
 if TYPE_CHECKING:
-    from litestar._asgi.routing_trie.types import RouteTrieNode
+    from litestar._asgi.routing_trie.types import CompiledRouteTrieNode, MountTrieNode, RouteTrieNode
     from litestar.app import Litestar
     from litestar.routes import ASGIRoute, HTTPRoute, WebSocketRoute
     from litestar.routes.base import BaseRoute
@@ -45,8 +45,8 @@ class ASGIRouter:
     """
 
     __slots__ = (
-        "_mount_paths_regex",
-        "_mount_routes",
+        "_compiled_root_node",
+        "_mount_trie",
         "_plain_routes",
         "_registered_routes",
         "_static_routes",
@@ -54,6 +54,8 @@ class ASGIRouter:
         "root_route_map_node",
         "route_handler_index",
         "route_mapping",
+        "route_middleware",
+        "routing_cache",
     )
 
     def __init__(self, app: Litestar) -> None:
@@ -62,14 +64,18 @@ class ASGIRouter:
         Args:
             app: The Litestar app instance
         """
-        self._mount_paths_regex: Pattern | None = None
-        self._mount_routes: dict[str, RouteTrieNode] = {}
+        self._mount_trie: MountTrieNode = create_mount_trie_node()
         self._plain_routes: set[str] = set()
         self._registered_routes: set[HTTPRoute | WebSocketRoute | ASGIRoute] = set()
         self.app = app
         self.root_route_map_node: RouteTrieNode = create_node()
+        self._compiled_root_node: CompiledRouteTrieNode | None = (
+            compile_route_trie(self.root_route_map_node) if app.routing_config.compiled_matcher else None
+        )
         self.route_handler_index: dict[str, RouteHandlerType] = {}
         self.route_mapping: dict[str, list[BaseRoute]] = defaultdict(list)
+        self.route_middleware: dict[tuple[str, RouteHandlerType], list[str]] = {}
+        self.routing_cache = RoutingCache(maxsize=app.routing_config.cache_size)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """ASGI callable.
@@ -83,9 +89,10 @@ class ASGIRouter:
         )
         await asgi_app(scope, receive, send)
 
-    @lru_cache(1024)  # noqa: B019
     def handle_routing(self, path: str, method: Method | None) -> tuple[ASGIApp, RouteHandlerType, str, dict[str, Any]]:
-        """Handle routing for a given path / method combo. This method is meant to allow easy caching.
+        """Handle routing for a given path / method combo.
+
+        Routes without path parameters are served from :attr:`routing_cache` after they have been resolved once.
 
         Args:
             path: The path of the request.
@@ -94,14 +101,22 @@ class ASGIRouter:
         Returns:
             A tuple composed of the ASGIApp of the route, the route handler instance, the resolved and normalized path and any parsed path params.
         """
-        return parse_path_to_route(
-            mount_paths_regex=self._mount_paths_regex,
-            mount_routes=self._mount_routes,
+        if (route_match := self.routing_cache.get(path, method)) is not None:
+            return route_match
+
+        route_match = parse_path_to_route(
+            compiled_root_node=self._compiled_root_node,
+            mount_trie=self._mount_trie if self._mount_trie.children or self._mount_trie.route_node else None,
             path=path,
             plain_routes=self._plain_routes,
             root_node=self.root_route_map_node,
             method=method,
         )
+        if route_match[3]:
+            self.routing_cache.bypass()
+        else:
+            self.routing_cache.set(path, method, route_match)
+        return route_match
 
     def _store_handler_to_route_mapping(self, route: BaseRoute) -> None:
         """Store the mapping of route handlers to routes and to route handler names.
@@ -122,26 +137,53 @@ class ASGIRouter:
             self.route_mapping[identifier].append(route)
             self.route_handler_index[identifier] = handler
 
-    def construct_routing_trie(self) -> None:
+    def construct_routing_trie(self, routes: Iterable[HTTPRoute | WebSocketRoute | ASGIRoute] | None = None) -> None:
         """Create a map of the app's routes.
 
-        This map is used in the asgi router to route requests.
+        This map is used in the asgi router to route requests. Routes are added to the map incrementally: only the
+        nodes of the newly added routes are validated, and only the cached routes they may shadow are invalidated.
+
+        Args:
+            routes: The routes that have been added to the app. If not given, all routes of the app that have not been
+                added to the map yet are added.
+
+        Returns:
+            None
         """
-        new_routes = [route for route in self.app.routes if route not in self._registered_routes]
-        for route in new_routes:
+        for route in self.app.routes if routes is None else routes:
+            if route in self._registered_routes:
+                continue
+
             add_route_to_trie(
                 app=self.app,
-                mount_routes=self._mount_routes,
+                mount_trie=self._mount_trie,
                 plain_routes=self._plain_routes,
                 root_node=self.root_route_map_node,
                 route=route,
             )
             self._store_handler_to_route_mapping(route)
             self._registered_routes.add(route)
+            self._invalidate_cached_routes(route)
+
+            if self._compiled_root_node is not None:
+                add_route_to_compiled_trie(self._compiled_root_node, route)
+
+    def _invalidate_cached_routes(self, route: HTTPRoute | WebSocketRoute | ASGIRoute) -> None:
+        """Remove the cached routes a newly added route may take precedence over.
+
+        Args:
+            route: The route that has been added.
 
-        validate_node(node=self.root_route_map_node)
-        if self._mount_routes:
-            self._mount_paths_regex = re.compile("|".join(sorted(set(self._mount_routes))))  # pyright: ignore
+        Returns:
+            None
+        """
+        if (route_handler := getattr(route, "route_handler", None)) and getattr(route_handler, "is_mount", False):
+            self.routing_cache.invalidate(route.path, include_subpaths=True)
+        elif route.path_parameters:
+            static_components = takewhile(lambda component: isinstance(component, str), route.path_components)
+            self.routing_cache.invalidate(f"/{'/'.join(static_components)}", include_subpaths=True)  # type: ignore[arg-type]
+        else:
+            self.routing_cache.invalidate(route.path)
 
     async def lifespan(self, receive: LifeSpanReceive, send: LifeSpanSend) -> None:
         """Handle the ASGI "lifespan" event on application startup and shutdown.
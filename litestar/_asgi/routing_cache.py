@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple, Tuple
+
+__all__ = ("RoutingCache", "RoutingCacheInfo")
+
+
+if TYPE_CHECKING:
+    from litestar.types import ASGIApp, Method, RouteHandlerType
+
+RouteMatch = Tuple["ASGIApp", "RouteHandlerType", str, "dict[str, Any]"]
+
+
+class RoutingCacheInfo(NamedTuple):
+    """Statistics of the routing cache."""
+
+    hits: int
+    """Number of lookups served from the cache."""
+    misses: int
+    """Number of lookups of cacheable routes that had to be resolved by the routing trie."""
+    bypasses: int
+    """Number of lookups of routes with path parameters, which are never cached."""
+    evictions: int
+    """Number of entries evicted from the cache because it was full."""
+    currsize: int
+    """Number of entries currently in the cache."""
+    maxsize: int
+    """Maximum number of entries in the cache."""
+
+
+class RoutingCache:
+    """A least recently used cache for resolved routes.
+
+    Only routes without path parameters, i.e. plain and mount routes, are cached by their exact path. Routes with path
+    parameters are resolved through the trie, where their handlers are already stored on the matched node, so that
+    unique parameter values do not churn the cache and evict frequently requested static routes.
+    """
+
+    __slots__ = ("_entries", "bypasses", "evictions", "hits", "maxsize", "misses")
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize ``RoutingCache``.
+
+        Args:
+            maxsize: The maximum number of entries to store. A value of ``0`` disables caching.
+        """
+        self._entries: OrderedDict[tuple[str, Method | None], RouteMatch] = OrderedDict()
+        self.bypasses = 0
+        self.evictions = 0
+        self.hits = 0
+        self.maxsize = maxsize
+        self.misses = 0
+
+    def get(self, path: str, method: Method | None) -> RouteMatch | None:
+        """Retrieve a cached route match.
+
+        Lookups that are not found are counted by :meth:`set` or :meth:`bypass` once they have been resolved, since
+        only then it is known whether the route can be cached.
+
+        Args:
+            path: The normalized path of the request.
+            method: The scope's method, if any.
+
+        Returns:
+            The cached route match or ``None``.
+        """
+        key = (path, method)
+        try:
+            route_match = self._entries[key]
+        except KeyError:
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return route_match
+
+    def set(self, path: str, method: Method | None, route_match: RouteMatch) -> None:
+        """Store the route match of a lookup that missed the cache, evicting the least recently used entry if the cache
+        is full.
+
+        Args:
+            path: The normalized path of the request.
+            method: The scope's method, if any.
+            route_match: The resolved route.
+
+        Returns:
+            None
+        """
+        self.misses += 1
+        if not self.maxsize:
+            return
+
+        self._entries[(path, method)] = route_match
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def bypass(self) -> None:
+        """Count the lookup of a route that cannot be cached, because it has path parameters.
+
+        Returns:
+            None
+        """
+        self.bypasses += 1
+
+    def invalidate(self, path: str, include_subpaths: bool = False) -> None:
+        """Remove the entries of a path from the cache, e.g. because a route has been added for it.
+
+        Args:
+            path: The normalized path to remove the entries of.
+            include_subpaths: If ``True``, also remove the entries of all paths below ``path``.
+
+        Returns:
+            None
+        """
+        if include_subpaths and path == "/":
+            self._entries.clear()
+            return
+
+        prefix = f"{path}/"
+        for key in [key for key in self._entries if key[0] == path or (include_subpaths and key[0].startswith(prefix))]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache. Statistics are preserved.
+
+        Returns:
+            None
+        """
+        self._entries.clear()
+
+    def info(self) -> RoutingCacheInfo:
+        """Get the statistics of the cache.
+
+        Returns:
+            A :class:`RoutingCacheInfo` instance.
+        """
+        return RoutingCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            bypasses=self.bypasses,
+            evictions=self.evictions,
+            currsize=len(self._entries),
+            maxsize=self.maxsize,
+        )
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from litestar._asgi.routing_trie.types import CompiledRouteTrieNode, PathParameterSentinel
+from litestar.types.internal_types import PathParameterDefinition
+
+__all__ = ("add_route_to_compiled_trie", "compile_route_trie")
+
+
+if TYPE_CHECKING:
+    from litestar._asgi.routing_trie.types import RouteTrieNode
+    from litestar.routes import ASGIRoute, HTTPRoute, WebSocketRoute
+
+
+def compile_route_trie(node: RouteTrieNode) -> CompiledRouteTrieNode:
+    """Compile a route trie into a structure that can be matched with a single lookup per path segment.
+
+    Keys that contain a ``/`` (i.e. the full path keys of plain and mount routes stored on the root node) are not
+    included, since these are resolved before the trie is traversed.
+
+    Args:
+        node: The trie node to compile, usually the root node.
+
+    Returns:
+        A compiled trie node.
+    """
+    return CompiledRouteTrieNode(
+        node=node,
+        param_child=compile_route_trie(node.children[PathParameterSentinel]) if node.is_path_param_node else None,
+        static_children={
+            key: compile_route_trie(child)
+            for key, child in node.children.items()
+            if key is not PathParameterSentinel and "/" not in key  # type: ignore[operator]
+        },
+    )
+
+
+def add_route_to_compiled_trie(
+    compiled_root_node: CompiledRouteTrieNode, route: HTTPRoute | WebSocketRoute | ASGIRoute
+) -> None:
+    """Update a compiled trie after a route has been added to the trie it was compiled from.
+
+    Only the nodes along the path of the route are visited, and only subtrees that have not been compiled yet are
+    compiled. Since compiled nodes reference the nodes of the trie, changes to existing nodes need no update.
+
+    Args:
+        compiled_root_node: The compiled root node.
+        route: The route that has been added to the trie.
+
+    Returns:
+        None
+    """
+    compiled_node = compiled_root_node
+    for component in route.path_components:
+        if isinstance(component, PathParameterDefinition):
+            if compiled_node.param_child is None:
+                compiled_node.param_child = compile_route_trie(compiled_node.node.children[PathParameterSentinel])
+            compiled_node = compiled_node.param_child
+        elif (compiled_child := compiled_node.static_children.get(component)) is not None:
+            compiled_node = compiled_child
+        elif (child := compiled_node.node.children.get(component)) is not None:
+            compiled_node.static_children[component] = compiled_child = compile_route_trie(child)
+            compiled_node = compiled_child
+        else:
+            # plain routes and mounts sharing the path of a plain route are only stored by their full path
+            return
@@ -6,16 +6,19 @@ from typing import TYPE_CHECKING, Any, cast
 from litestar._asgi.routing_trie.types import (
     ASGIHandlerTuple,
     PathParameterSentinel,
+    create_mount_trie_node,
     create_node,
 )
+from litestar._asgi.routing_trie.validate import validate_added_node
 from litestar._asgi.utils import wrap_in_exception_handler
+from litestar.enums import ScopeType
 from litestar.types.internal_types import PathParameterDefinition
 
 __all__ = ("add_mount_route", "add_route_to_trie", "build_route_middleware_stack", "configure_node")
 
 
 if TYPE_CHECKING:
-    from litestar._asgi.routing_trie.types import RouteTrieNode
+    from litestar._asgi.routing_trie.types import MountTrieNode, RouteTrieNode
     from litestar.app import Litestar
     from litestar.routes import ASGIRoute, HTTPRoute, WebSocketRoute
     from litestar.types import ASGIApp, RouteHandlerType
@@ -23,7 +26,7 @@ if TYPE_CHECKING:
 
 def add_mount_route(
     current_node: RouteTrieNode,
-    mount_routes: dict[str, RouteTrieNode],
+    mount_trie: MountTrieNode,
     root_node: RouteTrieNode,
     route: ASGIRoute,
 ) -> RouteTrieNode:
@@ -31,7 +34,7 @@ def add_mount_route(
 
     Args:
         current_node: The current trie node that is being mapped.
-        mount_routes: A dictionary mapping static routes to trie nodes.
+        mount_trie: The root node of the trie indexing mount routes by their path segments.
         root_node: The root trie node.
         route: The route that is being added.
 
@@ -46,22 +49,28 @@ def add_mount_route(
         for component in route.path_components:
             if component not in current_node.children:
                 current_node.children[component] = create_node()  # type: ignore[index]
+                current_node.child_keys.add(component)  # type: ignore[arg-type]
             current_node = current_node.children[component]  # type: ignore[index]
 
     current_node.is_mount = True
     current_node.is_static = route.route_handler.is_static
 
     if route.path != "/":
-        mount_routes[route.path] = root_node.children[route.path] = current_node
-    else:
-        mount_routes[route.path] = current_node
+        root_node.children[route.path] = current_node
+
+    mount_trie_node = mount_trie
+    for component in route.path.split("/"):
+        if component:
+            mount_trie_node = mount_trie_node.children.setdefault(component, create_mount_trie_node())
+    mount_trie_node.mount_path = route.path
+    mount_trie_node.route_node = current_node
 
     return current_node
 
 
 def add_route_to_trie(
     app: Litestar,
-    mount_routes: dict[str, RouteTrieNode],
+    mount_trie: MountTrieNode,
     plain_routes: set[str],
     root_node: RouteTrieNode,
     route: HTTPRoute | WebSocketRoute | ASGIRoute,
@@ -71,26 +80,31 @@ def add_route_to_trie(
     Inserts non-parameter paths ('plain routes') off the tree's root
     node. For paths containing parameters, splits the path on '/' and
     nests each path segment under the previous segment's node (see
-    prefix tree / trie).
+    prefix tree / trie). Only the node the route is added to is validated,
+    so that adding a route does not require traversing the entire trie.
 
     Args:
         app: The Litestar app instance.
-        mount_routes: A dictionary mapping static routes to trie nodes.
+        mount_trie: The root node of the trie indexing mount routes by their path segments.
         plain_routes: A set of routes that do not have path parameters.
         root_node: The root trie node.
         route: The route that is being added.
 
+    Raises:
+        ImproperlyConfiguredException
+
     Returns:
         A RouteTrieNode instance.
     """
     current_node = root_node
+    parent_node: RouteTrieNode | None = None
 
     has_path_parameters = bool(route.path_parameters)
 
     if (route_handler := getattr(route, "route_handler", None)) and getattr(route_handler, "is_mount", False):
         current_node = add_mount_route(
             current_node=current_node,
-            mount_routes=mount_routes,
+            mount_trie=mount_trie,
             root_node=root_node,
             route=cast("ASGIRoute", route),
         )
@@ -99,7 +113,7 @@ def add_route_to_trie(
         plain_routes.add(route.path)
         if route.path not in root_node.children:
             current_node.children[route.path] = create_node()
-        current_node = root_node.children[route.path]
+        parent_node, current_node = root_node, root_node.children[route.path]
 
     else:
         for component in route.path_components:
@@ -112,14 +126,15 @@ def add_route_to_trie(
 
             if next_node_key not in current_node.children:
                 current_node.children[next_node_key] = create_node()
+                current_node.child_keys.add(next_node_key)
 
-            current_node.child_keys = set(current_node.children.keys())
-            current_node = current_node.children[next_node_key]
+            parent_node, current_node = current_node, current_node.children[next_node_key]
 
             if isinstance(component, PathParameterDefinition) and component.type is Path:
                 current_node.is_path_type = True
 
     configure_node(route=route, app=app, node=current_node)
+    validate_added_node(node=current_node, parent=parent_node)
     return current_node
 
 
@@ -175,6 +190,10 @@ def build_route_middleware_stack(
 ) -> ASGIApp:
     """Construct a middleware stack that serves as the point of entry for each route.
 
+    Middlewares that are always bypassed for the route, e.g. because of its scope type, path or ``opt`` keys, are left
+    out of the stack. The names of the middlewares that are included are stored in
+    :attr:`ASGIRouter.route_middleware <litestar._asgi.asgi_router.ASGIRouter.route_middleware>`.
+
     Args:
         app: The Litestar app instance.
         route: The route that is being added.
@@ -184,8 +203,30 @@ def build_route_middleware_stack(
         An ASGIApp that is composed of a "stack" of middlewares.
     """
     from litestar.middleware.allowed_hosts import AllowedHostsMiddleware
+    from litestar.middleware.base import AbstractMiddleware
     from litestar.middleware.compression import CompressionMiddleware
     from litestar.middleware.csrf import CSRFMiddleware
+    from litestar.routes import HTTPRoute, WebSocketRoute
+
+    scope_type: ScopeType | None = None
+    if isinstance(route, HTTPRoute):
+        scope_type = ScopeType.HTTP
+    elif isinstance(route, WebSocketRoute):
+        scope_type = ScopeType.WEBSOCKET
+
+    # for routes without path parameters, 'scope["path"]' is known in advance. mount routes receive the remaining path.
+    path = None if route.path_parameters or getattr(route_handler, "is_mount", False) else route.path
+    applied_middleware: list[str] = []
+
+    def apply_middleware(asgi_app: ASGIApp, middleware: ASGIApp) -> ASGIApp:
+        if (
+            isinstance(middleware, AbstractMiddleware)
+            and middleware.app is asgi_app
+            and middleware.resolve_bypass(scope_type=scope_type, path=path, opt=route_handler.opt)
+        ):
+            return asgi_app
+        applied_middleware.append(getattr(middleware, "__name__", type(middleware).__name__))
+        return middleware
 
     # we wrap the route.handle method in the ExceptionHandlerMiddleware
     asgi_handler = wrap_in_exception_handler(
@@ -193,19 +234,25 @@ def build_route_middleware_stack(
     )
 
     if app.csrf_config:
-        asgi_handler = CSRFMiddleware(app=asgi_handler, config=app.csrf_config)
+        asgi_handler = apply_middleware(asgi_handler, CSRFMiddleware(app=asgi_handler, config=app.csrf_config))
 
     if app.compression_config:
-        asgi_handler = CompressionMiddleware(app=asgi_handler, config=app.compression_config)
+        asgi_handler = apply_middleware(
+            asgi_handler, CompressionMiddleware(app=asgi_handler, config=app.compression_config)
+        )
     if app.allowed_hosts:
-        asgi_handler = AllowedHostsMiddleware(app=asgi_handler, config=app.allowed_hosts)
+        asgi_handler = apply_middleware(
+            asgi_handler, AllowedHostsMiddleware(app=asgi_handler, config=app.allowed_hosts)
+        )
 
     for middleware in route_handler.resolve_middleware():
         if hasattr(middleware, "__iter__"):
             handler, kwargs = cast("tuple[Any, dict[str, Any]]", middleware)
-            asgi_handler = handler(app=asgi_handler, **kwargs)
+            asgi_handler = apply_middleware(asgi_handler, handler(app=asgi_handler, **kwargs))
         else:
-            asgi_handler = middleware(app=asgi_handler)  # type: ignore
+            asgi_handler = apply_middleware(asgi_handler, middleware(app=asgi_handler))  # type: ignore
+
+    app.asgi_router.route_middleware[(route.path, route_handler)] = applied_middleware[::-1]
 
     # we wrap the entire stack again in ExceptionHandlerMiddleware
     return wrap_in_exception_handler(
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
+from contextlib import suppress
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Pattern
+from typing import TYPE_CHECKING, Any, cast
 
 from litestar._asgi.routing_trie.types import PathParameterSentinel
 from litestar.exceptions import MethodNotAllowedException, NotFoundException
 from litestar.utils import normalize_path
 
-__all__ = ("parse_node_handlers", "parse_path_params", "parse_path_to_route", "traverse_route_map")
+__all__ = (
+    "find_mount_route",
+    "parse_node_handlers",
+    "parse_path_params",
+    "parse_path_to_route",
+    "traverse_compiled_route_map",
+    "traverse_route_map",
+)
 
 
 if TYPE_CHECKING:
-    from litestar._asgi.routing_trie.types import ASGIHandlerTuple, RouteTrieNode
+    from litestar._asgi.routing_trie.types import (
+        ASGIHandlerTuple,
+        CompiledRouteTrieNode,
+        MountTrieNode,
+        RouteTrieNode,
+    )
     from litestar.types import ASGIApp, Method, RouteHandlerType
     from litestar.types.internal_types import PathParameterDefinition
 
@@ -60,6 +73,57 @@ def traverse_route_map(
     return current_node, path_params, path
 
 
+def traverse_compiled_route_map(
+    root_node: CompiledRouteTrieNode,
+    path: str,
+) -> tuple[RouteTrieNode, list[str], str]:
+    """Traverses a compiled route trie and retrieves the correct node for the request url.
+
+    This is equivalent to :func:`traverse_route_map`, but performs a single dictionary lookup per path segment and does
+    not build an intermediate list of filtered path components.
+
+    Args:
+        root_node: The compiled root trie node.
+        path: The request's path.
+
+    Raises:
+        NotFoundException: If no correlating node is found.
+
+    Returns:
+        A tuple containing the target RouteMapNode and a list containing all path parameter values.
+    """
+    current_node = root_node
+    path_params: list[str] = []
+    path_components = path.split("/")
+    last_index = len(path_components) - 1
+
+    for i, component in enumerate(path_components):
+        if not component:
+            continue
+
+        if (child_node := current_node.static_children.get(component)) is not None:
+            current_node = child_node
+            continue
+
+        if (child_node := current_node.param_child) is not None:
+            current_node = child_node
+
+            if child_node.node.is_path_type:
+                path_params.append(normalize_path("/".join(path_components[i:])))
+                break
+
+            path_params.append(component)
+            continue
+
+        if i != last_index or not current_node.node.children:
+            raise NotFoundException()
+
+    if not current_node.node.asgi_handlers:
+        raise NotFoundException()
+
+    return current_node.node, path_params, path
+
+
 def parse_node_handlers(
     node: RouteTrieNode,
     method: Method | None,
@@ -106,13 +170,43 @@ def parse_path_params(
     }
 
 
+def find_mount_route(mount_trie: MountTrieNode, path: str) -> MountTrieNode | None:
+    """Find the mount route with the longest path that is a prefix of the given path.
+
+    Paths are compared segment by segment, so a mount route at ``/static`` matches ``/static`` and ``/static/file.css``,
+    but not ``/staticfiles``.
+
+    Args:
+        mount_trie: The root node of the trie indexing mount routes by their path segments.
+        path: The request's path.
+
+    Returns:
+        The mount trie node of the matching mount route, if any.
+    """
+    current_node = mount_trie
+    mount_node = mount_trie if mount_trie.route_node is not None else None
+
+    for component in path.split("/"):
+        if not component:
+            continue
+
+        if (child_node := current_node.children.get(component)) is None:
+            break
+
+        current_node = child_node
+        if current_node.route_node is not None:
+            mount_node = current_node
+
+    return mount_node
+
+
 def parse_path_to_route(
     method: Method | None,
-    mount_paths_regex: Pattern | None,
-    mount_routes: dict[str, RouteTrieNode],
+    mount_trie: MountTrieNode | None,
     path: str,
     plain_routes: set[str],
     root_node: RouteTrieNode,
+    compiled_root_node: CompiledRouteTrieNode | None = None,
 ) -> tuple[ASGIApp, RouteHandlerType, str, dict[str, Any]]:
     """Given a scope object, retrieve the asgi_handlers and is_mount boolean values from correct trie node.
 
@@ -121,8 +215,10 @@ def parse_path_to_route(
         root_node: The root trie node.
         path: The path to resolve scope instance.
         plain_routes: The set of plain routes.
-        mount_routes: Mapping of mount routes to trie nodes.
-        mount_paths_regex: A compiled regex to match the mount routes.
+        mount_trie: The root node of the trie indexing mount routes by their path segments, if there are any mount
+            routes.
+        compiled_root_node: The compiled root trie node. If given, it is used to match the path instead of traversing
+            the trie component by component.
 
     Raises:
         MethodNotAllowedException: if no matching method is found.
@@ -137,25 +233,27 @@ def parse_path_to_route(
             asgi_app, handler = parse_node_handlers(node=root_node.children[path], method=method)
             return asgi_app, handler, path, {}
 
-        if mount_paths_regex and (match := mount_paths_regex.search(path)):
-            mount_path = path[match.start() : match.end()]
-            mount_node = mount_routes[mount_path]
-            remaining_path = path[match.end() :]
-            # since we allow regular handlers under static paths, we must validate that the request does not match
+        node: RouteTrieNode | None = None
+        mount_trie_node = find_mount_route(mount_trie=mount_trie, path=path) if mount_trie is not None else None
+
+        if mount_trie_node is not None:
+            mount_node = cast("RouteTrieNode", mount_trie_node.route_node)
+            # since we allow regular handlers under mount paths, we must validate that the request does not match
             # any such handler.
-            if not mount_node.children or all(
-                sub_route not in path for sub_route in mount_node.children  # type: ignore
-            ):
+            if mount_node.children:
+                with suppress(NotFoundException):
+                    node, path_parameters, path = _traverse(root_node, compiled_root_node, path)
+
+            if node is None or node.is_mount:
                 asgi_app, handler = parse_node_handlers(node=mount_node, method=method)
-                remaining_path = remaining_path or "/"
+                mount_path = mount_trie_node.mount_path
+                remaining_path = (path if mount_path == "/" else path[len(mount_path) :]) or "/"
                 if not mount_node.is_static:
                     remaining_path = remaining_path if remaining_path.endswith("/") else f"{remaining_path}/"
                 return asgi_app, handler, remaining_path, {}
 
-        node, path_parameters, path = traverse_route_map(
-            root_node=root_node,
-            path=path,
-        )
+        if node is None:
+            node, path_parameters, path = _traverse(root_node, compiled_root_node, path)
         asgi_app, handler = parse_node_handlers(node=node, method=method)
         key = method or ("asgi" if node.is_asgi else "websocket")
         parsed_path_parameters = parse_path_params(node.path_parameters[key], tuple(path_parameters))
@@ -170,3 +268,11 @@ def parse_path_to_route(
         raise MethodNotAllowedException() from e
     except ValueError as e:
         raise NotFoundException() from e
+
+
+def _traverse(
+    root_node: RouteTrieNode, compiled_root_node: CompiledRouteTrieNode | None, path: str
+) -> tuple[RouteTrieNode, list[str], str]:
+    if compiled_root_node is not None:
+        return traverse_compiled_route_map(root_node=compiled_root_node, path=path)
+    return traverse_route_map(root_node=root_node, path=path)
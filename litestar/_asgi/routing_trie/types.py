@@ -3,7 +3,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal, NamedTuple
 
-__all__ = ("ASGIHandlerTuple", "PathParameterSentinel", "RouteTrieNode", "create_node")
+__all__ = (
+    "ASGIHandlerTuple",
+    "CompiledRouteTrieNode",
+    "MountTrieNode",
+    "PathParameterSentinel",
+    "RouteTrieNode",
+    "create_mount_trie_node",
+    "create_node",
+)
 
 
 if TYPE_CHECKING:
@@ -44,7 +52,8 @@ class RouteTrieNode:
     """A mapping of ASGI handlers stored on the node."""
     child_keys: set[str | type[PathParameterSentinel]]
     """
-    A set containing the child keys, same as the children dictionary - but as a set, which offers faster lookup.
+    A set containing the path component keys of the children dictionary, i.e. excluding the full path keys of plain and
+    mount routes stored on the root node - but as a set, which offers faster lookup.
     """
     children: dict[str | type[PathParameterSentinel], RouteTrieNode]
     """A dictionary mapping path components or using the PathParameterSentinel class to child nodes."""
@@ -83,3 +92,45 @@ def create_node() -> RouteTrieNode:
         is_path_type=False,
         path_parameters={},
     )
+
+
+@dataclass
+class CompiledRouteTrieNode:
+    """A flattened, read-only view of a :class:`RouteTrieNode` used for matching paths."""
+
+    __slots__ = ("node", "param_child", "static_children")
+
+    node: RouteTrieNode
+    """The trie node this compiled node resolves to."""
+    param_child: CompiledRouteTrieNode | None
+    """The compiled node reached by consuming a path parameter segment, if any."""
+    static_children: dict[str, CompiledRouteTrieNode]
+    """A mapping of static path segments to compiled child nodes.
+
+    Unlike :attr:`RouteTrieNode.children`, this does not contain the path parameter sentinel or the full path keys of
+    plain and mount routes, so a single lookup decides whether a segment matches statically.
+    """
+
+
+@dataclass
+class MountTrieNode:
+    """A trie node indexing mount routes by their path segments."""
+
+    __slots__ = ("children", "mount_path", "route_node")
+
+    children: dict[str, MountTrieNode]
+    """A dictionary mapping path segments to child nodes."""
+    mount_path: str
+    """The path of the mount route ending at this node, or an empty string if there is none."""
+    route_node: RouteTrieNode | None
+    """The routing trie node of the mount route ending at this node, if any."""
+
+
+def create_mount_trie_node() -> MountTrieNode:
+    """Create a MountTrieNode instance.
+
+    Returns:
+        A mount trie node instance.
+    """
+
+    return MountTrieNode(children={}, mount_path="", route_node=None)
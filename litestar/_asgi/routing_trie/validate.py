@@ -5,13 +5,26 @@ from typing import TYPE_CHECKING
 
 from litestar.exceptions import ImproperlyConfiguredException
 
-__all__ = ("validate_node",)
+__all__ = ("validate_added_node", "validate_node")
 
 
 if TYPE_CHECKING:
     from litestar._asgi.routing_trie.types import RouteTrieNode
 
 
+def _has_path_parameters(node: RouteTrieNode) -> bool:
+    return any(
+        chain.from_iterable(
+            list(node.path_parameters.values()) if isinstance(node.path_parameters, dict) else node.path_parameters
+        )
+    )
+
+
+def _validate_asgi_handlers(node: RouteTrieNode) -> None:
+    if node.is_asgi and bool(set(node.asgi_handlers).difference({"asgi"})):
+        raise ImproperlyConfiguredException("ASGI handlers must have a unique path not shared by other route handlers.")
+
+
 def validate_node(node: RouteTrieNode) -> None:
     """Recursively traverses the trie from the given node upwards.
 
@@ -24,22 +37,34 @@ def validate_node(node: RouteTrieNode) -> None:
     Returns:
         None
     """
-    if node.is_asgi and bool(set(node.asgi_handlers).difference({"asgi"})):
-        raise ImproperlyConfiguredException("ASGI handlers must have a unique path not shared by other route handlers.")
+    _validate_asgi_handlers(node)
 
-    if (
-        node.is_mount
-        and node.children
-        and any(
-            chain.from_iterable(
-                list(child.path_parameters.values())
-                if isinstance(child.path_parameters, dict)
-                else child.path_parameters
-                for child in node.children.values()
-            )
-        )
-    ):
+    if node.is_mount and any(_has_path_parameters(child) for child in node.children.values()):
         raise ImproperlyConfiguredException("Path parameters are not allowed under a static or mount route.")
 
     for child in node.children.values():
         validate_node(node=child)
+
+
+def validate_added_node(node: RouteTrieNode, parent: RouteTrieNode | None) -> None:
+    """Validate a node a route has just been added to, without traversing the rest of the trie.
+
+    Adding a route only configures the node it is added to, so the node itself and its relation to its parent are the
+    only parts of the trie that can become invalid.
+
+    Args:
+        node: The trie node the route was added to.
+        parent: The parent of the node, if any.
+
+    Raises:
+        ImproperlyConfiguredException
+
+    Returns:
+        None
+    """
+    _validate_asgi_handlers(node)
+
+    if (node.is_mount and any(_has_path_parameters(child) for child in node.children.values())) or (
+        parent is not None and parent.is_mount and _has_path_parameters(node)
+    ):
+        raise ImproperlyConfiguredException("Path parameters are not allowed under a static or mount route.")
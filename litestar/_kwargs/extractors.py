@@ -4,9 +4,12 @@ from collections import defaultdict
 from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, Coroutine, cast
 
+import msgspec
+
 from litestar._multipart import parse_multipart_form
 from litestar._parsers import (
-    parse_headers,
+    parse_cookie_values,
+    parse_header_values,
     parse_query_string,
     parse_url_encoded_form_data,
 )
@@ -15,6 +18,7 @@ from litestar.dto.interface import ConnectionContext
 from litestar.enums import ParamType, RequestEncodingType
 from litestar.exceptions import ValidationException
 from litestar.params import BodyKwarg
+from litestar.serialization import dec_hook
 from litestar.types import Empty
 
 if TYPE_CHECKING:
@@ -32,10 +36,12 @@ __all__ = (
     "create_data_extractor",
     "create_multipart_extractor",
     "create_query_default_dict",
+    "create_typed_data_extractor",
     "create_url_encoded_data_extractor",
     "headers_extractor",
     "json_extractor",
     "msgpack_extractor",
+    "parse_connection_cookies",
     "parse_connection_headers",
     "parse_connection_query_params",
     "query_extractor",
@@ -46,6 +52,9 @@ __all__ = (
 )
 
 
+_COOKIE_HEADER_KEY = frozenset((b"cookie",))
+
+
 def create_connection_value_extractor(
     kwargs_model: KwargsModel,
     connection_key: str,
@@ -132,20 +141,46 @@ def parse_connection_query_params(connection: ASGIConnection, kwargs_model: Kwar
     )
 
 
-def parse_connection_headers(connection: ASGIConnection, _: KwargsModel) -> dict[str, Any]:
-    """Parse header parameters and cache the result in scope.
+def parse_connection_headers(connection: ASGIConnection, kwargs_model: KwargsModel) -> dict[str, Any]:
+    """Parse header parameters.
+
+    If the connection's headers have not been parsed yet, only the headers expected by the ``KwargsModel`` are decoded,
+    without caching the result in scope, so that accessing :attr:`ASGIConnection.headers` still parses all of them.
 
     Args:
         connection: The ASGI connection instance.
-        _: The KwargsModel instance.
+        kwargs_model: The KwargsModel instance.
 
     Returns:
         A dictionary of parsed values
     """
-    parsed_headers = connection.scope["_headers"] = (  # type: ignore
-        connection._headers if connection._headers is not Empty else parse_headers(tuple(connection.scope["headers"]))
-    )
-    return cast("dict[str, Any]", parsed_headers)
+    if connection._headers is not Empty:
+        return cast("dict[str, Any]", connection._headers)
+    return parse_header_values(connection.scope.get("headers", ()), kwargs_model.expected_header_keys)
+
+
+def parse_connection_cookies(connection: ASGIConnection, kwargs_model: KwargsModel) -> dict[str, Any]:
+    """Parse cookie parameters.
+
+    If the connection's cookies have not been parsed yet, only the cookies expected by the ``KwargsModel`` are parsed,
+    without caching the result in scope, so that accessing :attr:`ASGIConnection.cookies` still parses all of them.
+
+    Args:
+        connection: The ASGI connection instance.
+        kwargs_model: The KwargsModel instance.
+
+    Returns:
+        A dictionary of parsed values
+    """
+    if connection._cookies is not Empty:
+        return cast("dict[str, Any]", connection._cookies)
+
+    if connection._headers is not Empty:
+        cookie_string = connection._headers.get("cookie")
+    else:
+        cookie_string = parse_header_values(connection.scope.get("headers", ()), _COOKIE_HEADER_KEY).get("cookie")
+
+    return parse_cookie_values(cookie_string, kwargs_model.expected_cookie_names) if cookie_string else {}
 
 
 def state_extractor(values: dict[str, Any], connection: ASGIConnection) -> None:
@@ -288,6 +323,49 @@ async def msgpack_extractor(connection: Request[Any, Any, Any]) -> Any:
     return await connection.msgpack()
 
 
+def create_typed_data_extractor(
+    data_type: Any, media_type: RequestEncodingType | str
+) -> Callable[[ASGIConnection[Any, Any, Any, Any]], Coroutine[Any, Any, Any]] | None:
+    """Create an extractor that decodes a JSON or MessagePack request body directly into the type of the ``data`` kwarg.
+
+    The decoder is created once per handler. If a body cannot be decoded into the type as is, e.g. because its values
+    require lax conversion or do not validate, the extractor falls back to the builtins of :func:`json_extractor` or
+    :func:`msgpack_extractor`, leaving conversion and validation errors to the signature model.
+
+    Args:
+        data_type: The annotation of the ``data`` kwarg in the signature model.
+        media_type: The encoding of the request body.
+
+    Returns:
+        An extractor function, or ``None`` if ``msgspec`` cannot decode into the type.
+    """
+    decoder: msgspec.json.Decoder | msgspec.msgpack.Decoder
+    try:
+        if media_type == RequestEncodingType.MESSAGEPACK:
+            decoder, empty_body, fallback_extractor = (
+                msgspec.msgpack.Decoder(type=data_type, dec_hook=dec_hook),
+                b"\xc0",
+                msgpack_extractor,
+            )
+        else:
+            decoder, empty_body, fallback_extractor = (
+                msgspec.json.Decoder(type=data_type, dec_hook=dec_hook),
+                b"null",
+                json_extractor,
+            )
+    except TypeError:
+        return None
+
+    async def typed_data_extractor(connection: Request[Any, Any, Any]) -> Any:
+        body = await connection.body()
+        try:
+            return decoder.decode(body or empty_body)
+        except (msgspec.DecodeError, msgspec.ValidationError):
+            return await fallback_extractor(connection)
+
+    return typed_data_extractor  # type:ignore[return-value]
+
+
 def create_multipart_extractor(
     field_definition: FieldDefinition, is_data_optional: bool, dto_type: type[DTOInterface] | None
 ) -> Callable[[ASGIConnection[Any, Any, Any, Any]], Coroutine[Any, Any, Any]]:
@@ -316,8 +394,8 @@ def create_multipart_extractor(
         connection.scope["_form"] = form_values = (  # type: ignore[typeddict-unknown-key]
             connection.scope["_form"]  # type: ignore[typeddict-item]
             if "_form" in connection.scope
-            else parse_multipart_form(
-                body=await connection.body(),
+            else await parse_multipart_form(
+                stream=connection.stream(),
                 boundary=connection.content_type[-1].get("boundary", "").encode(),
                 multipart_form_part_limit=multipart_form_part_limit,
             )
@@ -398,15 +476,18 @@ def create_data_extractor(kwargs_model: KwargsModel) -> Callable[[dict[str, Any]
             data_extractor = create_url_encoded_data_extractor(
                 is_data_optional=kwargs_model.is_data_optional, dto_type=dto_type
             )
-    elif kwargs_model.expected_msgpack_data:
-        data_extractor = cast(
-            "Callable[[ASGIConnection[Any, Any, Any, Any]], Coroutine[Any, Any, Any]]", msgpack_extractor
-        )
     elif kwargs_model.expected_dto_data:
         data_extractor = create_dto_extractor(kwargs_model.expected_dto_data)
     else:
-        data_extractor = cast(
-            "Callable[[ASGIConnection[Any, Any, Any, Any]], Coroutine[Any, Any, Any]]", json_extractor
+        media_type = RequestEncodingType.MESSAGEPACK if kwargs_model.expected_msgpack_data else RequestEncodingType.JSON
+        typed_data_extractor = (
+            create_typed_data_extractor(kwargs_model.expected_data_type, media_type)
+            if kwargs_model.expected_data_type is not None
+            else None
+        )
+        data_extractor = typed_data_extractor or cast(
+            "Callable[[ASGIConnection[Any, Any, Any, Any]], Coroutine[Any, Any, Any]]",
+            msgpack_extractor if kwargs_model.expected_msgpack_data else json_extractor,
         )
 
     def extractor(
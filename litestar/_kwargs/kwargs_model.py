@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Callable
 from anyio import create_task_group
 
 from litestar._kwargs.cleanup import DependencyCleanupGroup
+from litestar._kwargs.compiled_extractor import create_compiled_extractor
 from litestar._kwargs.dependencies import (
     Dependency,
     create_dependency_batches,
@@ -16,6 +17,7 @@ from litestar._kwargs.extractors import (
     create_connection_value_extractor,
     create_data_extractor,
     headers_extractor,
+    parse_connection_cookies,
     parse_connection_headers,
     parse_connection_query_params,
     query_extractor,
@@ -53,11 +55,15 @@ class KwargsModel:
     """
 
     __slots__ = (
+        "compiled_extractor",
         "dependency_batches",
+        "expected_cookie_names",
         "expected_cookie_params",
+        "expected_data_type",
         "expected_dto_data",
         "expected_form_data",
         "expected_msgpack_data",
+        "expected_header_keys",
         "expected_header_params",
         "expected_path_params",
         "expected_query_params",
@@ -72,6 +78,7 @@ class KwargsModel:
         self,
         *,
         expected_cookie_params: set[ParameterDefinition],
+        expected_data_type: Any,
         expected_dto_data: type[DTOInterface] | None,
         expected_dependencies: set[Dependency],
         expected_form_data: tuple[RequestEncodingType | str, FieldDefinition, type[DTOInterface] | None] | None,
@@ -82,11 +89,13 @@ class KwargsModel:
         expected_reserved_kwargs: set[str],
         sequence_query_parameter_names: set[str],
         is_data_optional: bool,
+        compile_extractors: bool = False,
     ) -> None:
         """Initialize ``KwargsModel``.
 
         Args:
             expected_cookie_params: Any expected cookie parameter kwargs
+            expected_data_type: The type into which a JSON or MessagePack request body is decoded directly, if any
             expected_dependencies: Any expected dependency kwargs
             expected_dto_data: Any expected DTO data kwargs
             expected_form_data: Any expected form data kwargs
@@ -97,8 +106,11 @@ class KwargsModel:
             expected_reserved_kwargs: Any expected reserved kwargs, e.g. 'state'
             sequence_query_parameter_names: Any query parameters that are sequences
             is_data_optional: Treat data as optional
+            compile_extractors: Generate a function specialized for the expected kwargs, used by :meth:`to_kwargs`
+                instead of the generic extractors
         """
         self.expected_cookie_params = expected_cookie_params
+        self.expected_data_type = expected_data_type
         self.expected_dto_data = expected_dto_data
         self.expected_form_data = expected_form_data
         self.expected_msgpack_data = expected_msgpack_data
@@ -107,6 +119,8 @@ class KwargsModel:
         self.expected_query_params = expected_query_params
         self.expected_reserved_kwargs = expected_reserved_kwargs
         self.sequence_query_parameter_names = tuple(sequence_query_parameter_names)
+        self.expected_cookie_names = frozenset(p.field_alias for p in expected_cookie_params)
+        self.expected_header_keys = frozenset(p.field_alias.lower().encode() for p in expected_header_params)
 
         self.has_kwargs = (
             expected_cookie_params
@@ -123,6 +137,9 @@ class KwargsModel:
         self.is_data_optional = is_data_optional
         self.extractors = self._create_extractors()
         self.dependency_batches = create_dependency_batches(expected_dependencies)
+        self.compiled_extractor: Callable[[ASGIConnection], dict[str, Any]] | None = (
+            create_compiled_extractor(self) if compile_extractors else None
+        )
 
     def _create_extractors(self) -> list[Callable[[dict[str, Any], ASGIConnection], None]]:
         reserved_kwargs_extractors: dict[str, Callable[[dict[str, Any], ASGIConnection], None]] = {
@@ -166,6 +183,7 @@ class KwargsModel:
                     connection_key="cookies",
                     expected_params=self.expected_cookie_params,
                     kwargs_model=self,
+                    parser=parse_connection_cookies,
                 ),
             )
 
@@ -260,6 +278,7 @@ class KwargsModel:
         path_parameters: set[str],
         layered_parameters: dict[str, FieldDefinition],
         data_dto: type[DTOInterface] | None,
+        compile_extractors: bool = False,
     ) -> KwargsModel:
         """Pre-determine what parameters are required for a given combination of route + route handler. It is executed
         during the application bootstrap process.
@@ -272,6 +291,7 @@ class KwargsModel:
             layered_parameters: A string keyed dictionary of layered parameters.
             data_dto: A :class:`DTOInterface <litestar._dto.DTOInterface>` subclass if one is declared
                 for the route handler, or ``None``.
+            compile_extractors: Generate a function specialized for the expected kwargs of the route handler.
 
         Returns:
             An instance of KwargsModel
@@ -303,6 +323,7 @@ class KwargsModel:
         expected_form_data: tuple[RequestEncodingType | str, FieldDefinition, type[DTOInterface] | None] | None = None
         expected_msgpack_data: FieldDefinition | None = None
         expected_dto_data: type[DTOInterface] | None = None
+        expected_data_type: Any = None
 
         data_field_definition = field_definitions.get("data")
 
@@ -318,6 +339,9 @@ class KwargsModel:
             elif media_type == RequestEncodingType.MESSAGEPACK:
                 expected_msgpack_data = data_field_definition
 
+            if not (expected_form_data or expected_dto_data):
+                expected_data_type = signature_model.__annotations__["data"]
+
         for dependency in expected_dependencies:
             dependency_kwargs_model = cls.create_for_signature_model(
                 signature_model=get_signature_model(dependency.provide),
@@ -341,6 +365,8 @@ class KwargsModel:
             )
 
             if "data" in expected_reserved_kwargs and "data" in dependency_kwargs_model.expected_reserved_kwargs:
+                # the dependency receives the same value for 'data', which it may expect to be of another type
+                expected_data_type = None
                 cls._validate_dependency_data(
                     expected_form_data=expected_form_data,
                     dependency_kwargs_model=dependency_kwargs_model,
@@ -351,6 +377,7 @@ class KwargsModel:
 
         return KwargsModel(
             expected_cookie_params=expected_cookie_parameters,
+            expected_data_type=None if expected_data_type is Any else expected_data_type,
             expected_dependencies=expected_dependencies,
             expected_dto_data=expected_dto_data,
             expected_form_data=expected_form_data,
@@ -361,6 +388,7 @@ class KwargsModel:
             expected_reserved_kwargs=expected_reserved_kwargs,
             is_data_optional=field_definitions["data"].is_optional if "data" in expected_reserved_kwargs else False,
             sequence_query_parameter_names=sequence_query_parameter_names,
+            compile_extractors=compile_extractors,
         )
 
     def to_kwargs(self, connection: ASGIConnection) -> dict[str, Any]:
@@ -374,6 +402,9 @@ class KwargsModel:
         Returns:
             A string keyed dictionary of kwargs expected by the handler function and its dependencies.
         """
+        if self.compiled_extractor is not None:
+            return self.compiled_extractor(connection)
+
         output: dict[str, Any] = {}
 
         for extractor in self.extractors:
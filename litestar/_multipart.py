@@ -22,19 +22,33 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
+
 from __future__ import annotations
 
 import re
 from collections import defaultdict
 from email.utils import decode_rfc2231
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote
 
+from anyio import CancelScope
+
+from litestar.constants import ONE_MEGABYTE
 from litestar.datastructures.upload_file import UploadFile
 from litestar.exceptions import SerializationException, ValidationException
 from litestar.serialization import decode_json
 
-__all__ = ("parse_body", "parse_content_header", "parse_multipart_form")
+if TYPE_CHECKING:
+    from typing import AsyncIterator, Generator
+
+__all__ = (
+    "PART_DATA",
+    "PART_END",
+    "PART_START",
+    "MultipartParser",
+    "parse_content_header",
+    "parse_multipart_form",
+)
 
 
 _token = r"([\w!#$%&'*+\-.^_`|~]+)"  # noqa: S105
@@ -42,6 +56,13 @@ _quoted = r'"([^"]*)"'
 _param = re.compile(rf";\s*{_token}=(?:{_token}|{_quoted})", re.ASCII)
 _firefox_quote_escape = re.compile(r'\\"(?!; |\s*$)')
 
+# states of the multipart parser and the events it emits
+_PREAMBLE, _DELIMITER, _HEADERS, _PART_DATA, _EPILOGUE = range(5)
+PART_START, PART_DATA, PART_END = range(3)
+_MAX_HEADERS_SIZE = 64 * 1024
+_MAX_PADDING_SIZE = 1024
+_MAX_FIELD_SIZE = ONE_MEGABYTE
+
 
 def parse_content_header(value: str) -> tuple[str, dict[str, str]]:
     """Parse content-type and content-disposition header values.
@@ -64,37 +85,235 @@ def parse_content_header(value: str) -> tuple[str, dict[str, str]]:
     return value.strip().lower(), options
 
 
-def parse_body(body: bytes, boundary: bytes, multipart_form_part_limit: int) -> list[bytes]:
-    """Split the body using the boundary
-        and validate the number of form parts is within the allowed limit.
+def _parse_part_headers(raw_headers: bytes) -> tuple[str | None, str | None, str, str, dict[str, str]]:
+    """Parse the headers of a form part.
 
     Args:
-        body: The form body.
-        boundary: The boundary used to separate form components.
-        multipart_form_part_limit: The limit of allowed form components
+        raw_headers: The raw header block of the part, without its trailing empty line.
 
     Returns:
-        A list of form components.
+        A tuple containing the field name, the file name, the content type, the charset and the headers of the part.
     """
-    if not (body and boundary):
-        return []
+    field_name = file_name = None
+    content_type = "text/plain"
+    content_charset = "utf-8"
+    headers: dict[str, str] = {}
 
-    form_parts = body.split(boundary, multipart_form_part_limit + 3)[1:-1]
+    for form_line in raw_headers.decode("utf-8").split("\r\n"):
+        form_header_field, colon, form_header_line = form_line.partition(":")
+        if not colon:
+            continue
 
-    if len(form_parts) > multipart_form_part_limit:
-        raise ValidationException(
-            f"number of multipart components exceeds the allowed limit of {multipart_form_part_limit}, "
-            f"this potentially indicates a DoS attack"
-        )
+        form_header_field = form_header_field.strip().lower()
+        form_header_value, form_parameters = parse_content_header(form_header_line)
+
+        if form_header_field == "content-disposition":
+            field_name = form_parameters.get("name")
+            file_name = form_parameters.get("filename")
+
+            if file_name is None and (filename_with_asterisk := form_parameters.get("filename*")):
+                encoding, _, value = decode_rfc2231(filename_with_asterisk)
+                file_name = unquote(value, encoding=encoding or content_charset)
+
+        elif form_header_field == "content-type":
+            content_type = form_header_value
+            content_charset = form_parameters.get("charset", "utf-8")
+        headers[form_header_field] = form_header_value
 
-    return form_parts
+    return field_name, file_name, content_type, content_charset, headers
 
 
-def parse_multipart_form(body: bytes, boundary: bytes, multipart_form_part_limit: int = 1000) -> dict[str, Any]:
+class MultipartParser:
+    """Incremental parser of a multipart body.
+
+    The parser is fed the body chunk by chunk and emits the headers of each part, the data of the part as it arrives
+    and the end of each part. Only as much of the body is buffered as required to detect a boundary.
+    """
+
+    __slots__ = ("_buffer", "_delimiter", "_state")
+
+    def __init__(self, boundary: bytes) -> None:
+        """Initialize ``MultipartParser``.
+
+        Args:
+            boundary: Boundary of the multipart message.
+        """
+        self._delimiter = b"\r\n--" + boundary
+        # a CRLF is prepended, so that the first boundary can be matched with the same delimiter as all others
+        self._buffer = bytearray(b"\r\n")
+        self._state = _PREAMBLE
+
+    def feed(self, chunk: bytes) -> Generator[tuple[int, bytes], None, None]:
+        """Feed a chunk of the body to the parser.
+
+        Args:
+            chunk: A chunk of the body.
+
+        Returns:
+            A generator of events, each a tuple of ``PART_START`` and the raw headers of a part, ``PART_DATA`` and a
+            chunk of the part's data or ``PART_END`` and an empty byte string.
+        """
+        self._buffer += chunk
+
+        # each state consumes as much of the buffer as it can, and returns whether the next state can proceed
+        while True:
+            if self._state == _PART_DATA:
+                proceed = yield from self._feed_part_data()
+            elif self._state == _HEADERS:
+                proceed = yield from self._feed_headers()
+            elif self._state == _DELIMITER:
+                proceed = self._feed_delimiter()
+            elif self._state == _PREAMBLE:
+                proceed = self._feed_preamble()
+            else:
+                self._buffer.clear()
+                return
+            if not proceed:
+                return
+
+    def _feed_part_data(self) -> Generator[tuple[int, bytes], None, bool]:
+        buffer, delimiter = self._buffer, self._delimiter
+        index = buffer.find(delimiter)
+        if index == -1:
+            # hold back as much of the data as could be the start of a delimiter
+            if (emit := len(buffer) - len(delimiter) + 1) > 0:
+                yield PART_DATA, bytes(buffer[:emit])
+                del buffer[:emit]
+            return False
+        if index:
+            yield PART_DATA, bytes(buffer[:index])
+        yield PART_END, b""
+        del buffer[: index + len(delimiter)]
+        self._state = _DELIMITER
+        return True
+
+    def _feed_headers(self) -> Generator[tuple[int, bytes], None, bool]:
+        buffer = self._buffer
+        if buffer.startswith(b"\r\n"):
+            index, raw_headers = -2, b""
+        elif (index := buffer.find(b"\r\n\r\n")) != -1:
+            raw_headers = bytes(buffer[:index])
+        elif len(buffer) > _MAX_HEADERS_SIZE:
+            raise ValidationException("multipart part headers exceed the allowed size")
+        else:
+            return False
+        yield PART_START, raw_headers
+        del buffer[: index + 4]
+        self._state = _PART_DATA
+        return True
+
+    def _feed_delimiter(self) -> bool:
+        buffer = self._buffer
+        if len(buffer) < 2:
+            return False
+        if buffer.startswith(b"--"):
+            self._state = _EPILOGUE
+            return True
+        # skip the transport padding following a boundary
+        if (index := buffer.find(b"\r\n")) == -1:
+            if len(buffer) > _MAX_PADDING_SIZE:
+                raise ValidationException("multipart boundary padding exceeds the allowed size")
+            return False
+        del buffer[: index + 2]
+        self._state = _HEADERS
+        return True
+
+    def _feed_preamble(self) -> bool:
+        buffer, delimiter = self._buffer, self._delimiter
+        index = buffer.find(delimiter)
+        if index == -1:
+            del buffer[: max(len(buffer) - len(delimiter) + 1, 0)]
+            return False
+        del buffer[: index + len(delimiter)]
+        self._state = _DELIMITER
+        return True
+
+
+class _FormCollector:
+    """Collect the fields of a multipart form from the events of a :class:`MultipartParser`."""
+
+    __slots__ = (
+        "_content_charset",
+        "_field_name",
+        "_part_count",
+        "_post_data",
+        "_upload_file",
+        "fields",
+        "multipart_form_part_limit",
+    )
+
+    def __init__(self, multipart_form_part_limit: int) -> None:
+        self.multipart_form_part_limit = multipart_form_part_limit
+        self.fields: defaultdict[str, list[Any]] = defaultdict(list)
+        self._part_count = 0
+        self._field_name: str | None = None
+        self._content_charset = "utf-8"
+        self._upload_file: UploadFile | None = None
+        self._post_data = bytearray()
+
+    def start_part(self, raw_headers: bytes) -> None:
+        self._part_count += 1
+        if self._part_count > self.multipart_form_part_limit:
+            raise ValidationException(
+                f"number of multipart components exceeds the allowed limit of {self.multipart_form_part_limit}, "
+                f"this potentially indicates a DoS attack"
+            )
+
+        field_name, file_name, content_type, self._content_charset, headers = _parse_part_headers(raw_headers)
+        self._field_name = field_name
+        self._upload_file = (
+            UploadFile(content_type=content_type, filename=file_name, headers=headers)
+            if field_name and file_name
+            else None
+        )
+        self._post_data.clear()
+
+    async def add_data(self, data: bytes) -> None:
+        if self._upload_file:
+            await self._upload_file.write(data)
+        elif self._field_name:
+            # unlike files, the values of other fields are held in memory
+            if len(self._post_data) + len(data) > _MAX_FIELD_SIZE:
+                raise ValidationException("multipart form field exceeds the allowed size")
+            self._post_data += data
+
+    async def end_part(self) -> None:
+        if not self._field_name:
+            return
+        if self._upload_file:
+            await self._upload_file.seek(0)
+            self.fields[self._field_name].append(self._upload_file)
+        else:
+            try:
+                self.fields[self._field_name].append(decode_json(bytes(self._post_data)))
+            except SerializationException:
+                self.fields[self._field_name].append(self._post_data.decode(self._content_charset))
+        self._field_name = self._upload_file = None
+
+    async def close(self) -> None:
+        """Close the files of the form, including the one of a part that has not ended."""
+        for upload in (self._upload_file, *(value for values in self.fields.values() for value in values)):
+            if isinstance(upload, UploadFile):
+                await upload.close()
+
+    async def finish(self) -> dict[str, Any]:
+        if self._upload_file:
+            # the body ended before the part did
+            await self._upload_file.close()
+        return {k: v if len(v) > 1 else v[0] for k, v in self.fields.items()}
+
+
+async def parse_multipart_form(
+    stream: AsyncIterator[bytes], boundary: bytes, multipart_form_part_limit: int = 1000
+) -> dict[str, Any]:
     """Parse multipart form data.
 
+    The body is parsed while it is received. The data of file parts is written to the spooled file of their
+    :class:`UploadFile <litestar.datastructures.UploadFile>` as it arrives, so that the whole body is never held in
+    memory. The values of other fields are limited to 1MB.
+
     Args:
-        body: Body of the request.
+        stream: An async iterator of the chunks of the body of the request.
         boundary: Boundary of the multipart message.
         multipart_form_part_limit: Limit of the number of parts allowed.
 
@@ -102,54 +321,25 @@ def parse_multipart_form(body: bytes, boundary: bytes, multipart_form_part_limit
         A dictionary of parsed results.
     """
 
-    fields: defaultdict[str, list[Any]] = defaultdict(list)
-
-    for form_part in parse_body(body=body, boundary=boundary, multipart_form_part_limit=multipart_form_part_limit):
-        file_name = None
-        content_type = "text/plain"
-        content_charset = "utf-8"
-        field_name = None
-        line_index = 2
-        line_end_index = 0
-        headers: list[tuple[str, str]] = []
-
-        while line_end_index != -1:
-            line_end_index = form_part.find(b"\r\n", line_index)
-            form_line = form_part[line_index:line_end_index].decode("utf-8")
-
-            if not form_line:
-                break
-
-            line_index = line_end_index + 2
-            colon_index = form_line.index(":")
-            current_idx = colon_index + 2
-            form_header_field = form_line[:colon_index].lower()
-            form_header_value, form_parameters = parse_content_header(form_line[current_idx:])
-
-            if form_header_field == "content-disposition":
-                field_name = form_parameters.get("name")
-                file_name = form_parameters.get("filename")
-
-                if file_name is None and (filename_with_asterisk := form_parameters.get("filename*")):
-                    encoding, _, value = decode_rfc2231(filename_with_asterisk)
-                    file_name = unquote(value, encoding=encoding or content_charset)
-
-            elif form_header_field == "content-type":
-                content_type = form_header_value
-                content_charset = form_parameters.get("charset", "utf-8")
-            headers.append((form_header_field, form_header_value))
-
-        if field_name:
-            post_data = form_part[line_index:-4].lstrip(b"\r\n")
-            if file_name:
-                form_file = UploadFile(
-                    content_type=content_type, filename=file_name, file_data=post_data, headers=dict(headers)
-                )
-                fields[field_name].append(form_file)
-            else:
-                try:
-                    fields[field_name].append(decode_json(post_data))
-                except SerializationException:
-                    fields[field_name].append(post_data.decode(content_charset))
-
-    return {k: v if len(v) > 1 else v[0] for k, v in fields.items()}
+    if not boundary:
+        return {}
+
+    parser = MultipartParser(boundary)
+    collector = _FormCollector(multipart_form_part_limit)
+
+    try:
+        async for chunk in stream:
+            for event, value in parser.feed(chunk):
+                if event == PART_DATA:
+                    await collector.add_data(value)
+                elif event == PART_START:
+                    collector.start_part(value)
+                else:
+                    await collector.end_part()
+    except BaseException:
+        # e.g. a malformed body, a body exceeding the size limit or a client disconnecting
+        with CancelScope(shield=True):
+            await collector.close()
+        raise
+
+    return await collector.finish()
@@ -1,17 +1,218 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from collections import OrderedDict
+from functools import wraps
 from http.cookies import _unquote as unquote_cookie
-from typing import Any, Iterable
+from sys import getsizeof
+from threading import Lock
+from typing import Any, Callable, Iterable, NamedTuple, TypeVar
 from urllib.parse import unquote
 
 from fast_query_parsers import parse_query_string as fast_parse_query_string
 from fast_query_parsers import parse_url_encoded_dict
 
-__all__ = ("parse_cookie_string", "parse_headers", "parse_query_string", "parse_url_encoded_form_data")
+__all__ = (
+    "ParserCache",
+    "PARSER_CACHE_MAX_ENTRY_SIZE",
+    "PARSER_CACHE_MAX_SIZE",
+    "ParserCacheInfo",
+    "parse_cookie_string",
+    "parse_cookie_values",
+    "parse_header_values",
+    "parse_headers",
+    "parse_query_string",
+    "parse_url_encoded_form_data",
+    "parser_cache",
+)
 
 
-@lru_cache(1024)
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory used by a parsed value, including the values it contains.
+
+    Args:
+        value: A parser input or output, consisting of builtin containers and scalars.
+
+    Returns:
+        The estimated size in bytes.
+    """
+    size = getsizeof(value)
+    if isinstance(value, dict):
+        return size + sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return size + sum(_estimate_size(v) for v in value)
+    return size
+
+
+class ParserCacheInfo(NamedTuple):
+    """Statistics of the parser cache."""
+
+    hits: int
+    """Number of inputs whose parsed value was served from the cache."""
+    misses: int
+    """Number of inputs that had to be parsed, including inputs too large to be cached."""
+    evictions: int
+    """Number of entries evicted from the cache to stay within its budget."""
+    currsize: int
+    """Estimated size in bytes of the entries currently in the cache."""
+    maxsize: int
+    """Maximum size in bytes of the entries in the cache."""
+
+
+class ParserCache:
+    """A cache of parsed values, shared by all parsers and bounded by a total byte budget.
+
+    Each entry is charged the estimated size of its input and parsed value. Inputs larger than ``max_entry_size`` are
+    parsed without being cached, so that large or unique inputs, e.g. form bodies, neither pin memory nor evict the
+    small, frequently repeated inputs that benefit from caching, such as header sets.
+
+    Entries are evicted in least recently used order approximated by the "second chance" algorithm: a hit only marks
+    an entry as referenced, and a referenced entry that is due to be evicted is moved to the back of the queue instead.
+    This keeps hits to a single lookup.
+    """
+
+    __slots__ = ("_entries", "_lock", "currsize", "evictions", "hits", "max_entry_size", "maxsize", "misses")
+
+    def __init__(self, maxsize: int, max_entry_size: int) -> None:
+        """Initialize ``ParserCache``.
+
+        Args:
+            maxsize: The maximum estimated size in bytes of all entries. A value of ``0`` disables caching.
+            max_entry_size: The maximum size of an input, in bytes or characters, for its parsed value to be cached.
+        """
+        # entries are lists of the parsed value, its size and whether it has been referenced since it was queued
+        self._entries: OrderedDict[tuple[Callable[[Any], Any], Any], list[Any]] = OrderedDict()
+        self._lock = Lock()
+        self.currsize = 0
+        self.evictions = 0
+        self.hits = 0
+        self.max_entry_size = max_entry_size
+        self.maxsize = maxsize
+        self.misses = 0
+
+    def cached(self, input_size: Callable[[T], int]) -> Callable[[Callable[[T], R]], Callable[[T], R]]:
+        """Create a decorator caching the values of a parser in the cache.
+
+        Args:
+            input_size: A function returning the size of an input of the parser, compared with ``max_entry_size``.
+
+        Returns:
+            A decorator for a parser receiving a single hashable input.
+        """
+
+        def decorator(parser: Callable[[T], R]) -> Callable[[T], R]:
+            entries = self._entries
+
+            @wraps(parser)
+            def wrapper(value: T) -> R:
+                key = (parser, value)
+                if (entry := entries.get(key)) is not None:
+                    entry[2] = True
+                    self.hits += 1
+                    return entry[0]  # type: ignore[no-any-return]
+
+                self.misses += 1
+                parsed = parser(value)
+                if input_size(value) <= self.max_entry_size:
+                    self._store(key, parsed)
+                return parsed
+
+            return wrapper
+
+        return decorator
+
+    def configure(self, maxsize: int | None = None, max_entry_size: int | None = None) -> None:
+        """Change the budget of the cache or the size up to which inputs are cached.
+
+        Entries are evicted right away if the cache exceeds a reduced budget.
+
+        Args:
+            maxsize: The maximum estimated size in bytes of all entries. A value of ``0`` disables caching.
+            max_entry_size: The maximum size of an input, in bytes or characters, for its parsed value to be cached.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if max_entry_size is not None:
+                self.max_entry_size = max_entry_size
+            if maxsize is not None:
+                self.maxsize = maxsize
+                entries = self._entries
+                while self.currsize > maxsize:
+                    _, entry = entries.popitem(last=False)
+                    self.currsize -= entry[1]
+                    self.evictions += 1
+
+    def _store(self, key: tuple[Callable[[Any], Any], Any], parsed: Any) -> None:
+        """Store a parsed value, evicting entries until the cache is within its budget.
+
+        Args:
+            key: The parser and its input.
+            parsed: The parsed value.
+
+        Returns:
+            None
+        """
+        size = _estimate_size(key[1]) + _estimate_size(parsed)
+        if size > self.maxsize:
+            return
+
+        with self._lock:
+            entries = self._entries
+            if key in entries:
+                return
+            entries[key] = [parsed, size, False]
+            self.currsize += size
+            while self.currsize > self.maxsize:
+                oldest_key, entry = entries.popitem(last=False)
+                if entry[2]:
+                    entry[2] = False
+                    entries[oldest_key] = entry
+                else:
+                    self.currsize -= entry[1]
+                    self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries from the cache. Statistics are preserved.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._entries.clear()
+            self.currsize = 0
+
+    def info(self) -> ParserCacheInfo:
+        """Get the statistics of the cache.
+
+        Returns:
+            A :class:`ParserCacheInfo` instance.
+        """
+        return ParserCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            currsize=self.currsize,
+            maxsize=self.maxsize,
+        )
+
+
+PARSER_CACHE_MAX_SIZE = 8 * 1024 * 1024
+"""The default budget in bytes of :data:`parser_cache`."""
+PARSER_CACHE_MAX_ENTRY_SIZE = 8 * 1024
+"""The default size in bytes or characters up to which inputs are cached by :data:`parser_cache`."""
+
+parser_cache = ParserCache(maxsize=PARSER_CACHE_MAX_SIZE, max_entry_size=PARSER_CACHE_MAX_ENTRY_SIZE)
+"""The cache shared by the query string, form data, cookie and header parsers. Its limits can be changed with
+:meth:`ParserCache.configure`.
+"""
+
+
+@parser_cache.cached(len)
 def parse_url_encoded_form_data(encoded_data: bytes) -> dict[str, Any]:
     """Parse an url encoded form data dict.
 
@@ -24,7 +225,7 @@ def parse_url_encoded_form_data(encoded_data: bytes) -> dict[str, Any]:
     return parse_url_encoded_dict(encoded_data)
 
 
-@lru_cache(1024)
+@parser_cache.cached(len)
 def parse_query_string(query_string: bytes) -> tuple[tuple[str, Any], ...]:
     """Parse a query string into a tuple of key value pairs.
 
@@ -37,7 +238,7 @@ def parse_query_string(query_string: bytes) -> tuple[tuple[str, Any], ...]:
     return tuple(fast_parse_query_string(query_string, "&"))
 
 
-@lru_cache(1024)
+@parser_cache.cached(len)
 def parse_cookie_string(cookie_string: str) -> dict[str, str]:
     """Parse a cookie string into a dictionary of values.
 
@@ -58,7 +259,51 @@ def parse_cookie_string(cookie_string: str) -> dict[str, str]:
     return output
 
 
-@lru_cache(1024)
+def parse_cookie_values(cookie_string: str, names: frozenset[str]) -> dict[str, str]:
+    """Parse only the given cookies from a cookie string.
+
+    Cookies that are not in ``names`` are skipped without being unquoted. The values of the returned cookies are
+    identical to those returned by :func:`parse_cookie_string`.
+
+    Args:
+        cookie_string: A cookie string.
+        names: The names of the cookies to parse.
+
+    Returns:
+        A string keyed dictionary of the values of the requested cookies that are present.
+    """
+    output: dict[str, str] = {}
+    for cookie in cookie_string.split(";"):
+        name, _, value = cookie.partition("=") if "=" in cookie else ("", "", cookie)
+        name = name.strip()
+        if name in names:
+            output[name] = unquote(unquote_cookie(value.strip()))
+    return output
+
+
+def parse_header_values(
+    headers: Iterable[tuple[bytes, bytes] | list[bytes]], names: frozenset[bytes]
+) -> dict[str, str]:
+    """Decode only the given headers from ASGI headers.
+
+    Header names are compared as is, ASGI requiring them to be lower-cased. As with :func:`parse_headers`, the last
+    value of a repeated header takes precedence.
+
+    Args:
+        headers: ASGI headers.
+        names: The lower-cased names of the headers to decode.
+
+    Returns:
+        A string / string dict of the requested headers that are present.
+    """
+    return {name.decode(): value.decode() for name, value in headers if name in names}
+
+
+def _headers_size(headers: tuple[tuple[bytes, bytes], ...]) -> int:
+    return sum(len(name) + len(value) for name, value in headers)
+
+
+@parser_cache.cached(_headers_size)
 def _parse_headers(headers: tuple[tuple[bytes, bytes], ...]) -> dict[str, str]:
     """Parse ASGI headers into a dict of string keys and values.
 
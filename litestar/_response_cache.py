@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+import msgspec
+from anyio import Event
+
+from litestar.background_tasks import BackgroundTask
+from litestar.constants import SCOPE_STATE_COMPRESSION_ENCODING, SCOPE_STATE_RESPONSE_COMPRESSED
+from litestar.enums import CompressionEncoding
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.middleware.compression import compress_response
+from litestar.response._conditional import add_body_etag
+from litestar.response.base import ASGIResponse
+from litestar.response.streaming import ASGIStreamingResponse
+from litestar.utils import get_litestar_scope_state, set_litestar_scope_state
+
+if TYPE_CHECKING:
+    from litestar.app import Litestar
+    from litestar.config.compression import CompressionConfig
+    from litestar.connection import Request
+    from litestar.handlers import HTTPRouteHandler
+    from litestar.types import ASGIApp
+
+__all__ = (
+    "CachedResponse",
+    "decode_cached_response",
+    "encode_cached_response",
+    "get_or_create_cached_response",
+    "invalidate_cached_responses",
+)
+
+
+class CachedResponse(msgspec.Struct, array_like=True, tag=1):
+    """The record a response is stored as in the response cache.
+
+    Only what is sent to the client is stored: the status code, the encoded headers, including cookies, and the body.
+    Records are encoded as MessagePack arrays, prefixed with a tag that identifies the version of the format, so that
+    values in any other format, e.g. responses pickled by previous versions, fail to decode instead of being loaded.
+    """
+
+    status_code: int
+    encoded_headers: List[Tuple[bytes, bytes]]  # noqa: UP006
+    body: bytes
+    is_head_response: bool
+    fresh_until: Optional[float] = None  # noqa: UP007
+    """Timestamp after which the response is stale, if it is stored beyond its expiration to be served while it is
+    revalidated.
+    """
+    tag_versions: Optional[Dict[str, str]] = None  # noqa: UP007, UP006
+    """The versions of the response's tags at the time it was created."""
+
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(CachedResponse)
+
+
+def encode_cached_response(
+    response: ASGIApp, fresh_until: float | None = None, tag_versions: dict[str, str] | None = None
+) -> bytes | None:
+    """Encode a response to be stored in the response cache.
+
+    Args:
+        response: The response returned by a route handler.
+        fresh_until: Timestamp after which the response is stale, if any.
+        tag_versions: The versions of the response's tags, if any.
+
+    Returns:
+        The encoded response, or ``None`` if the response cannot be cached. This is the case for streaming and file
+        responses, whose bodies are not known in advance, and for ASGI apps other than responses.
+    """
+    if not isinstance(response, ASGIResponse) or isinstance(response, ASGIStreamingResponse):
+        return None
+
+    return _encoder.encode(
+        CachedResponse(
+            status_code=response.status_code,
+            encoded_headers=response.encoded_headers,
+            body=response.body,
+            is_head_response=response.is_head_response,
+            fresh_until=fresh_until,
+            tag_versions=tag_versions,
+        )
+    )
+
+
+def _decode_record(value: bytes) -> CachedResponse | None:
+    try:
+        return _decoder.decode(value)
+    except msgspec.DecodeError:
+        return None
+
+
+def decode_cached_response(value: bytes) -> ASGIResponse | None:
+    """Decode a response stored in the response cache.
+
+    Args:
+        value: A value retrieved from the response cache.
+
+    Returns:
+        An :class:`ASGIResponse <.response.ASGIResponse>`, or ``None`` if the value is not a valid record of the current
+        format, in which case it should be treated as a cache miss.
+    """
+    return _to_response(record) if (record := _decode_record(value)) else None
+
+
+def _to_response(record: CachedResponse) -> ASGIResponse:
+    # the headers have been encoded already, including the content type and length, so the processing done by
+    # ``ASGIResponse.__init__`` is skipped
+    response = ASGIResponse.__new__(ASGIResponse)
+    response.background = None
+    response.body = record.body
+    response.content_length = len(record.body)
+    response.encoded_headers = record.encoded_headers
+    response.encoding = "utf-8"
+    response.is_head_response = record.is_head_response
+    response.status_code = record.status_code
+    return response
+
+
+class _Flight:
+    """A response being created for a cache key, which concurrent requests for the same key can wait for."""
+
+    __slots__ = ("done", "value")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.value: bytes | None = None
+
+
+_TAG_KEY_PREFIX = "litestar-response-cache-tag:"
+
+
+class _CacheEntry:
+    """The location, expiration and tags of the cached response of a request."""
+
+    __slots__ = (
+        "compression_config",
+        "compression_encoding",
+        "expires_in",
+        "flights",
+        "key",
+        "revalidations",
+        "stale_while_revalidate",
+        "store",
+        "tags",
+    )
+
+    def __init__(self, request: Request, route_handler: HTTPRouteHandler) -> None:
+        cache_config = request.app.response_cache_config
+        self.key = route_handler.resolve_cache_key_builder(cache_config.key_builder)(request)
+        # responses are stored compressed with the encoding negotiated by the compression middleware, so that they are
+        # not compressed again on each cache hit. Each encoding is stored as a separate variant
+        self.compression_config: CompressionConfig | None = request.app.compression_config
+        self.compression_encoding: str | None = (
+            get_litestar_scope_state(request.scope, SCOPE_STATE_COMPRESSION_ENCODING)
+            if self.compression_config
+            else None
+        )
+        if self.compression_encoding:
+            self.key += f"|encoding:{self.compression_encoding}"
+        self.store = cache_config.get_store_from_app(request.app)
+        # the responses being created and the revalidations scheduled by the app, by cache key
+        self.flights: dict[str, _Flight] = cache_config._flights
+        self.revalidations: dict[str, float] = cache_config._revalidations
+        self.stale_while_revalidate = cache_config.stale_while_revalidate
+        self.tags = (
+            tuple(tag.format_map(request.path_params) for tag in route_handler.cache_tags)
+            if route_handler.cache_tags
+            else ()
+        )
+
+        self.expires_in: int | None = None
+        if route_handler.cache is True:
+            self.expires_in = cache_config.default_expiration
+        elif route_handler.cache is not False and isinstance(route_handler.cache, int):
+            self.expires_in = route_handler.cache
+
+    async def get_tag_versions(self, expires_in: int | None) -> dict[str, str] | None:
+        """Get the current versions of the entry's tags, creating those that do not exist yet.
+
+        Versions are renewed for as long as the entry is stored. Versions that expire or are evicted nevertheless
+        only invalidate the entries recorded with them.
+        """
+        if not self.tags:
+            return None
+
+        versions: dict[str, str] = {}
+        for tag in self.tags:
+            if (version := await self.store.get(_TAG_KEY_PREFIX + tag, renew_for=expires_in)) is None:
+                version = uuid4().hex.encode()
+                await self.store.set(_TAG_KEY_PREFIX + tag, version, expires_in=expires_in)
+            versions[tag] = version.decode()
+        return versions
+
+    async def is_current(self, record: CachedResponse) -> bool:
+        """Check that none of the tags of a cached response have been invalidated since it was cached."""
+        if not record.tag_versions:
+            return True
+        for tag, version in record.tag_versions.items():
+            current_version = await self.store.get(_TAG_KEY_PREFIX + tag)
+            if current_version is None or current_version.decode() != version:
+                return False
+        return True
+
+
+async def _create_and_cache_response(
+    create_response: Callable[[], Awaitable[ASGIApp]], entry: _CacheEntry, flight: _Flight | None
+) -> ASGIApp:
+    try:
+        expires_in = entry.expires_in
+        fresh_until: float | None = None
+        if expires_in is not None and entry.stale_while_revalidate:
+            fresh_until = time.time() + expires_in
+            expires_in += entry.stale_while_revalidate
+
+        # the versions are retrieved before creating the response, so that tags invalidated while it is being created
+        # invalidate it as well
+        tag_versions = await entry.get_tag_versions(expires_in)
+        response = await create_response()
+        if (
+            entry.compression_encoding
+            and isinstance(response, ASGIResponse)
+            and not isinstance(response, ASGIStreamingResponse)
+        ):
+            await compress_response(
+                response,
+                CompressionEncoding(entry.compression_encoding),
+                entry.compression_config,  # type: ignore[arg-type]
+            )
+        # cached responses can be validated by clients with the ``If-None-Match`` header
+        add_body_etag(response)
+
+        if (value := encode_cached_response(response, fresh_until=fresh_until, tag_versions=tag_versions)) is not None:
+            await entry.store.set(key=entry.key, value=value, expires_in=expires_in)
+            if flight is not None:
+                flight.value = value
+
+        return response
+    finally:
+        if flight is not None:
+            del entry.flights[entry.key]
+            flight.done.set()
+
+
+def _schedule_revalidation(entry: _CacheEntry, now: float) -> None:
+    # revalidations whose background task never ran, e.g. because the stale response was not sent, are overdue once
+    # they could have been scheduled again, and are dropped so that keys that are not requested again do not pile up
+    overdue = now - (entry.stale_while_revalidate or 0)
+    for key in [key for key, scheduled_at in entry.revalidations.items() if scheduled_at <= overdue]:
+        del entry.revalidations[key]
+    entry.revalidations[entry.key] = now
+
+
+async def _revalidate(create_response: Callable[[], Awaitable[ASGIApp]], entry: _CacheEntry) -> None:
+    try:
+        if entry.key not in entry.flights:
+            flight = entry.flights[entry.key] = _Flight()
+            await _create_and_cache_response(create_response, entry, flight)
+    finally:
+        entry.revalidations.pop(entry.key, None)
+
+
+async def get_or_create_cached_response(
+    request: Request, route_handler: HTTPRouteHandler, create_response: Callable[[], Awaitable[ASGIApp]]
+) -> ASGIApp:
+    """Return the cached response for a request, or create and cache it.
+
+    If :attr:`ResponseCacheConfig.coalesce_requests <.config.response_cache.ResponseCacheConfig.coalesce_requests>`
+    is enabled, requests that miss the cache while the response for their cache key is being created within the same
+    process wait for it, instead of calling the route handler themselves. Stale responses kept for
+    :attr:`ResponseCacheConfig.stale_while_revalidate <.config.response_cache.ResponseCacheConfig.stale_while_revalidate>`
+    are served as is, and revalidated in a background task once they have been sent. Responses with tags that have
+    been invalidated since they were cached are cache misses.
+
+    If the compression middleware negotiated an encoding for the request, the response is cached compressed with it,
+    as a variant separate from those of other encodings, so that it is not compressed again when served from the cache.
+
+    Args:
+        request: The :class:`Request <litestar.connection.Request>` instance
+        route_handler: The :class:`~.handlers.HTTPRouteHandler` instance
+        create_response: A function calling the route handler and returning its response
+
+    Returns:
+        The cached or newly created response.
+    """
+    entry = _CacheEntry(request, route_handler)
+    response = await _get_or_create_response(request, entry, create_response)
+    if (
+        entry.compression_encoding
+        and isinstance(response, ASGIResponse)
+        and any(name == b"content-encoding" for name, _ in response.encoded_headers)
+    ):
+        # the compression middleware passes compressed responses through, so it does not mark them as compressed
+        set_litestar_scope_state(request.scope, SCOPE_STATE_RESPONSE_COMPRESSED, True)
+    return response
+
+
+async def _get_or_create_response(
+    request: Request, entry: _CacheEntry, create_response: Callable[[], Awaitable[ASGIApp]]
+) -> ASGIApp:
+    # values that are not records of the current format, e.g. written by previous versions, are cache misses and are
+    # overwritten once the response has been created
+    if (
+        (value := await entry.store.get(key=entry.key))
+        and (record := _decode_record(value))
+        and await entry.is_current(record)
+    ):
+        response = _to_response(record)
+        now = time.time()
+        if (
+            record.fresh_until is not None
+            and record.fresh_until <= now
+            # a revalidation is scheduled by the first request receiving the stale response. If it is never sent, the
+            # background task does not run, so the revalidation is scheduled again once the previous one is overdue
+            and entry.revalidations.get(entry.key, 0) + (entry.stale_while_revalidate or 0) <= now
+        ):
+            _schedule_revalidation(entry, now)
+            response.background = BackgroundTask(_revalidate, create_response, entry)
+        return response
+
+    flight: _Flight | None = None
+    if request.app.response_cache_config.coalesce_requests:
+        if flight := entry.flights.get(entry.key):
+            await flight.done.wait()
+            if flight.value is not None and (record := _decode_record(flight.value)):
+                return _to_response(record)
+            # the response could not be cached, e.g. because it is a streaming response
+            return await create_response()
+
+        flight = entry.flights[entry.key] = _Flight()
+
+    return await _create_and_cache_response(create_response, entry, flight)
+
+
+async def invalidate_cached_responses(app: Litestar, tags: Iterable[str] = (), prefix: str | None = None) -> None:
+    """Invalidate cached responses by tag or cache key prefix.
+
+    Args:
+        app: The :class:`Litestar <litestar.app.Litestar>` instance
+        tags: Invalidate all cached responses carrying any of these tags
+        prefix: Delete all cached responses whose cache key starts with this prefix
+
+    Raises:
+        ImproperlyConfiguredException: If ``prefix`` is given and the response cache store does not support deleting
+            values by prefix
+    """
+    store = app.response_cache_config.get_store_from_app(app)
+    # responses recorded with a version that no longer exists are cache misses, and the next response cached with the
+    # tag creates a new version
+    for tag in tags:
+        await store.delete(_TAG_KEY_PREFIX + tag)
+    if prefix is not None:
+        try:
+            await store.delete_prefix(prefix)
+        except NotImplementedError as e:
+            raise ImproperlyConfiguredException(
+                f"Cannot invalidate cached responses by prefix: The response cache store {type(store).__name__} does "
+                "not implement 'delete_prefix'"
+            ) from e
@@ -2,7 +2,21 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, Literal, Optional, Sequence, Set, TypedDict, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from msgspec import NODEFAULT, Meta, Struct, ValidationError, convert, defstruct
 from msgspec.structs import asdict
@@ -55,14 +69,79 @@ MSGSPEC_CONSTRAINT_FIELDS = (
 
 ERR_RE = re.compile(r"`\$\.(.+)`$")
 
+# msgspec.convert returns instances of these types as copies, so values annotated with them are always converted
+CONTAINER_TYPES = (bytearray, dict, frozenset, list, set, tuple)
+
+
+class _ConversionRequiredError(Exception):
+    """Raised when a value without conversion cannot be determined without msgspec."""
+
+
+def _split_fields_by_conversion(
+    struct_fields: list[tuple[str, Any, Any]], dependency_names: set[str]
+) -> tuple[dict[str, tuple[Any, Any]] | None, list[tuple[str, Any, Any]]]:
+    """Split the fields of a signature model into fields whose values can be used without conversion and fields that
+    have to be converted by msgspec.
+
+    Values of fields annotated with ``Any`` or ``str`` usually need no conversion, and neither do the results of
+    dependencies annotated with a non-container type. Skipping the latter is worth a second conversion pass, since
+    msgspec is comparatively slow at checking instances of custom types, while skipping the former is only worth it if
+    no conversion is required at all.
+
+    Args:
+        struct_fields: The fields of the signature model.
+        dependency_names: The names of the dependencies of the signature model.
+
+    Returns:
+        A mapping of the names of the fields that are not converted to their annotation and default, or ``None`` if all
+        fields should be converted, and a list of the fields that are converted.
+    """
+    unconverted_fields: dict[str, tuple[Any, Any]] = {}
+    converted_fields: list[tuple[str, Any, Any]] = []
+    for name, annotation, default in struct_fields:
+        if isinstance(default, CONTAINER_TYPES):
+            converted_fields.append((name, annotation, default))
+        elif (
+            annotation is Any
+            or annotation is str
+            or (
+                name in dependency_names
+                and isinstance(annotation, type)
+                and not issubclass(annotation, CONTAINER_TYPES)
+            )
+        ):
+            unconverted_fields[name] = (annotation, default)
+        else:
+            converted_fields.append((name, annotation, default))
+
+    if not converted_fields:
+        return unconverted_fields, converted_fields
+
+    custom_type_fields = {
+        name: (annotation, default)
+        for name, (annotation, default) in unconverted_fields.items()
+        if annotation is not Any and annotation is not str
+    }
+    if not custom_type_fields:
+        return None, struct_fields
+
+    converted_fields.extend(
+        (name, annotation, default)
+        for name, (annotation, default) in unconverted_fields.items()
+        if name not in custom_type_fields
+    )
+    return custom_type_fields, converted_fields
+
 
 class SignatureModel(Struct):
     """Model that represents a function signature that uses a msgspec specific type or types."""
 
     # NOTE: we have to use Set and Dict here because python 3.8 goes haywire if we use 'set' and 'dict'
+    _converted_fields_model: ClassVar[Optional[Type[Struct]]]  # noqa: UP007
     _dependency_name_set: ClassVar[Set[str]]
     _fields: ClassVar[Dict[str, FieldDefinition]]
     _return_annotation: ClassVar[Any]
+    _unconverted_fields: ClassVar[Optional[Dict[str, Tuple[Any, Any]]]]  # noqa: UP007
 
     @classmethod
     def _create_exception(cls, connection: ASGIConnection, messages: list[ErrorMessage]) -> Exception:
@@ -146,6 +225,13 @@ class SignatureModel(Struct):
         Returns:
             A dictionary of parsed values
         """
+        if cls._unconverted_fields is not None:
+            try:
+                return cls._parse_values_without_struct(cls._unconverted_fields, kwargs)
+            except (_ConversionRequiredError, ValidationError, TypeError, ValueError):
+                # fall back to converting all values, which also produces the validation error messages
+                pass
+
         messages: list[ErrorMessage] = []
         try:
             return convert(kwargs, cls, strict=False, dec_hook=dec_hook).to_dict()
@@ -163,6 +249,43 @@ class SignatureModel(Struct):
                 messages.append(message)
             raise cls._create_exception(messages=messages, connection=connection) from e
 
+    @classmethod
+    def _parse_values_without_struct(
+        cls, unconverted_fields: dict[str, tuple[Any, Any]], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Parse values, converting only the fields that require it.
+
+        Values of fields annotated with ``Any`` are used as they are, as are values that are exact instances of a
+        field's annotated non-container type, e.g. injected objects, already typed dependency results or a ``str`` path
+        parameter. Only the remaining fields are converted by msgspec.
+
+        Args:
+            unconverted_fields: A mapping of the names of the fields that are not converted to their annotation and
+                default.
+            kwargs: A dictionary of kwargs.
+
+        Raises:
+            _ConversionRequiredError: If a field without a default is missing.
+
+        Returns:
+            A dictionary of parsed values
+        """
+        values: dict[str, Any] = {}
+        for field_name, (annotation, default) in unconverted_fields.items():
+            if field_name in kwargs:
+                value = kwargs[field_name]
+                if annotation is not Any and type(value) is not annotation:
+                    value = convert(value, type=annotation, strict=False, dec_hook=dec_hook)
+                values[field_name] = value
+            elif default is not NODEFAULT:
+                values[field_name] = default
+            else:
+                raise _ConversionRequiredError(field_name)
+
+        if cls._converted_fields_model is not None:
+            values.update(asdict(convert(kwargs, cls._converted_fields_model, strict=False, dec_hook=dec_hook)))
+        return values
+
     def to_dict(self) -> dict[str, Any]:
         """Normalize access to the signature model's dictionary method, because different backends use different methods
         for this.
@@ -229,6 +352,8 @@ class SignatureModel(Struct):
             default = field_definition.default if field_definition.has_default else NODEFAULT
             struct_fields.append((field_definition.name, annotation, default))
 
+        unconverted_fields, converted_fields = _split_fields_by_conversion(struct_fields, dependency_names)
+
         return defstruct(  # type:ignore[return-value]
             f"{fn_name}_signature_model",
             struct_fields,
@@ -238,6 +363,10 @@ class SignatureModel(Struct):
                 "_return_annotation": parsed_signature.return_type.annotation,
                 "_dependency_name_set": dependency_names,
                 "_fields": parsed_signature.parameters,
+                "_unconverted_fields": unconverted_fields,
+                "_converted_fields_model": defstruct(f"{fn_name}_converted_fields", converted_fields, kw_only=True)
+                if unconverted_fields is not None and converted_fields
+                else None,
             },
             kw_only=True,
         )
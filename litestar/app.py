@@ -13,9 +13,11 @@ from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Mapping, Sequen
 from litestar._asgi import ASGIRouter
 from litestar._asgi.utils import get_route_handlers, wrap_in_exception_handler
 from litestar._openapi.path_item import create_path_item
+from litestar._parsers import parser_cache
 from litestar.config.allowed_hosts import AllowedHostsConfig
 from litestar.config.app import AppConfig
 from litestar.config.response_cache import ResponseCacheConfig
+from litestar.config.routing import RoutingConfig
 from litestar.connection import Request, WebSocket
 from litestar.constants import OPENAPI_NOT_INITIALIZED
 from litestar.datastructures.state import State
@@ -47,6 +49,8 @@ from litestar.utils.warnings import warn_pdb_on_exception
 if TYPE_CHECKING:
     from typing_extensions import Self
 
+    from litestar._asgi.routing_cache import RoutingCacheInfo
+    from litestar._parsers import ParserCacheInfo
     from litestar.config.compression import CompressionConfig
     from litestar.config.cors import CORSConfig
     from litestar.config.csrf import CSRFConfig
@@ -149,6 +153,7 @@ class Litestar(Router):
         "request_class",
         "response_cache_config",
         "route_map",
+        "routing_config",
         "serialization_plugins",
         "signature_namespace",
         "state",
@@ -192,11 +197,13 @@ class Litestar(Router):
         parameters: ParametersMap | None = None,
         plugins: OptionalSequence[PluginProtocol] | None = None,
         request_class: type[Request] | None = None,
+        request_max_body_size: int | None = 10_000_000,
         response_cache_config: ResponseCacheConfig | None = None,
         response_class: ResponseType | None = None,
         response_cookies: ResponseCookies | None = None,
         response_headers: OptionalSequence[ResponseHeader] | None = None,
         return_dto: type[DTOInterface] | None | EmptyType = Empty,
+        routing_config: RoutingConfig | None = None,
         security: OptionalSequence[SecurityRequirement] | None = None,
         signature_namespace: Mapping[str, Any] | None = None,
         state: State | None = None,
@@ -267,6 +274,9 @@ class Litestar(Router):
             pdb_on_exception: Drop into the PDB when an exception occurs.
             plugins: Sequence of plugins.
             request_class: An optional subclass of :class:`Request <.connection.Request>` to use for http connections.
+            request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+                '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit. Can be
+                overridden by routers, controllers and route handlers.
             response_class: A custom subclass of :class:`Response <.response.Response>` to be used as the app's default
                 response.
             response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>`.
@@ -277,6 +287,7 @@ class Litestar(Router):
             route_handlers: A sequence of route handlers, which can include instances of
                 :class:`Router <.router.Router>`, subclasses of :class:`Controller <.controller.Controller>` or any
                 callable decorated by the route handler decorators.
+            routing_config: Configures the routing of incoming connections.
             security: A sequence of dicts that will be added to the schema of all route handlers in the application.
                 See
                 :data:`SecurityRequirement <.openapi.spec.SecurityRequirement>` for details.
@@ -334,12 +345,14 @@ class Litestar(Router):
             pdb_on_exception=pdb_on_exception,
             plugins=list(plugins or []),
             request_class=request_class,
+            request_max_body_size=request_max_body_size,
             response_cache_config=response_cache_config or ResponseCacheConfig(),
             response_class=response_class,
             response_cookies=response_cookies or [],
             response_headers=response_headers or [],
             return_dto=return_dto,
             route_handlers=list(route_handlers) if route_handlers is not None else [],
+            routing_config=routing_config or RoutingConfig(),
             security=list(security or []),
             signature_namespace=dict(signature_namespace or {}),
             state=state or State(),
@@ -363,6 +376,7 @@ class Litestar(Router):
         self.get_logger: GetLogger = get_logger_placeholder
         self.logger: Logger | None = None
         self.routes: list[HTTPRoute | ASGIRoute | WebSocketRoute] = []
+        self.routing_config = config.routing_config
         self.asgi_router = ASGIRouter(app=self)
 
         self.allowed_hosts = cast("AllowedHostsConfig | None", config.allowed_hosts)
@@ -406,6 +420,7 @@ class Litestar(Router):
             opt=config.opt,
             parameters=config.parameters,
             path="",
+            request_max_body_size=config.request_max_body_size,
             response_class=config.response_class,
             response_cookies=config.response_cookies,
             response_headers=config.response_headers,
@@ -429,7 +444,11 @@ class Litestar(Router):
             self.register(self.openapi_config.openapi_controller)
 
         for static_config in self.static_files_config:
-            self.register(static_config.to_static_files_app())
+            static_files_handler = static_config.to_static_files_app()
+            self.register(static_files_handler)
+            if (index := cast("StaticFiles", static_files_handler.fn.value).index) is not None:
+                # the files are indexed when the app starts up
+                self._lifespan_managers.append(index)
 
         self.asgi_handler = self._create_asgi_handler()
 
@@ -560,12 +579,14 @@ class Litestar(Router):
                 route_handler.on_registration(self)
 
             if isinstance(route, HTTPRoute):
-                route.create_handler_map()
+                route.create_handler_map(compile_kwargs_extractors=self.routing_config.compiled_kwargs_extractors)
 
             elif isinstance(route, WebSocketRoute):
-                route.handler_parameter_model = route.create_handler_kwargs_model(route.route_handler)
+                route.handler_parameter_model = route.create_handler_kwargs_model(
+                    route.route_handler, compile_extractors=self.routing_config.compiled_kwargs_extractors
+                )
 
-        self.asgi_router.construct_routing_trie()
+        self.asgi_router.construct_routing_trie(routes)  # type: ignore[arg-type]
 
         if self._openapi_schema is not None:
             self.update_openapi_schema()
@@ -709,6 +730,32 @@ class Litestar(Router):
 
         return join_paths([handler_index["paths"][0], file_path])  # type: ignore[unreachable]
 
+    @property
+    def routing_cache_info(self) -> RoutingCacheInfo:
+        """Statistics of the routing cache.
+
+        Use these to size :attr:`RoutingConfig.cache_size <.config.routing.RoutingConfig.cache_size>` based on the
+        application's traffic.
+
+        Returns:
+            A :class:`RoutingCacheInfo <litestar._asgi.routing_cache.RoutingCacheInfo>` containing the number of hits,
+            misses and evictions as well as the current and maximum size of the cache. Lookups of routes with path
+            parameters, which are never cached, are counted separately as bypasses.
+        """
+        return self.asgi_router.routing_cache.info()
+
+    @property
+    def parser_cache_info(self) -> ParserCacheInfo:
+        """Statistics of the cache of parsed query strings, form data, cookies and headers.
+
+        The cache is shared by all applications of the process.
+
+        Returns:
+            A :class:`ParserCacheInfo <litestar._parsers.ParserCacheInfo>` containing the number of hits, misses and
+            evictions as well as the current and maximum estimated size in bytes of the cache.
+        """
+        return parser_cache.info()
+
     @property
     def route_handler_method_view(self) -> dict[str, list[str]]:
         """Map route handlers to paths.
@@ -809,3 +856,42 @@ class Litestar(Router):
             None
         """
         self.event_emitter.emit(event_id, *args, **kwargs)
+
+    async def invalidate_cached_responses(self, tags: Sequence[str] = (), prefix: str | None = None) -> None:
+        """Invalidate cached responses by tag or cache key prefix.
+
+        Examples:
+            .. code-block:: python
+
+                from litestar import Litestar, Request, get, put
+
+
+                @get("/users/{user_id:int}", cache=True, cache_tags=["user:{user_id}"])
+                def get_user(user_id: int) -> dict:
+                    ...
+
+
+                @put("/users/{user_id:int}")
+                async def update_user(request: Request, user_id: int, data: dict) -> dict:
+                    ...
+                    await request.app.invalidate_cached_responses(tags=[f"user:{user_id}"])
+
+
+                app = Litestar(route_handlers=[get_user, update_user])
+
+        Args:
+            tags: Invalidate all cached responses carrying any of these
+                :attr:`cache_tags <.handlers.HTTPRouteHandler.cache_tags>`.
+            prefix: Delete all cached responses whose cache key starts with this prefix. This requires the response
+                cache store to support :meth:`delete_prefix <.stores.base.Store.delete_prefix>`.
+
+        Returns:
+            None
+
+        Raises:
+            ImproperlyConfiguredException: If ``prefix`` is given and the response cache store does not support
+                deleting values by prefix
+        """
+        from litestar._response_cache import invalidate_cached_responses
+
+        await invalidate_cached_responses(self, tags=tags, prefix=prefix)
@@ -25,6 +25,7 @@ __all__ = ("info_command", "routes_command", "run_command")
 
 if TYPE_CHECKING:
     from litestar import Litestar
+    from litestar.types import RouteHandlerType
 
 
 def _convert_uvicorn_args(args: dict[str, Any]) -> list[str]:
@@ -41,6 +42,11 @@ def _convert_uvicorn_args(args: dict[str, Any]) -> list[str]:
     return process_args
 
 
+def _format_route_middleware(app: Litestar, path: str, handler: RouteHandlerType) -> str:
+    middleware = app.asgi_router.route_middleware.get((path, handler), [])
+    return f"[dim]middleware ({len(middleware)}): {', '.join(middleware) or '-'}[/dim]"
+
+
 @command(name="version")
 @option("-s", "--short", help="Exclude release level and serial information", is_flag=True, default=False)
 def version_command(short: bool) -> None:
@@ -184,6 +190,7 @@ def routes_command(app: Litestar) -> None:  # pragma: no cover
                     handler_info.append("[yellow]sync[/yellow]")
 
                 handler_info.append(f'[cyan]{", ".join(sorted(handler.http_methods))}[/cyan]')
+                handler_info.append(_format_route_middleware(app, route.path, handler))
 
                 if len(handler.paths) > 1:
                     for path in handler.paths:
@@ -194,6 +201,13 @@ def routes_command(app: Litestar) -> None:  # pragma: no cover
         else:
             route_type = "WS" if isinstance(route, WebSocketRoute) else "ASGI"
             branch = tree.add(f"[green]{route.path}[/green] ({route_type})")
-            branch.add(f"[blue]{route.route_handler.name or route.route_handler.handler_name}[/blue]")
+            branch.add(
+                " ".join(
+                    [
+                        f"[blue]{route.route_handler.name or route.route_handler.handler_name}[/blue]",
+                        _format_route_middleware(app, route.path, route.route_handler),
+                    ]
+                )
+            )
 
     console.print(tree)
@@ -0,0 +1,125 @@
+import gzip
+from mimetypes import guess_type
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+from litestar import Litestar
+from litestar.cli._utils import RICH_CLICK_INSTALLED, LitestarCLIException, LitestarGroup, console
+from litestar.enums import CompressionEncoding
+from litestar.exceptions import MissingDependencyException
+from litestar.file_system import BaseLocalFileSystem
+from litestar.static_files.base import PRECOMPRESSED_EXTENSIONS
+
+if TYPE_CHECKING or not RICH_CLICK_INSTALLED:
+    from click import group, option
+else:
+    from rich_click import group, option
+
+
+__all__ = ("compress_static_files", "compress_static_files_command", "static_files_group")
+
+
+def _get_compressor(encoding: str) -> Callable[[bytes], bytes]:
+    """Get a function compressing data with the highest compression level of an encoding, since files are compressed
+    once, ahead of time.
+    """
+    if encoding == CompressionEncoding.BROTLI:
+        try:
+            import brotli
+        except ImportError as e:
+            raise MissingDependencyException("brotli") from e
+        return lambda data: brotli.compress(data, quality=11)
+
+    if encoding == CompressionEncoding.ZSTD:
+        try:
+            import zstandard
+        except ImportError as e:
+            raise MissingDependencyException("zstandard", "zstd") from e
+        return zstandard.ZstdCompressor(level=19).compress
+
+    # a fixed modification time keeps the output reproducible
+    return lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compress_static_files(app: Litestar, minimum_size: int = 1024, force: bool = False) -> Dict[str, int]:
+    """Generate the precompressed siblings of the files served by the static files configs of an app that have
+    :attr:`precompressed <.static_files.StaticFilesConfig.precompressed>` enabled.
+
+    Siblings are only kept if they are smaller than the original file, and are only regenerated if they are older than
+    it, unless ``force`` is set.
+
+    Args:
+        app: The ``Litestar`` app.
+        minimum_size: Minimum size of the files to compress, in bytes.
+        force: Regenerate siblings that are up to date.
+
+    Returns:
+        The number of siblings that have been ``generated``, were ``up_to_date`` or were ``not_smaller`` than the
+        original file.
+    """
+    configs = [config for config in app.static_files_config if config.precompressed]
+    if not configs:
+        raise LitestarCLIException("No static files are served precompressed")
+    if any(not isinstance(config.file_system, BaseLocalFileSystem) for config in configs):
+        raise LitestarCLIException("Only static files served from the local file system can be compressed")
+
+    compressors = {
+        encoding: _get_compressor(encoding) for config in configs for encoding in config.precompressed_encodings
+    }
+    compressed_extensions = set(PRECOMPRESSED_EXTENSIONS.values())
+    counts = {"generated": 0, "up_to_date": 0, "not_smaller": 0}
+
+    for config in configs:
+        for directory in config.directories:
+            for path in sorted(Path(directory).rglob("*")):
+                if (
+                    not path.is_file()
+                    or path.suffix in compressed_extensions
+                    # files that are encoded already, e.g. archives, are not served precompressed
+                    or guess_type(path.name)[1] is not None
+                    or (stat := path.stat()).st_size < minimum_size
+                ):
+                    continue
+
+                data: Optional[bytes] = None
+                for encoding in config.precompressed_encodings:
+                    compressed_path = path.with_name(path.name + PRECOMPRESSED_EXTENSIONS[encoding])
+                    if not force and compressed_path.exists() and compressed_path.stat().st_mtime >= stat.st_mtime:
+                        counts["up_to_date"] += 1
+                        continue
+
+                    if data is None:
+                        data = path.read_bytes()
+                    compressed = compressors[encoding](data)
+                    if len(compressed) < len(data):
+                        compressed_path.write_bytes(compressed)
+                        counts["generated"] += 1
+                    else:
+                        # an outdated sibling must not be served in place of the current file
+                        compressed_path.unlink(missing_ok=True)
+                        counts["not_smaller"] += 1
+
+    return counts
+
+
+@group(cls=LitestarGroup, name="static-files")
+def static_files_group() -> None:
+    """Manage static files."""
+
+
+@static_files_group.command("compress")  # type: ignore
+@option(
+    "--minimum-size", help="Minimum size of the files to compress, in bytes", type=int, default=1024, show_default=True
+)
+@option("--force", help="Regenerate precompressed files that are up to date", is_flag=True, default=False)
+def compress_static_files_command(app: Litestar, minimum_size: int, force: bool) -> None:
+    """Generate precompressed versions of static files.
+
+    For each file served by a static files config with ``precompressed`` enabled, a sibling is generated for each of
+    its ``precompressed_encodings``, e.g. ``app.js.br``, ``app.js.zst`` and ``app.js.gz`` for ``app.js``.
+    """
+    counts = compress_static_files(app, minimum_size=minimum_size, force=force)
+    console.print(
+        f"[green]Generated {counts['generated']} precompressed files[/] "
+        f"({counts['up_to_date']} up to date, {counts['not_smaller']} not smaller than the original)"
+    )
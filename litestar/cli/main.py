@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ._utils import RICH_CLICK_INSTALLED, LitestarEnv, LitestarExtensionGroup
-from .commands import core, schema, sessions
+from .commands import core, schema, sessions, static_files
 
 if TYPE_CHECKING or not RICH_CLICK_INSTALLED:
     import click
@@ -59,3 +59,4 @@ litestar_group.add_command(core.routes_command)
 litestar_group.add_command(core.version_command)
 litestar_group.add_command(sessions.sessions_group)
 litestar_group.add_command(schema.schema_group)
+litestar_group.add_command(static_files.static_files_group)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Callable, Sequence
 
 from litestar.config.allowed_hosts import AllowedHostsConfig
 from litestar.config.response_cache import ResponseCacheConfig
+from litestar.config.routing import RoutingConfig
 from litestar.datastructures import State
 from litestar.events.emitter import SimpleEventEmitter
 from litestar.types.empty import Empty
@@ -150,6 +151,12 @@ class AppConfig:
     """List of :class:`SerializationPluginProtocol <.plugins.SerializationPluginProtocol>`."""
     request_class: type[Request] | None = field(default=None)
     """An optional subclass of :class:`Request <.connection.Request>` to use for http connections."""
+    request_max_body_size: int | None = field(default=10_000_000)
+    """Maximum allowed size of the request body in bytes. If this size is exceeded, a '413 - Request Entity Too Large'
+    error response is returned. ``None`` disables the limit.
+
+    Can be overridden by routers, controllers and route handlers.
+    """
     response_class: ResponseType | None = field(default=None)
     """A custom subclass of :class:`Response <.response.Response>` to be used as the app's default response."""
     response_cookies: ResponseCookies = field(default_factory=list)  # type: ignore
@@ -167,6 +174,8 @@ class AppConfig:
     subclasses of :class:`Controller <.controller.Controller>` or any function decorated by the route handler
     decorators.
     """
+    routing_config: RoutingConfig = field(default_factory=RoutingConfig)
+    """Configures the routing of incoming connections."""
     security: list[SecurityRequirement] = field(default_factory=list)
     """A list of dictionaries that will be added to the schema of all route handlers in the application. See
     :data:`SecurityRequirement <.openapi.spec.SecurityRequirement>` for details.
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Literal, Sequence
 
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.middleware.compression import CompressionMiddleware
@@ -9,6 +9,26 @@ from litestar.middleware.compression import CompressionMiddleware
 __all__ = ("CompressionConfig",)
 
 
+DEFAULT_EXCLUDED_MEDIA_TYPES = (
+    "application/gzip",
+    "application/x-7z-compressed",
+    "application/x-bzip2",
+    "application/x-rar-compressed",
+    "application/x-xz",
+    "application/zip",
+    "application/zstd",
+    "audio/*",
+    "font/woff",
+    "font/woff2",
+    "image/avif",
+    "image/gif",
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+    "video/*",
+)
+
+
 @dataclass
 class CompressionConfig:
     """Configuration for response compression.
@@ -17,8 +37,8 @@ class CompressionConfig:
     using the ``compression_config`` key.
     """
 
-    backend: Literal["gzip", "brotli"]
-    """Literal of "gzip" or "brotli"."""
+    backend: Literal["gzip", "brotli", "zstd"]
+    """Literal of "gzip", "brotli" or "zstd"."""
     minimum_size: int = field(default=500)
     """Minimum response size (bytes) to enable compression, affects all backends."""
     gzip_compress_level: int = field(default=9)
@@ -41,13 +61,59 @@ class CompressionConfig:
     Range is ``16`` to ``24``. If set to ``0``, the value will be set based on the quality. Defaults to ``0``.
     """
     brotli_gzip_fallback: bool = True
-    """Use GZIP if Brotli is not supported."""
+    """Use GZIP if the ``backend`` is not supported by the client."""
+    zstd_level: int = field(default=3)
+    """Range ``[1-22]``, the Zstandard compression level.
+
+    The higher the level, the slower the compression.
+    """
+    fallback_backends: Sequence[Literal["gzip", "brotli", "zstd"]] | None = None
+    """Backends to use, in order of preference, if the ``backend`` is not accepted by the client.
+
+    The encoding with the highest quality in the ``Accept-Encoding`` header of the request is used, and ties are broken
+    by this order. If ``None``, ``gzip`` is used as a fallback if ``brotli_gzip_fallback`` is set.
+    """
+    offload_minimum_size: int | None = field(default=256 * 1024)
+    """Minimum size (bytes) of a body, or of a chunk of a streamed body, to be compressed in a worker thread.
+
+    Compressing large bodies inline blocks the event loop, and therefore all other requests handled by the worker. If
+    ``None``, bodies are always compressed inline.
+    """
     middleware_class: type[CompressionMiddleware] = CompressionMiddleware
     """Middleware class to use, should be a subclass of :class:`CompressionMiddleware`."""
     exclude: str | list[str] | None = None
     """A pattern or list of patterns to skip in the compression middleware."""
     exclude_opt_key: str | None = None
     """An identifier to use on routes to disable compression for a particular route."""
+    exclude_media_types: Sequence[str] = DEFAULT_EXCLUDED_MEDIA_TYPES
+    """Media types of responses that are not compressed, since they are compressed already.
+
+    A media type ending with ``/*``, e.g. ``video/*``, matches all subtypes of its type.
+    """
+    flush_policy: Literal["chunk", "size", "none"] = "chunk"
+    """When the compressed output of a streamed response is flushed.
+
+    - ``chunk``: After each chunk of the body, so that each chunk is sent as soon as it is produced, e.g. for
+      server-sent events.
+    - ``size``: Once at least ``flush_size`` bytes have been compressed since the last flush.
+    - ``none``: Only when the compressor emits output, which results in the best compression ratio.
+
+    With the ``size`` and ``none`` policies, the first chunks of a stream whose length is not known are held back
+    until ``minimum_size`` bytes have been produced, and the stream is sent uncompressed if it ends before.
+    """
+    flush_size: int = field(default=16 * 1024)
+    """Number of uncompressed bytes after which the compressed output is flushed with the ``size`` flush policy."""
+
+    @property
+    def backends(self) -> tuple[Literal["gzip", "brotli", "zstd"], ...]:
+        """The backends that can be used to compress a response, in order of preference."""
+        if self.fallback_backends is None:
+            fallback_backends: Sequence[Literal["gzip", "brotli", "zstd"]] = (
+                ("gzip",) if self.brotli_gzip_fallback else ()
+            )
+        else:
+            fallback_backends = self.fallback_backends
+        return tuple(dict.fromkeys((self.backend, *fallback_backends)))
 
     def __post_init__(self) -> None:
         if self.minimum_size <= 0:
@@ -61,3 +127,12 @@ class CompressionConfig:
 
         if self.brotli_lgwin < 10 or self.brotli_lgwin > 24:
             raise ImproperlyConfiguredException("brotli_lgwin must be a value between 10 and 24")
+
+        if self.zstd_level < 1 or self.zstd_level > 22:
+            raise ImproperlyConfiguredException("zstd_level must be a value between 1 and 22")
+
+        if self.offload_minimum_size is not None and self.offload_minimum_size <= 0:
+            raise ImproperlyConfiguredException("offload_minimum_size must be greater than 0")
+
+        if self.flush_size <= 0:
+            raise ImproperlyConfiguredException("flush_size must be greater than 0")
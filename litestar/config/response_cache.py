@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, final
+from hashlib import blake2b
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Sequence, final
 from urllib.parse import urlencode
 
-__all__ = ("ResponseCacheConfig", "default_cache_key_builder", "CACHE_FOREVER")
+__all__ = (
+    "CacheVaryBy",
+    "ResponseCacheConfig",
+    "create_vary_key_builder",
+    "default_cache_key_builder",
+    "CACHE_FOREVER",
+)
 
 
 if TYPE_CHECKING:
     from litestar import Litestar
+    from litestar._response_cache import _Flight
     from litestar.connection import Request
     from litestar.stores.base import Store
     from litestar.types import CacheKeyBuilder
@@ -21,18 +31,110 @@ class CACHE_FOREVER:  # noqa: N801
     """
 
 
+# query strings consisting of these characters only are not changed by decoding and re-encoding them
+_CANONICAL_QUERY_STRING_CHARS = re.compile(r"[\w.~&=-]*", re.ASCII)
+
+
+def _canonicalize_query_string(query_string: str) -> str | None:
+    """Sort the parameters of a query string that is already encoded canonically by their names.
+
+    Args:
+        query_string: A raw query string.
+
+    Returns:
+        The sorted query string, or ``None`` if the query string must be decoded and re-encoded to be canonical.
+    """
+    if not _CANONICAL_QUERY_STRING_CHARS.fullmatch(query_string):
+        return None
+
+    params: list[tuple[str, str]] = []
+    for param in query_string.split("&"):
+        if param:
+            name, _, value = param.partition("=")
+            if "=" in value:
+                return None
+            params.append((name, value))
+    params.sort(key=itemgetter(0))
+    return "&".join(f"{name}={value}" for name, value in params)
+
+
 def default_cache_key_builder(request: Request[Any, Any, Any]) -> str:
     """Given a request object, returns a cache key by combining the path with the sorted query params.
 
+    Query strings that are already encoded canonically, which is the case for most of them, are sorted as they are,
+    without decoding and re-encoding their parameters.
+
     Args:
         request: request used to generate cache key.
 
     Returns:
         A combination of url path and query parameters
     """
+    scope = request.scope
+    path = scope.get("root_path", "") + scope["path"]
+    if not (query_string := scope.get("query_string", b"")):
+        return path
+
+    if (canonical_query_string := _canonicalize_query_string(query_string.decode("latin-1"))) is not None:
+        return path + canonical_query_string
+
     query_params: list[tuple[str, Any]] = list(request.query_params.dict().items())
     query_params.sort(key=lambda x: x[0])
-    return request.url.path + urlencode(query_params, doseq=True)
+    return path + urlencode(query_params, doseq=True)
+
+
+@dataclass(frozen=True)
+class CacheVaryBy:
+    """Request attributes other than the path and query parameters that cached responses of a route handler vary by.
+
+    Responses are cached separately for each combination of the values of these attributes, like a shared HTTP cache
+    does for the request headers listed in the ``Vary`` header of a response.
+    """
+
+    headers: Sequence[str] = ()
+    """Names of request headers, e.g. ``Accept`` or ``Accept-Encoding``."""
+    cookies: Sequence[str] = ()
+    """Names of cookies."""
+    auth: bool | Callable[[Any], str] = False
+    """Vary by the authenticated user, i.e. :attr:`Request.user <.connection.ASGIConnection.user>`.
+
+    If ``True``, users are identified by their string representation. A callable receiving the user and returning
+    its identity can be passed instead, e.g. ``lambda user: str(user.id)``.
+    """
+
+
+def create_vary_key_builder(key_builder: CacheKeyBuilder, vary_by: CacheVaryBy) -> CacheKeyBuilder:
+    """Create a cache key builder appending the values of the request attributes in ``vary_by`` to the keys of
+    ``key_builder``.
+
+    The values are hashed, so that keys do not contain credentials, e.g. of the ``Authorization`` header, and their
+    length does not depend on that of the values.
+
+    Args:
+        key_builder: The key builder creating the keys to append the values to.
+        vary_by: The request attributes to vary by.
+
+    Returns:
+        A :class:`CacheKeyBuilder <.types.CacheKeyBuilder>`
+    """
+    header_names = frozenset(name.lower().encode("latin-1") for name in vary_by.headers)
+    cookie_names = tuple(vary_by.cookies)
+    user_identity: Callable[[Any], str] | None = (
+        vary_by.auth if callable(vary_by.auth) else str if vary_by.auth else None
+    )
+
+    def vary_key_builder(request: Request[Any, Any, Any]) -> str:
+        # all values are kept, so that requests sending a header multiple times do not share the key of a request
+        # sending only one of its values
+        values = [b"header:" + name + b"=" + value for name, value in request.scope["headers"] if name in header_names]
+        if cookie_names:
+            cookies = request.cookies
+            values.extend(f"cookie:{name}={cookies[name]}".encode() for name in cookie_names if name in cookies)
+        if user_identity is not None and (user := request.scope.get("user")) is not None:
+            values.append(b"user:" + user_identity(user).encode())
+        return key_builder(request) + "|" + blake2b(b"\x00".join(values), digest_size=16).hexdigest()
+
+    return vary_key_builder
 
 
 @dataclass
@@ -46,9 +148,31 @@ class ResponseCacheConfig:
     default_expiration: int | None = 60
     """Default cache expiration in seconds used when a route handler is configured with ``cache=True``."""
     key_builder: CacheKeyBuilder = field(default=default_cache_key_builder)
-    """:class:`CacheKeyBuilder <.types.CacheKeyBuilder>`. Defaults to :func:`default_cache_key_builder`."""
+    """:class:`CacheKeyBuilder <.types.CacheKeyBuilder>`. Defaults to :func:`default_cache_key_builder`.
+
+    Route handlers varying by request attributes, see :class:`CacheVaryBy`, append their values to the keys it creates.
+    """
     store: str = "response_cache"
     """Name of the :class:`Store <.stores.base.Store>` to use."""
+    coalesce_requests: bool = True
+    """If ``True``, requests that miss the cache while the response for their cache key is already being created wait
+    for it to be created and cached, instead of calling the route handler themselves.
+
+    Requests are coalesced within a process. Requests waiting for a response that cannot be cached, e.g. a streaming
+    response, call the route handler themselves once it has been created.
+    """
+    stale_while_revalidate: int | None = None
+    """Number of seconds an expired response is kept in the cache and served while it is being revalidated.
+
+    The first request receiving a stale response revalidates it by calling the route handler in a background task
+    once the response has been sent, so that the route handler is only called once per process. Responses cached
+    without an expiration are never stale.
+    """
+
+    _flights: dict[str, _Flight] = field(default_factory=dict, init=False, repr=False, compare=False)
+    """Responses being created, by cache key."""
+    _revalidations: dict[str, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    """Times at which revalidations of stale responses have been scheduled, by cache key."""
 
     def get_store_from_app(self, app: Litestar) -> Store:
         """Get the store defined in :attr:`store` from an :class:`Litestar <.app.Litestar>` instance."""
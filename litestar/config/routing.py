@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+__all__ = ("RoutingConfig",)
+
+
+@dataclass
+class RoutingConfig:
+    """Configuration for the routing of incoming connections.
+
+    To configure routing, pass an instance of this class to :class:`Litestar <.app.Litestar>` using the
+    ``routing_config`` key.
+    """
+
+    cache_size: int = field(default=1024)
+    """Maximum number of resolved routes to cache. A value of ``0`` disables the cache.
+
+    Only routes without path parameters are cached, by their exact path. The cache statistics are available via
+    :attr:`Litestar.routing_cache_info <.app.Litestar.routing_cache_info>`.
+    """
+    compiled_kwargs_extractors: bool = field(default=False)
+    """If ``True``, generate a function for each route handler when it is registered, that extracts the handler's path,
+    query, header, cookie and reserved parameters from a connection with direct lookups.
+
+    Recommended for applications with route handlers that receive a large number of parameters.
+    """
+    compiled_matcher: bool = field(default=False)
+    """If ``True``, compile the routing trie once it is constructed into a flattened structure that resolves each path
+    segment with a single lookup.
+
+    Recommended for applications with a large number of routes containing path parameters.
+    """
@@ -15,7 +15,7 @@ from litestar.connection.base import (
 from litestar.datastructures.headers import Accept
 from litestar.datastructures.multi_dicts import FormMultiDict
 from litestar.enums import RequestEncodingType
-from litestar.exceptions import InternalServerException
+from litestar.exceptions import InternalServerException, RequestEntityTooLargeException
 from litestar.serialization import decode_json, decode_msgpack
 from litestar.types import Empty
 
@@ -126,14 +126,32 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
 
         Raises:
             RuntimeError: if the stream is already consumed
+            RequestEntityTooLargeException: if the body exceeds the ``request_max_body_size`` of the route handler
         """
         if self._body is Empty:
             if not self.is_connected:
                 raise InternalServerException("stream consumed")
+
+            max_body_size = self._resolve_max_body_size()
+            if max_body_size is not None:
+                content_length = self.headers.get("content-length", "")
+                if content_length.isdigit() and int(content_length) > max_body_size:
+                    raise RequestEntityTooLargeException(
+                        f"Request body exceeds the maximum allowed size of {max_body_size} bytes"
+                    )
+
+            received_size = 0
             while event := await self.receive():
                 if event["type"] == "http.request":
-                    if event["body"]:
-                        yield event["body"]
+                    if body := event["body"]:
+                        if max_body_size is not None:
+                            # chunked uploads announce no length, so the limit is enforced as the body is received
+                            received_size += len(body)
+                            if received_size > max_body_size:
+                                raise RequestEntityTooLargeException(
+                                    f"Request body exceeds the maximum allowed size of {max_body_size} bytes"
+                                )
+                        yield body
 
                     if not event.get("more_body", False):
                         break
@@ -149,6 +167,17 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
             yield b""
             return
 
+    def _resolve_max_body_size(self) -> int | None:
+        """Resolve the maximum allowed size of the request body from the route handler of the request.
+
+        Returns:
+            The maximum allowed size in bytes, or ``None`` if it is not limited.
+        """
+        route_handler = self.scope.get("route_handler")
+        # requests may be created for other route handlers, e.g. ASGI route handlers, which do not limit the size
+        resolve_request_max_body_size = getattr(route_handler, "resolve_request_max_body_size", None)
+        return resolve_request_max_body_size() if resolve_request_max_body_size else None
+
     async def body(self) -> bytes:
         """Return the body of the request.
 
@@ -171,8 +200,8 @@ class Request(Generic[UserT, AuthT, StateT], ASGIConnection["HTTPRouteHandler",
             return FormMultiDict(self._form)
         content_type, options = self.content_type
         if content_type == RequestEncodingType.MULTI_PART:
-            self._form = self.scope["_form"] = form_values = parse_multipart_form(  # type: ignore[typeddict-unknown-key]
-                body=await self.body(),
+            self._form = self.scope["_form"] = form_values = await parse_multipart_form(  # type: ignore[typeddict-unknown-key]
+                stream=self.stream(),
                 boundary=options.get("boundary", "").encode(),
                 multipart_form_part_limit=self.app.multipart_form_part_limit,
             )
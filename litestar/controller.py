@@ -59,6 +59,7 @@ class Controller:
         "owner",
         "parameters",
         "path",
+        "request_max_body_size",
         "response_class",
         "response_cookies",
         "response_headers",
@@ -122,6 +123,10 @@ class Controller:
 
     All route handlers under the controller will have the fragment appended to them. If not set it defaults to ``/``.
     """
+    request_max_body_size: int | None | EmptyType
+    """Maximum allowed size of the request body in bytes. If this size is exceeded, a '413 - Request Entity Too Large'
+    error response is returned. ``None`` disables the limit.
+    """
     response_class: type[Response] | None
     """A custom subclass of :class:`Response <.response.Response>` to be used as the default response for all route
     handlers under the controller.
@@ -164,6 +169,9 @@ class Controller:
         if not hasattr(self, "return_dto"):
             self.return_dto = Empty
 
+        if not hasattr(self, "request_max_body_size"):
+            self.request_max_body_size = Empty
+
         for key in self.__slots__:
             if not hasattr(self, key):
                 setattr(self, key, None)
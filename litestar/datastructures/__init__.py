@@ -1,6 +1,7 @@
 from litestar.datastructures.cookie import Cookie
 from litestar.datastructures.headers import (
     Accept,
+    AcceptEncoding,
     CacheControlHeader,
     ETag,
     Header,
@@ -20,6 +21,7 @@ from litestar.datastructures.url import URL, Address
 
 __all__ = (
     "Accept",
+    "AcceptEncoding",
     "Address",
     "CacheControlHeader",
     "Cookie",
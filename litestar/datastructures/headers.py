@@ -29,7 +29,7 @@ from litestar.datastructures.multi_dicts import MultiMixin
 from litestar.dto.factory.utils import resolve_model_type
 from litestar.exceptions import ImproperlyConfiguredException, ValidationException
 
-__all__ = ("Accept", "CacheControlHeader", "ETag", "Header", "Headers", "MutableScopeHeaders")
+__all__ = ("Accept", "AcceptEncoding", "CacheControlHeader", "ETag", "Header", "Headers", "MutableScopeHeaders")
 
 from litestar.typing import FieldDefinition
 from litestar.utils.dataclass import simple_asdict
@@ -530,3 +530,67 @@ class Accept:
             True if the request accepts ``media_type``.
         """
         return self.best_match([media_type]) == media_type
+
+
+class AcceptEncoding:
+    """An ``Accept-Encoding`` header."""
+
+    __slots__ = ("_qualities",)
+
+    def __init__(self, accept_encoding_value: str) -> None:
+        self._qualities: Dict[str, float] = {}
+        for coding_str in accept_encoding_value.split(","):
+            coding, _, params = coding_str.partition(";")
+            if not (coding := coding.strip().lower()):
+                continue
+
+            quality = 1.0
+            for param in params.split(";"):
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    with suppress(ValueError):
+                        quality = float(value)
+            self._qualities[coding] = quality
+
+    def quality(self, encoding: str) -> float:
+        """Get the quality value the request assigns to an encoding.
+
+        Args:
+            encoding: The content coding, e.g. ``gzip``.
+
+        Returns:
+            The quality value of the encoding, or of the ``*`` wildcard if the encoding is not listed, or ``0`` if
+            neither is listed.
+        """
+        quality = self._qualities.get(encoding.lower())
+        if quality is None:
+            quality = self._qualities.get("*", 0.0)
+        return quality
+
+    def accepts(self, encoding: str) -> bool:
+        """Check if the request accepts the specified encoding.
+
+        Args:
+            encoding: The content coding to check for.
+
+        Returns:
+            True if the encoding is listed, or matched by the ``*`` wildcard, with a quality value greater than ``0``.
+        """
+        return self.quality(encoding) > 0
+
+    def best_match(self, provided_encodings: Iterable[str], default: Optional[str] = None) -> Optional[str]:
+        """Find the best encoding for the request.
+
+        Args:
+            provided_encodings: The content codings that can be provided, in order of preference. The order decides
+                between encodings with the same quality value.
+            default: The encoding that is returned if none of the provided encodings are accepted.
+
+        Returns:
+            The accepted encoding with the highest quality value.
+        """
+        match, match_quality = default, 0.0
+        for encoding in provided_encodings:
+            if (quality := self.quality(encoding)) > match_quality:
+                match, match_quality = encoding, quality
+        return match
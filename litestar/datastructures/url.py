@@ -240,7 +240,7 @@ class URL:
                 multidict and pass them back to :meth:`with_replacements`
         """
         if self._query_params is Empty:
-            self._query_params = MultiDict(parse_query_string(query_string=self.query.encode()))
+            self._query_params = MultiDict(parse_query_string(self.query.encode()))
         return cast("MultiDict", self._query_params)
 
     def __str__(self) -> str:
@@ -2,16 +2,20 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, NewType, TypeVar
 
+import msgspec
 from msgspec import Struct, convert
 
 from litestar.dto.factory._backends.abc import AbstractDTOBackend
-from litestar.serialization import decode_media_type
+from litestar.enums import MediaType
+from litestar.exceptions import SerializationException
+from litestar.serialization import dec_hook, decode_media_type
 
 from .utils import _create_struct_for_field_definitions
 
 if TYPE_CHECKING:
     from typing import Any, Collection
 
+    from litestar.dto.factory._backends.abc import BackendContext
     from litestar.dto.factory._backends.types import FieldDefinitionsType
     from litestar.dto.interface import ConnectionContext
 
@@ -23,7 +27,23 @@ T = TypeVar("T")
 
 
 class MsgspecDTOBackend(AbstractDTOBackend[Struct]):
-    __slots__ = ()
+    __slots__ = ("_decoders",)
+
+    def __init__(self, context: BackendContext) -> None:
+        super().__init__(context)
+        self._decoders: dict[str, msgspec.json.Decoder | msgspec.msgpack.Decoder] = {}
+
+    def _get_decoder(self, media_type: str) -> msgspec.json.Decoder | msgspec.msgpack.Decoder | None:
+        """Get a decoder for :attr:`annotation`, created on first use so that backends for return data need none."""
+        if (decoder := self._decoders.get(media_type)) is None:
+            if media_type == MediaType.JSON:
+                decoder = msgspec.json.Decoder(type=self.annotation, dec_hook=dec_hook)
+            elif media_type == MediaType.MESSAGEPACK:
+                decoder = msgspec.msgpack.Decoder(type=self.annotation, dec_hook=dec_hook)
+            else:
+                return None
+            self._decoders[media_type] = decoder
+        return decoder
 
     def create_transfer_model_type(self, unique_name: str, field_definitions: FieldDefinitionsType) -> type[Struct]:
         fqn_uid: str = self._gen_unique_name_id(unique_name)
@@ -32,9 +52,15 @@ class MsgspecDTOBackend(AbstractDTOBackend[Struct]):
         return struct
 
     def parse_raw(self, raw: bytes, connection_context: ConnectionContext) -> Struct | Collection[Struct]:
-        return decode_media_type(  # type:ignore[no-any-return]
-            raw, connection_context.request_encoding_type, type_=self.annotation
-        )
+        decoder = self._get_decoder(connection_context.request_encoding_type)
+        if decoder is None:
+            return decode_media_type(  # type:ignore[no-any-return]
+                raw, connection_context.request_encoding_type, type_=self.annotation
+            )
+        try:
+            return decoder.decode(raw)  # type:ignore[no-any-return]
+        except msgspec.DecodeError as msgspec_error:
+            raise SerializationException(str(msgspec_error)) from msgspec_error
 
     def parse_builtins(self, builtins: Any, connection_context: ConnectionContext) -> Any:
         return convert(builtins, self.annotation)
@@ -76,3 +76,4 @@ class CompressionEncoding(str, Enum):
 
     GZIP = "gzip"
     BROTLI = "br"
+    ZSTD = "zstd"
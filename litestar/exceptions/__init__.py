@@ -10,6 +10,7 @@ from .http_exceptions import (
     NotAuthorizedException,
     NotFoundException,
     PermissionDeniedException,
+    RequestEntityTooLargeException,
     ServiceUnavailableException,
     TemplateNotFoundException,
     TooManyRequestsException,
@@ -32,6 +33,7 @@ __all__ = (
     "NotAuthorizedException",
     "NotFoundException",
     "PermissionDeniedException",
+    "RequestEntityTooLargeException",
     "SerializationException",
     "ServiceUnavailableException",
     "TemplateNotFoundException",
@@ -10,6 +10,7 @@ from litestar.status_codes import (
     HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
     HTTP_405_METHOD_NOT_ALLOWED,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
     HTTP_429_TOO_MANY_REQUESTS,
     HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_503_SERVICE_UNAVAILABLE,
@@ -25,6 +26,7 @@ __all__ = (
     "NotAuthorizedException",
     "NotFoundException",
     "PermissionDeniedException",
+    "RequestEntityTooLargeException",
     "ServiceUnavailableException",
     "TemplateNotFoundException",
     "TooManyRequestsException",
@@ -120,6 +122,12 @@ class MethodNotAllowedException(ClientException):
     status_code = HTTP_405_METHOD_NOT_ALLOWED
 
 
+class RequestEntityTooLargeException(ClientException):
+    """Request body exceeds the allowed size."""
+
+    status_code = HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
 class TooManyRequestsException(ClientException):
     """Request limits have been exceeded."""
 
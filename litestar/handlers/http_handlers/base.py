@@ -4,6 +4,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, AnyStr, Mapping, TypedDict, cast
 
 from litestar._layers.utils import narrow_response_cookies, narrow_response_headers
+from litestar.config.response_cache import create_vary_key_builder
 from litestar.datastructures.cookie import Cookie
 from litestar.datastructures.response_header import ResponseHeader
 from litestar.dto.interface import ConnectionContext
@@ -52,7 +53,7 @@ if TYPE_CHECKING:
 
     from litestar.app import Litestar
     from litestar.background_tasks import BackgroundTask, BackgroundTasks
-    from litestar.config.response_cache import CACHE_FOREVER
+    from litestar.config.response_cache import CACHE_FOREVER, CacheVaryBy
     from litestar.connection import Request
     from litestar.datastructures import CacheControlHeader, ETag
     from litestar.dto.interface import DTOInterface
@@ -76,14 +77,19 @@ class HTTPRouteHandler(BaseRouteHandler):
     __slots__ = (
         "_resolved_after_response",
         "_resolved_before_request",
+        "_resolved_cache_key_builder",
+        "_resolved_request_max_body_size",
         "_response_handler_mapping",
         "after_request",
         "after_response",
         "background",
         "before_request",
+        "body_etag",
         "cache",
         "cache_control",
         "cache_key_builder",
+        "cache_tags",
+        "cache_vary_by",
         "content_encoding",
         "content_media_type",
         "deprecated",
@@ -96,6 +102,7 @@ class HTTPRouteHandler(BaseRouteHandler):
         "operation_class",
         "operation_id",
         "raises",
+        "request_max_body_size",
         "response_class",
         "response_cookies",
         "response_description",
@@ -119,9 +126,12 @@ class HTTPRouteHandler(BaseRouteHandler):
         after_response: AfterResponseHookHandler | None = None,
         background: BackgroundTask | BackgroundTasks | None = None,
         before_request: BeforeRequestHookHandler | None = None,
+        body_etag: bool = False,
         cache: bool | int | type[CACHE_FOREVER] = False,
         cache_control: CacheControlHeader | None = None,
         cache_key_builder: CacheKeyBuilder | None = None,
+        cache_tags: Sequence[str] | None = None,
+        cache_vary_by: CacheVaryBy | None = None,
         dependencies: Dependencies | None = None,
         dto: type[DTOInterface] | None | EmptyType = Empty,
         etag: ETag | None = None,
@@ -132,6 +142,7 @@ class HTTPRouteHandler(BaseRouteHandler):
         middleware: Sequence[Middleware] | None = None,
         name: str | None = None,
         opt: Mapping[str, Any] | None = None,
+        request_max_body_size: int | None | EmptyType = Empty,
         response_class: ResponseType | None = None,
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
@@ -172,12 +183,20 @@ class HTTPRouteHandler(BaseRouteHandler):
             before_request: A sync or async function called immediately before calling the route handler. Receives
                 the :class:`Request <.connection.Request>` instance and any non-``None`` return value is used for the
                 response, bypassing the route handler.
+            body_etag: If ``True``, an ``etag`` header derived from a hash of the response body is added to responses
+                that do not have one, and ``GET`` and ``HEAD`` requests whose ``If-None-Match`` header matches it
+                receive a ``304 - Not Modified`` response without body.
             cache: Enables response caching if configured on the application level. Valid values are ``True`` or a
                 number of seconds (e.g. ``120``) to cache the response.
             cache_control: A ``cache-control`` header of type
                 :class:`CacheControlHeader <.datastructures.CacheControlHeader>` that will be added to the response.
             cache_key_builder: A :class:`cache-key builder function <.types.CacheKeyBuilder>`. Allows for customization
                 of the cache key if caching is configured on the application level.
+            cache_tags: Tags to attach to cached responses, which allow invalidating them with
+                :meth:`Litestar.invalidate_cached_responses <.app.Litestar.invalidate_cached_responses>`. Tags are
+                formatted with the path parameters of the request, e.g. ``"user:{user_id}"``.
+            cache_vary_by: A :class:`CacheVaryBy <.config.response_cache.CacheVaryBy>` instance declaring the request
+                headers, cookies and authentication that cached responses vary by.
             dependencies: A string keyed mapping of dependency :class:`Provider <.di.Provide>` instances.
             dto: :class:`DTOInterface <.dto.interface.DTOInterface>` to use for (de)serializing and
                 validation of request data.
@@ -194,6 +213,8 @@ class HTTPRouteHandler(BaseRouteHandler):
             opt: A string keyed mapping of arbitrary values that can be accessed in :class:`Guards <.types.Guard>` or
                 wherever you have access to :class:`Request <.connection.Request>` or
                 :class:`ASGI Scope <.types.Scope>`.
+            request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+                '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
             response_class: A custom subclass of :class:`Response <.response.Response>` to be used as route handler's
                 default response.
             response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>` instances.
@@ -250,11 +271,15 @@ class HTTPRouteHandler(BaseRouteHandler):
         self.after_response = AsyncCallable(after_response) if after_response else None
         self.background = background
         self.before_request = AsyncCallable(before_request) if before_request else None
+        self.body_etag = body_etag
         self.cache = cache
         self.cache_control = cache_control
         self.cache_key_builder = cache_key_builder
+        self.cache_tags = tuple(cache_tags) if cache_tags else ()
+        self.cache_vary_by = cache_vary_by
         self.etag = etag
         self.media_type: MediaType | str = media_type or ""
+        self.request_max_body_size = request_max_body_size
         self.response_class = response_class
         self.response_cookies: Sequence[Cookie] | None = narrow_response_cookies(response_cookies)
         self.response_headers: Sequence[ResponseHeader] | None = narrow_response_headers(response_headers)
@@ -277,6 +302,8 @@ class HTTPRouteHandler(BaseRouteHandler):
         # memoized attributes, defaulted to Empty
         self._resolved_after_response: AsyncCallable | None | EmptyType = Empty
         self._resolved_before_request: AsyncCallable | None | EmptyType = Empty
+        self._resolved_cache_key_builder: CacheKeyBuilder | EmptyType = Empty
+        self._resolved_request_max_body_size: int | None | EmptyType = Empty
         self._response_handler_mapping: ResponseHandlerMap = {"default_handler": Empty, "response_type_handler": Empty}
 
     def __call__(self, fn: AnyCallable) -> HTTPRouteHandler:
@@ -307,6 +334,46 @@ class HTTPRouteHandler(BaseRouteHandler):
             Response,
         )
 
+    def resolve_request_max_body_size(self) -> int | None:
+        """Return the closest ``request_max_body_size`` set in the owner graph.
+
+        This method is memoized so the computation occurs only once.
+
+        Returns:
+            The maximum allowed size of the request body in bytes, or ``None`` if it is not limited.
+        """
+        if self._resolved_request_max_body_size is Empty:
+            self._resolved_request_max_body_size = next(
+                (
+                    layer.request_max_body_size
+                    for layer in reversed(self.ownership_layers)
+                    if layer.request_max_body_size is not Empty
+                ),
+                None,
+            )
+        return cast("int | None", self._resolved_request_max_body_size)
+
+    def resolve_cache_key_builder(self, default_key_builder: CacheKeyBuilder) -> CacheKeyBuilder:
+        """Return the key builder creating the cache keys of the route handler's responses.
+
+        This method is memoized so the computation occurs only once.
+
+        Args:
+            default_key_builder: The key builder of the application's
+                :class:`ResponseCacheConfig <.config.response_cache.ResponseCacheConfig>`, used if the route handler does
+                not declare a ``cache_key_builder``.
+
+        Returns:
+            A :class:`CacheKeyBuilder <.types.CacheKeyBuilder>`, appending the values of the request attributes of
+            ``cache_vary_by``, if any, to the keys.
+        """
+        if self._resolved_cache_key_builder is Empty:
+            key_builder = self.cache_key_builder or default_key_builder
+            if self.cache_vary_by is not None:
+                key_builder = create_vary_key_builder(key_builder, self.cache_vary_by)
+            self._resolved_cache_key_builder = key_builder
+        return cast("CacheKeyBuilder", self._resolved_cache_key_builder)
+
     def resolve_response_headers(self) -> frozenset[ResponseHeader]:
         """Return all header parameters in the scope of the handler function.
 
@@ -518,6 +585,9 @@ class HTTPRouteHandler(BaseRouteHandler):
         if "socket" in self.parsed_fn_signature.parameters:
             raise ImproperlyConfiguredException("The 'socket' kwarg is not supported with http handlers")
 
+        if self.cache_tags and not self.cache:
+            raise ImproperlyConfiguredException("'cache_tags' are only supported for route handlers with 'cache' set")
+
         if "data" in self.parsed_fn_signature.parameters and "GET" in self.http_methods:
             raise ImproperlyConfiguredException("'data' kwarg is unsupported for 'GET' request handlers")
 
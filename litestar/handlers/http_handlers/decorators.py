@@ -13,10 +13,10 @@ from litestar.utils import is_class_and_subclass
 from .base import HTTPRouteHandler
 
 if TYPE_CHECKING:
-    from typing import Any, Mapping
+    from typing import Any, Mapping, Sequence
 
     from litestar.background_tasks import BackgroundTask, BackgroundTasks
-    from litestar.config.response_cache import CACHE_FOREVER
+    from litestar.config.response_cache import CACHE_FOREVER, CacheVaryBy
     from litestar.datastructures import CacheControlHeader, ETag
     from litestar.dto.interface import DTOInterface
     from litestar.openapi.datastructures import ResponseSpec
@@ -57,9 +57,12 @@ class delete(HTTPRouteHandler):
         after_response: AfterResponseHookHandler | None = None,
         background: BackgroundTask | BackgroundTasks | None = None,
         before_request: BeforeRequestHookHandler | None = None,
+        body_etag: bool = False,
         cache: bool | int | type[CACHE_FOREVER] = False,
         cache_control: CacheControlHeader | None = None,
         cache_key_builder: CacheKeyBuilder | None = None,
+        cache_tags: Sequence[str] | None = None,
+        cache_vary_by: CacheVaryBy | None = None,
         dependencies: Dependencies | None = None,
         dto: type[DTOInterface] | None | EmptyType = Empty,
         etag: ETag | None = None,
@@ -69,6 +72,7 @@ class delete(HTTPRouteHandler):
         middleware: list[Middleware] | None = None,
         name: str | None = None,
         opt: dict[str, Any] | None = None,
+        request_max_body_size: int | None | EmptyType = Empty,
         response_class: ResponseType | None = None,
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
@@ -109,12 +113,20 @@ class delete(HTTPRouteHandler):
             before_request: A sync or async function called immediately before calling the route handler. Receives
                 the :class:`.connection.Request` instance and any non-``None`` return value is used for the response,
                 bypassing the route handler.
+            body_etag: If ``True``, an ``etag`` header derived from a hash of the response body is added to responses
+                that do not have one, and ``GET`` and ``HEAD`` requests whose ``If-None-Match`` header matches it
+                receive a ``304 - Not Modified`` response without body.
             cache: Enables response caching if configured on the application level. Valid values are ``True`` or a number
                 of seconds (e.g. ``120``) to cache the response.
             cache_control: A ``cache-control`` header of type
                 :class:`CacheControlHeader <.datastructures.CacheControlHeader>` that will be added to the response.
             cache_key_builder: A :class:`cache-key builder function <.types.CacheKeyBuilder>`. Allows for customization
                 of the cache key if caching is configured on the application level.
+            cache_tags: Tags to attach to cached responses, which allow invalidating them with
+                :meth:`Litestar.invalidate_cached_responses <.app.Litestar.invalidate_cached_responses>`. Tags are
+                formatted with the path parameters of the request, e.g. ``"user:{user_id}"``.
+            cache_vary_by: A :class:`CacheVaryBy <.config.response_cache.CacheVaryBy>` instance declaring the request
+                headers, cookies and authentication that cached responses vary by.
             dto: :class:`DTOInterface <.dto.interface.DTOInterface>` to use for (de)serializing and
                 validation of request data.
             dependencies: A string keyed mapping of dependency :class:`Provider <.di.Provide>` instances.
@@ -130,6 +142,8 @@ class delete(HTTPRouteHandler):
             name: A string identifying the route handler.
             opt: A string keyed mapping of arbitrary values that can be accessed in :class:`Guards <.types.Guard>` or
                 wherever you have access to :class:`Request <.connection.Request>` or :class:`ASGI Scope <.types.Scope>`.
+            request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+                '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
             response_class: A custom subclass of :class:`Response <.response.Response>` to be used as route handler's
                 default response.
             response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>` instances.
@@ -168,9 +182,12 @@ class delete(HTTPRouteHandler):
             after_response=after_response,
             background=background,
             before_request=before_request,
+            body_etag=body_etag,
             cache=cache,
             cache_control=cache_control,
             cache_key_builder=cache_key_builder,
+            cache_tags=cache_tags,
+            cache_vary_by=cache_vary_by,
             content_encoding=content_encoding,
             content_media_type=content_media_type,
             dependencies=dependencies,
@@ -190,6 +207,7 @@ class delete(HTTPRouteHandler):
             opt=opt,
             path=path,
             raises=raises,
+            request_max_body_size=request_max_body_size,
             response_class=response_class,
             response_cookies=response_cookies,
             response_description=response_description,
@@ -221,9 +239,12 @@ class get(HTTPRouteHandler):
         after_response: AfterResponseHookHandler | None = None,
         background: BackgroundTask | BackgroundTasks | None = None,
         before_request: BeforeRequestHookHandler | None = None,
+        body_etag: bool = False,
         cache: bool | int | type[CACHE_FOREVER] = False,
         cache_control: CacheControlHeader | None = None,
         cache_key_builder: CacheKeyBuilder | None = None,
+        cache_tags: Sequence[str] | None = None,
+        cache_vary_by: CacheVaryBy | None = None,
         dependencies: Dependencies | None = None,
         dto: type[DTOInterface] | None | EmptyType = Empty,
         etag: ETag | None = None,
@@ -233,6 +254,7 @@ class get(HTTPRouteHandler):
         middleware: list[Middleware] | None = None,
         name: str | None = None,
         opt: dict[str, Any] | None = None,
+        request_max_body_size: int | None | EmptyType = Empty,
         response_class: ResponseType | None = None,
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
@@ -273,12 +295,20 @@ class get(HTTPRouteHandler):
             before_request: A sync or async function called immediately before calling the route handler. Receives
                 the :class:`.connection.Request` instance and any non-``None`` return value is used for the response,
                 bypassing the route handler.
+            body_etag: If ``True``, an ``etag`` header derived from a hash of the response body is added to responses
+                that do not have one, and ``GET`` and ``HEAD`` requests whose ``If-None-Match`` header matches it
+                receive a ``304 - Not Modified`` response without body.
             cache: Enables response caching if configured on the application level. Valid values are ``True`` or a number
                 of seconds (e.g. ``120``) to cache the response.
             cache_control: A ``cache-control`` header of type
                 :class:`CacheControlHeader <.datastructures.CacheControlHeader>` that will be added to the response.
             cache_key_builder: A :class:`cache-key builder function <.types.CacheKeyBuilder>`. Allows for customization
                 of the cache key if caching is configured on the application level.
+            cache_tags: Tags to attach to cached responses, which allow invalidating them with
+                :meth:`Litestar.invalidate_cached_responses <.app.Litestar.invalidate_cached_responses>`. Tags are
+                formatted with the path parameters of the request, e.g. ``"user:{user_id}"``.
+            cache_vary_by: A :class:`CacheVaryBy <.config.response_cache.CacheVaryBy>` instance declaring the request
+                headers, cookies and authentication that cached responses vary by.
             dependencies: A string keyed mapping of dependency :class:`Provider <.di.Provide>` instances.
             dto: :class:`DTOInterface <.dto.interface.DTOInterface>` to use for (de)serializing and
                 validation of request data.
@@ -294,6 +324,8 @@ class get(HTTPRouteHandler):
             name: A string identifying the route handler.
             opt: A string keyed mapping of arbitrary values that can be accessed in :class:`Guards <.types.Guard>` or
                 wherever you have access to :class:`Request <.connection.Request>` or :class:`ASGI Scope <.types.Scope>`.
+            request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+                '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
             response_class: A custom subclass of :class:`Response <.response.Response>` to be used as route handler's
                 default response.
             response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>` instances.
@@ -333,9 +365,12 @@ class get(HTTPRouteHandler):
             after_response=after_response,
             background=background,
             before_request=before_request,
+            body_etag=body_etag,
             cache=cache,
             cache_control=cache_control,
             cache_key_builder=cache_key_builder,
+            cache_tags=cache_tags,
+            cache_vary_by=cache_vary_by,
             content_encoding=content_encoding,
             content_media_type=content_media_type,
             dependencies=dependencies,
@@ -355,6 +390,7 @@ class get(HTTPRouteHandler):
             opt=opt,
             path=path,
             raises=raises,
+            request_max_body_size=request_max_body_size,
             response_class=response_class,
             response_cookies=response_cookies,
             response_description=response_description,
@@ -386,9 +422,12 @@ class head(HTTPRouteHandler):
         after_response: AfterResponseHookHandler | None = None,
         background: BackgroundTask | BackgroundTasks | None = None,
         before_request: BeforeRequestHookHandler | None = None,
+        body_etag: bool = False,
         cache: bool | int | type[CACHE_FOREVER] = False,
         cache_control: CacheControlHeader | None = None,
         cache_key_builder: CacheKeyBuilder | None = None,
+        cache_tags: Sequence[str] | None = None,
+        cache_vary_by: CacheVaryBy | None = None,
         dependencies: Dependencies | None = None,
         dto: type[DTOInterface] | None | EmptyType = Empty,
         etag: ETag | None = None,
@@ -398,6 +437,7 @@ class head(HTTPRouteHandler):
         middleware: list[Middleware] | None = None,
         name: str | None = None,
         opt: dict[str, Any] | None = None,
+        request_max_body_size: int | None | EmptyType = Empty,
         response_class: ResponseType | None = None,
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
@@ -442,12 +482,20 @@ class head(HTTPRouteHandler):
             before_request: A sync or async function called immediately before calling the route handler. Receives
                 the :class:`.connection.Request` instance and any non-``None`` return value is used for the response,
                 bypassing the route handler.
+            body_etag: If ``True``, an ``etag`` header derived from a hash of the response body is added to responses
+                that do not have one, and ``GET`` and ``HEAD`` requests whose ``If-None-Match`` header matches it
+                receive a ``304 - Not Modified`` response without body.
             cache: Enables response caching if configured on the application level. Valid values are ``True`` or a number
                 of seconds (e.g. ``120``) to cache the response.
             cache_control: A ``cache-control`` header of type
                 :class:`CacheControlHeader <.datastructures.CacheControlHeader>` that will be added to the response.
             cache_key_builder: A :class:`cache-key builder function <.types.CacheKeyBuilder>`. Allows for customization
                 of the cache key if caching is configured on the application level.
+            cache_tags: Tags to attach to cached responses, which allow invalidating them with
+                :meth:`Litestar.invalidate_cached_responses <.app.Litestar.invalidate_cached_responses>`. Tags are
+                formatted with the path parameters of the request, e.g. ``"user:{user_id}"``.
+            cache_vary_by: A :class:`CacheVaryBy <.config.response_cache.CacheVaryBy>` instance declaring the request
+                headers, cookies and authentication that cached responses vary by.
             dependencies: A string keyed mapping of dependency :class:`Provider <.di.Provide>` instances.
             dto: :class:`DTOInterface <.dto.interface.DTOInterface>` to use for (de)serializing and
                 validation of request data.
@@ -463,6 +511,8 @@ class head(HTTPRouteHandler):
             name: A string identifying the route handler.
             opt: A string keyed mapping of arbitrary values that can be accessed in :class:`Guards <.types.Guard>` or
                 wherever you have access to :class:`Request <.connection.Request>` or :class:`ASGI Scope <.types.Scope>`.
+            request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+                '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
             response_class: A custom subclass of :class:`Response <.response.Response>` to be used as route handler's
                 default response.
             response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>` instances.
@@ -502,9 +552,12 @@ class head(HTTPRouteHandler):
             after_response=after_response,
             background=background,
             before_request=before_request,
+            body_etag=body_etag,
             cache=cache,
             cache_control=cache_control,
             cache_key_builder=cache_key_builder,
+            cache_tags=cache_tags,
+            cache_vary_by=cache_vary_by,
             content_encoding=content_encoding,
             content_media_type=content_media_type,
             dependencies=dependencies,
@@ -524,6 +577,7 @@ class head(HTTPRouteHandler):
             opt=opt,
             path=path,
             raises=raises,
+            request_max_body_size=request_max_body_size,
             response_class=response_class,
             response_cookies=response_cookies,
             response_description=response_description,
@@ -568,9 +622,12 @@ class patch(HTTPRouteHandler):
         after_response: AfterResponseHookHandler | None = None,
         background: BackgroundTask | BackgroundTasks | None = None,
         before_request: BeforeRequestHookHandler | None = None,
+        body_etag: bool = False,
         cache: bool | int | type[CACHE_FOREVER] = False,
         cache_control: CacheControlHeader | None = None,
         cache_key_builder: CacheKeyBuilder | None = None,
+        cache_tags: Sequence[str] | None = None,
+        cache_vary_by: CacheVaryBy | None = None,
         dependencies: Dependencies | None = None,
         dto: type[DTOInterface] | None | EmptyType = Empty,
         etag: ETag | None = None,
@@ -580,6 +637,7 @@ class patch(HTTPRouteHandler):
         middleware: list[Middleware] | None = None,
         name: str | None = None,
         opt: dict[str, Any] | None = None,
+        request_max_body_size: int | None | EmptyType = Empty,
         response_class: ResponseType | None = None,
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
@@ -620,12 +678,20 @@ class patch(HTTPRouteHandler):
             before_request: A sync or async function called immediately before calling the route handler. Receives
                 the :class:`.connection.Request` instance and any non-``None`` return value is used for the response,
                 bypassing the route handler.
+            body_etag: If ``True``, an ``etag`` header derived from a hash of the response body is added to responses
+                that do not have one, and ``GET`` and ``HEAD`` requests whose ``If-None-Match`` header matches it
+                receive a ``304 - Not Modified`` response without body.
             cache: Enables response caching if configured on the application level. Valid values are ``True`` or a number
                 of seconds (e.g. ``120``) to cache the response.
             cache_control: A ``cache-control`` header of type
                 :class:`CacheControlHeader <.datastructures.CacheControlHeader>` that will be added to the response.
             cache_key_builder: A :class:`cache-key builder function <.types.CacheKeyBuilder>`. Allows for customization
                 of the cache key if caching is configured on the application level.
+            cache_tags: Tags to attach to cached responses, which allow invalidating them with
+                :meth:`Litestar.invalidate_cached_responses <.app.Litestar.invalidate_cached_responses>`. Tags are
+                formatted with the path parameters of the request, e.g. ``"user:{user_id}"``.
+            cache_vary_by: A :class:`CacheVaryBy <.config.response_cache.CacheVaryBy>` instance declaring the request
+                headers, cookies and authentication that cached responses vary by.
             dependencies: A string keyed mapping of dependency :class:`Provider <.di.Provide>` instances.
             dto: :class:`DTOInterface <.dto.interface.DTOInterface>` to use for (de)serializing and
                 validation of request data.
@@ -641,6 +707,8 @@ class patch(HTTPRouteHandler):
             name: A string identifying the route handler.
             opt: A string keyed mapping of arbitrary values that can be accessed in :class:`Guards <.types.Guard>` or
                 wherever you have access to :class:`Request <.connection.Request>` or :class:`ASGI Scope <.types.Scope>`.
+            request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+                '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
             response_class: A custom subclass of :class:`Response <.response.Response>` to be used as route handler's
                 default response.
             response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>` instances.
@@ -679,9 +747,12 @@ class patch(HTTPRouteHandler):
             after_response=after_response,
             background=background,
             before_request=before_request,
+            body_etag=body_etag,
             cache=cache,
             cache_control=cache_control,
             cache_key_builder=cache_key_builder,
+            cache_tags=cache_tags,
+            cache_vary_by=cache_vary_by,
             content_encoding=content_encoding,
             content_media_type=content_media_type,
             dependencies=dependencies,
@@ -701,6 +772,7 @@ class patch(HTTPRouteHandler):
             opt=opt,
             path=path,
             raises=raises,
+            request_max_body_size=request_max_body_size,
             response_class=response_class,
             response_cookies=response_cookies,
             response_description=response_description,
@@ -732,9 +804,12 @@ class post(HTTPRouteHandler):
         after_response: AfterResponseHookHandler | None = None,
         background: BackgroundTask | BackgroundTasks | None = None,
         before_request: BeforeRequestHookHandler | None = None,
+        body_etag: bool = False,
         cache: bool | int | type[CACHE_FOREVER] = False,
         cache_control: CacheControlHeader | None = None,
         cache_key_builder: CacheKeyBuilder | None = None,
+        cache_tags: Sequence[str] | None = None,
+        cache_vary_by: CacheVaryBy | None = None,
         dependencies: Dependencies | None = None,
         dto: type[DTOInterface] | None | EmptyType = Empty,
         etag: ETag | None = None,
@@ -744,6 +819,7 @@ class post(HTTPRouteHandler):
         middleware: list[Middleware] | None = None,
         name: str | None = None,
         opt: dict[str, Any] | None = None,
+        request_max_body_size: int | None | EmptyType = Empty,
         response_class: ResponseType | None = None,
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
@@ -784,12 +860,20 @@ class post(HTTPRouteHandler):
             before_request: A sync or async function called immediately before calling the route handler. Receives
                 the :class:`.connection.Request` instance and any non-``None`` return value is used for the response,
                 bypassing the route handler.
+            body_etag: If ``True``, an ``etag`` header derived from a hash of the response body is added to responses
+                that do not have one, and ``GET`` and ``HEAD`` requests whose ``If-None-Match`` header matches it
+                receive a ``304 - Not Modified`` response without body.
             cache: Enables response caching if configured on the application level. Valid values are ``True`` or a number
                 of seconds (e.g. ``120``) to cache the response.
             cache_control: A ``cache-control`` header of type
                 :class:`CacheControlHeader <.datastructures.CacheControlHeader>` that will be added to the response.
             cache_key_builder: A :class:`cache-key builder function <.types.CacheKeyBuilder>`. Allows for customization
                 of the cache key if caching is configured on the application level.
+            cache_tags: Tags to attach to cached responses, which allow invalidating them with
+                :meth:`Litestar.invalidate_cached_responses <.app.Litestar.invalidate_cached_responses>`. Tags are
+                formatted with the path parameters of the request, e.g. ``"user:{user_id}"``.
+            cache_vary_by: A :class:`CacheVaryBy <.config.response_cache.CacheVaryBy>` instance declaring the request
+                headers, cookies and authentication that cached responses vary by.
             dependencies: A string keyed mapping of dependency :class:`Provider <.di.Provide>` instances.
             dto: :class:`DTOInterface <.dto.interface.DTOInterface>` to use for (de)serializing and
                 validation of request data.
@@ -805,6 +889,8 @@ class post(HTTPRouteHandler):
             name: A string identifying the route handler.
             opt: A string keyed mapping of arbitrary values that can be accessed in :class:`Guards <.types.Guard>` or
                 wherever you have access to :class:`Request <.connection.Request>` or :class:`ASGI Scope <.types.Scope>`.
+            request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+                '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
             response_class: A custom subclass of :class:`Response <.response.Response>` to be used as route handler's
                 default response.
             response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>` instances.
@@ -843,9 +929,12 @@ class post(HTTPRouteHandler):
             after_response=after_response,
             background=background,
             before_request=before_request,
+            body_etag=body_etag,
             cache=cache,
             cache_control=cache_control,
             cache_key_builder=cache_key_builder,
+            cache_tags=cache_tags,
+            cache_vary_by=cache_vary_by,
             content_encoding=content_encoding,
             content_media_type=content_media_type,
             dependencies=dependencies,
@@ -865,6 +954,7 @@ class post(HTTPRouteHandler):
             opt=opt,
             path=path,
             raises=raises,
+            request_max_body_size=request_max_body_size,
             response_class=response_class,
             response_cookies=response_cookies,
             response_description=response_description,
@@ -896,9 +986,12 @@ class put(HTTPRouteHandler):
         after_response: AfterResponseHookHandler | None = None,
         background: BackgroundTask | BackgroundTasks | None = None,
         before_request: BeforeRequestHookHandler | None = None,
+        body_etag: bool = False,
         cache: bool | int | type[CACHE_FOREVER] = False,
         cache_control: CacheControlHeader | None = None,
         cache_key_builder: CacheKeyBuilder | None = None,
+        cache_tags: Sequence[str] | None = None,
+        cache_vary_by: CacheVaryBy | None = None,
         dependencies: Dependencies | None = None,
         dto: type[DTOInterface] | None | EmptyType = Empty,
         etag: ETag | None = None,
@@ -908,6 +1001,7 @@ class put(HTTPRouteHandler):
         middleware: list[Middleware] | None = None,
         name: str | None = None,
         opt: dict[str, Any] | None = None,
+        request_max_body_size: int | None | EmptyType = Empty,
         response_class: ResponseType | None = None,
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
@@ -948,12 +1042,20 @@ class put(HTTPRouteHandler):
             before_request: A sync or async function called immediately before calling the route handler. Receives
                 the :class:`.connection.Request` instance and any non-``None`` return value is used for the response,
                 bypassing the route handler.
+            body_etag: If ``True``, an ``etag`` header derived from a hash of the response body is added to responses
+                that do not have one, and ``GET`` and ``HEAD`` requests whose ``If-None-Match`` header matches it
+                receive a ``304 - Not Modified`` response without body.
             cache: Enables response caching if configured on the application level. Valid values are ``True`` or a number
                 of seconds (e.g. ``120``) to cache the response.
             cache_control: A ``cache-control`` header of type
                 :class:`CacheControlHeader <.datastructures.CacheControlHeader>` that will be added to the response.
             cache_key_builder: A :class:`cache-key builder function <.types.CacheKeyBuilder>`. Allows for customization
                 of the cache key if caching is configured on the application level.
+            cache_tags: Tags to attach to cached responses, which allow invalidating them with
+                :meth:`Litestar.invalidate_cached_responses <.app.Litestar.invalidate_cached_responses>`. Tags are
+                formatted with the path parameters of the request, e.g. ``"user:{user_id}"``.
+            cache_vary_by: A :class:`CacheVaryBy <.config.response_cache.CacheVaryBy>` instance declaring the request
+                headers, cookies and authentication that cached responses vary by.
             dependencies: A string keyed mapping of dependency :class:`Provider <.di.Provide>` instances.
             dto: :class:`DTOInterface <.dto.interface.DTOInterface>` to use for (de)serializing and
                 validation of request data.
@@ -969,6 +1071,8 @@ class put(HTTPRouteHandler):
             name: A string identifying the route handler.
             opt: A string keyed mapping of arbitrary values that can be accessed in :class:`Guards <.types.Guard>` or
                 wherever you have access to :class:`Request <.connection.Request>` or :class:`ASGI Scope <.types.Scope>`.
+            request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+                '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
             response_class: A custom subclass of :class:`Response <.response.Response>` to be used as route handler's
                 default response.
             response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>` instances.
@@ -1007,9 +1111,12 @@ class put(HTTPRouteHandler):
             after_response=after_response,
             background=background,
             before_request=before_request,
+            body_etag=body_etag,
             cache=cache,
             cache_control=cache_control,
             cache_key_builder=cache_key_builder,
+            cache_tags=cache_tags,
+            cache_vary_by=cache_vary_by,
             content_encoding=content_encoding,
             content_media_type=content_media_type,
             dependencies=dependencies,
@@ -1029,6 +1136,7 @@ class put(HTTPRouteHandler):
             opt=opt,
             path=path,
             raises=raises,
+            request_max_body_size=request_max_body_size,
             response_class=response_class,
             response_cookies=response_cookies,
             response_description=response_description,
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING, Pattern
+from typing import TYPE_CHECKING, Any, Mapping, Pattern
 
 from litestar.exceptions import ImproperlyConfiguredException
 
-__all__ = ("build_exclude_path_pattern", "should_bypass_middleware")
+__all__ = ("build_exclude_path_pattern", "resolve_middleware_bypass", "should_bypass_middleware")
 
 
 if TYPE_CHECKING:
+    from litestar.enums import ScopeType
     from litestar.types import Scope, Scopes
 
 
@@ -63,3 +64,52 @@ def should_bypass_middleware(
             scope["raw_path"].decode() if getattr(scope.get("route_handler", {}), "is_mount", False) else scope["path"]
         )
     )
+
+
+def resolve_middleware_bypass(
+    *,
+    scope_type: ScopeType | None,
+    path: str | None,
+    opt: Mapping[str, Any],
+    scopes: Scopes,
+    exclude_opt_key: str | None = None,
+    exclude_path_pattern: Pattern | None = None,
+) -> bool | None:
+    """Determine whether a middleware is bypassed for a route, using only what is known when the route is registered.
+
+    This mirrors :func:`should_bypass_middleware`, but is evaluated once per route instead of once per request.
+
+    Args:
+        scope_type: The scope type the route receives, or ``None`` if it may receive both ``http`` and ``websocket``
+            scopes.
+        path: The path ``scope["path"]`` will be set to for the route, or ``None`` if it depends on the request, e.g.
+            for routes with path parameters and mount routes.
+        opt: The ``opt`` dictionary of the route handler.
+        scopes: A set with the ASGI scope types that are supported by the middleware.
+        exclude_opt_key: Key in ``opt`` with which a route handler can "opt-out" of a middleware.
+        exclude_path_pattern: If this pattern matches scope["path"], the middleware should be bypassed.
+
+    Returns:
+        ``True`` if the middleware is always bypassed for the route, ``False`` if it never is, or ``None`` if this can
+        only be determined per request.
+    """
+    if exclude_opt_key and opt.get(exclude_opt_key):
+        return True
+
+    if scope_type is not None:
+        if scope_type not in scopes:
+            return True
+        scope_resolved = True
+    else:
+        handled_scopes = {"http", "websocket"}.intersection(scopes)
+        if not handled_scopes:
+            return True
+        scope_resolved = len(handled_scopes) == 2
+
+    if exclude_path_pattern:
+        if path is None:
+            return None
+        if exclude_path_pattern.findall(path):
+            return True
+
+    return False if scope_resolved else None
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Any, Callable, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Protocol, runtime_checkable
 
 from litestar.enums import ScopeType
 from litestar.middleware._utils import (
     build_exclude_path_pattern,
+    resolve_middleware_bypass,
     should_bypass_middleware,
 )
 
@@ -87,6 +88,7 @@ class AbstractMiddleware:
     scopes: Scopes = {ScopeType.HTTP, ScopeType.WEBSOCKET}
     exclude: str | list[str] | None = None
     exclude_opt_key: str | None = None
+    _bypass_resolved: bool = False
 
     def __init__(
         self,
@@ -118,7 +120,7 @@ class AbstractMiddleware:
         original__call__ = cls.__call__
 
         async def wrapped_call(self: AbstractMiddleware, scope: Scope, receive: Receive, send: Send) -> None:
-            if should_bypass_middleware(
+            if not self._bypass_resolved and should_bypass_middleware(
                 scope=scope,
                 scopes=self.scopes,
                 exclude_path_pattern=self.exclude_pattern,
@@ -131,6 +133,33 @@ class AbstractMiddleware:
         # https://github.com/python/mypy/issues/2427#issuecomment-384229898
         setattr(cls, "__call__", wrapped_call)
 
+    def resolve_bypass(self, scope_type: ScopeType | None, path: str | None, opt: Mapping[str, Any]) -> bool | None:
+        """Determine whether the middleware is bypassed for the route it is being built for.
+
+        This is called once when the middleware stack of a route is built. If the middleware is never bypassed for the
+        route, the per-request check is skipped from then on.
+
+        Args:
+            scope_type: The scope type the route receives, or ``None`` if it may receive both ``http`` and
+                ``websocket`` scopes.
+            path: The path ``scope["path"]`` will be set to for the route, or ``None`` if it depends on the request.
+            opt: The ``opt`` dictionary of the route handler.
+
+        Returns:
+            ``True`` if the middleware is always bypassed for the route, ``False`` if it never is, or ``None`` if this
+            can only be determined per request.
+        """
+        bypass = resolve_middleware_bypass(
+            scope_type=scope_type,
+            path=path,
+            opt=opt,
+            scopes=self.scopes,
+            exclude_opt_key=self.exclude_opt_key,
+            exclude_path_pattern=self.exclude_pattern,
+        )
+        self._bypass_resolved = bypass is False
+        return bypass
+
     @abstractmethod
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Execute the ASGI middleware.
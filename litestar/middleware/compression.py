@@ -1,21 +1,26 @@
 from __future__ import annotations
 
-from gzip import GzipFile
-from io import BytesIO
-from typing import TYPE_CHECKING, Any, Literal, Optional
+import zlib
+from typing import TYPE_CHECKING, Any, Literal, Sequence
 
-from litestar.constants import SCOPE_STATE_RESPONSE_COMPRESSED
-from litestar.datastructures import Headers, MutableScopeHeaders
+from anyio.to_thread import run_sync
+
+from litestar.constants import SCOPE_STATE_COMPRESSION_ENCODING, SCOPE_STATE_RESPONSE_COMPRESSED
+from litestar.datastructures import AcceptEncoding, Headers, MutableScopeHeaders
 from litestar.enums import CompressionEncoding, ScopeType
 from litestar.exceptions import MissingDependencyException
 from litestar.middleware.base import AbstractMiddleware
-from litestar.utils import Ref, set_litestar_scope_state
+from litestar.status_codes import HTTP_206_PARTIAL_CONTENT
+from litestar.utils import set_litestar_scope_state
 
-__all__ = ("CompressionFacade", "CompressionMiddleware")
+__all__ = ("BACKEND_ENCODINGS", "CompressionFacade", "CompressionMiddleware", "compress_response")
 
 
 if TYPE_CHECKING:
+    from zlib import _Compress
+
     from litestar.config.compression import CompressionConfig
+    from litestar.response.base import ASGIResponse
     from litestar.types import (
         ASGIApp,
         HTTPResponseStartEvent,
@@ -30,23 +35,37 @@ if TYPE_CHECKING:
     except ImportError:
         Compressor = Any
 
+    try:
+        from zstandard import ZstdCompressionObj
+    except ImportError:
+        ZstdCompressionObj = Any
+
+
+BACKEND_ENCODINGS = {
+    "brotli": CompressionEncoding.BROTLI,
+    "gzip": CompressionEncoding.GZIP,
+    "zstd": CompressionEncoding.ZSTD,
+}
+"""The content codings produced by the compression backends."""
+
 
 class CompressionFacade:
-    """A unified facade offering a uniform interface for different compression libraries."""
+    """A unified facade offering a uniform interface for different compression libraries.
+
+    Data is compressed incrementally, so that each chunk of a streamed body can be sent as soon as it is compressed.
+    """
 
-    __slots__ = ("compressor", "buffer", "compression_encoding")
+    __slots__ = ("compressor", "compression_encoding")
 
-    compressor: GzipFile | Compressor  # pyright: ignore
+    compressor: _Compress | Compressor | ZstdCompressionObj  # pyright: ignore
 
-    def __init__(self, buffer: BytesIO, compression_encoding: CompressionEncoding, config: CompressionConfig) -> None:
+    def __init__(self, compression_encoding: CompressionEncoding, config: CompressionConfig) -> None:
         """Initialize ``CompressionFacade``.
 
         Args:
-            buffer: A bytes IO buffer to write the compressed data into.
             compression_encoding: The compression encoding used.
             config: The app compression config.
         """
-        self.buffer = buffer
         self.compression_encoding = compression_encoding
 
         if compression_encoding == CompressionEncoding.BROTLI:
@@ -68,35 +87,236 @@ class CompressionFacade:
                 lgwin=config.brotli_lgwin,
                 lgblock=config.brotli_lgblock,
             )
+        elif compression_encoding == CompressionEncoding.ZSTD:
+            try:
+                import zstandard
+            except ImportError as e:
+                raise MissingDependencyException("zstandard", "zstd") from e
+
+            self.compressor = zstandard.ZstdCompressor(level=config.zstd_level).compressobj()
         else:
-            self.compressor = GzipFile(mode="wb", fileobj=buffer, compresslevel=config.gzip_compress_level)
+            # a window size offset of 16 produces a gzip header and trailer
+            self.compressor = zlib.compressobj(config.gzip_compress_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
 
-    def write(self, body: bytes) -> None:
-        """Write compressed bytes.
+    def compress(self, body: bytes, flush: bool = True) -> bytes:
+        """Compress a chunk of the body.
 
         Args:
             body: Message body to process
+            flush: Whether to flush the compressor, so that the returned data contains all of ``body``. Otherwise, the
+                compressor may hold back data to compress it together with the next chunks.
 
         Returns:
-            None
+            The compressed data.
         """
-
         if self.compression_encoding == CompressionEncoding.BROTLI:
-            self.buffer.write(self.compressor.process(body) + self.compressor.flush())  # type: ignore
-        else:
-            self.compressor.write(body)
-            self.compressor.flush()
+            data = self.compressor.process(body)  # type: ignore[union-attr]
+            return data + self.compressor.flush() if flush else data  # type: ignore[union-attr]
+
+        if self.compression_encoding == CompressionEncoding.ZSTD:
+            from zstandard import COMPRESSOBJ_FLUSH_BLOCK
+
+            data = self.compressor.compress(body)  # type: ignore[union-attr]
+            return data + self.compressor.flush(COMPRESSOBJ_FLUSH_BLOCK) if flush else data  # type: ignore[union-attr]
+
+        data = self.compressor.compress(body)  # type: ignore[union-attr]
+        return data + self.compressor.flush(zlib.Z_SYNC_FLUSH) if flush else data  # type: ignore[union-attr]
 
-    def close(self) -> None:
+    def finish(self) -> bytes:
         """Close the compression stream.
 
         Returns:
-            None
+            The remaining compressed data.
         """
         if self.compression_encoding == CompressionEncoding.BROTLI:
-            self.buffer.write(self.compressor.finish())  # type: ignore
+            return self.compressor.finish()  # type: ignore[union-attr,no-any-return]
+        return self.compressor.flush()  # type: ignore[union-attr]
+
+
+def _is_excluded_media_type(content_type: str | None, exclude_media_types: Sequence[str]) -> bool:
+    if not content_type or not exclude_media_types:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return any(
+        media_type == excluded or (excluded.endswith("/*") and media_type.startswith(excluded[:-1]))
+        for excluded in exclude_media_types
+    )
+
+
+def _compress(facade: CompressionFacade, body: bytes, flush: bool, finish: bool) -> bytes:
+    if finish:
+        return facade.compress(body, flush=False) + facade.finish()
+    return facade.compress(body, flush=flush)
+
+
+async def _compress_chunk(
+    facade: CompressionFacade, body: bytes, config: CompressionConfig, flush: bool = True, finish: bool = False
+) -> bytes:
+    if config.offload_minimum_size is not None and len(body) >= config.offload_minimum_size:
+        # large bodies are compressed in a worker thread, since the compressors release the GIL
+        return await run_sync(_compress, facade, body, flush, finish)
+    return _compress(facade, body, flush, finish)
+
+
+async def compress_response(
+    response: ASGIResponse, compression_encoding: CompressionEncoding, config: CompressionConfig
+) -> bool:
+    """Compress the body of a response in place, as the compression middleware does when it is sent.
+
+    This allows storing the compressed variants of responses in the response cache, so that the compression middleware
+    passes them through as they are when they are served from it.
+
+    Args:
+        response: The response to compress.
+        compression_encoding: The compression encoding to use.
+        config: The app compression config.
+
+    Returns:
+        Whether the response has been compressed. Responses that are smaller than the ``minimum_size``, have an
+        excluded media type or are encoded already are left as they are.
+    """
+    headers = MutableScopeHeaders({"headers": response.encoded_headers})  # type: ignore[typeddict-item]
+    if (
+        response.is_head_response
+        or response.status_code == HTTP_206_PARTIAL_CONTENT
+        or "content-encoding" in headers
+        or len(response.body) < config.minimum_size
+        or _is_excluded_media_type(headers.get("content-type"), config.exclude_media_types)
+    ):
+        return False
+
+    facade = CompressionFacade(compression_encoding=compression_encoding, config=config)
+    response.body = await _compress_chunk(facade, response.body, config, finish=True)
+    response.content_length = len(response.body)
+    headers["Content-Encoding"] = compression_encoding
+    headers["Content-Length"] = str(response.content_length)
+    headers.extend_header_value("vary", "Accept-Encoding")
+    return True
+
+
+class _CompressionSender:
+    """An ASGI send function compressing the body of a response."""
+
+    __slots__ = (
+        "compression_encoding",
+        "config",
+        "facade",
+        "initial_message",
+        "pending_body",
+        "scope",
+        "send",
+        "started",
+        "unflushed_size",
+    )
+
+    def __init__(
+        self, send: Send, compression_encoding: CompressionEncoding, scope: Scope, config: CompressionConfig
+    ) -> None:
+        self.send = send
+        self.compression_encoding = compression_encoding
+        self.scope = scope
+        self.config = config
+        # the compressor is only created once the response turns out to be compressed
+        self.facade: CompressionFacade | None = None
+        self.initial_message: HTTPResponseStartEvent | None = None
+        self.started = False
+        # the chunks of a stream that are held back until it is known whether it reaches the minimum size
+        self.pending_body = bytearray()
+        # the number of bytes compressed since the compressor was last flushed
+        self.unflushed_size = 0
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            await self._handle_start(message)
+        elif self.initial_message is None:
+            await self.send(message)
+        elif message["type"] == "http.response.body":
+            await self._handle_body(message["body"], message.get("more_body", False))
+
+    async def _handle_start(self, message: HTTPResponseStartEvent) -> None:
+        headers = MutableScopeHeaders(message)
+        # the content ranges refer to the uncompressed representation, so partial content is sent as is, as are
+        # responses that are encoded already, e.g. precompressed static files
+        if (
+            message["status"] == HTTP_206_PARTIAL_CONTENT
+            or "content-encoding" in headers
+            or _is_excluded_media_type(headers.get("content-type"), self.config.exclude_media_types)
+            or int(headers.get("content-length") or self.config.minimum_size) < self.config.minimum_size
+        ):
+            await self.send(message)
+            return
+        self.initial_message = message
+
+    async def _handle_body(self, body: bytes, more_body: bool) -> None:
+        if self.started:
+            await self._send_compressed_chunk(body, more_body)
+            return
+
+        if self.pending_body:
+            self.pending_body.extend(body)
+            body = bytes(self.pending_body)
+
+        if not more_body:
+            await self._send_complete_body(body)
+        elif (
+            # with the default flush policy, streams are compressed right away, so that the first chunks are not
+            # delayed, while the minimum size is known upfront for responses with a content length
+            self.config.flush_policy == "chunk"
+            or "content-length" in MutableScopeHeaders(self.initial_message)  # type: ignore[arg-type]
+            or len(body) >= self.config.minimum_size
+        ):
+            self.pending_body.clear()
+            await self._start_compressed_stream(body, more_body)
+        else:
+            self.pending_body[:] = body
+
+    async def _compress_chunk(self, body: bytes, flush: bool = True, finish: bool = False) -> bytes:
+        if self.facade is None:
+            self.facade = CompressionFacade(compression_encoding=self.compression_encoding, config=self.config)
+        return await _compress_chunk(self.facade, body, self.config, flush=flush, finish=finish)
+
+    async def _send_complete_body(self, body: bytes) -> None:
+        initial_message: HTTPResponseStartEvent = self.initial_message  # type: ignore[assignment]
+        if len(body) >= self.config.minimum_size:
+            body = await self._compress_chunk(body, finish=True)
+
+            headers = MutableScopeHeaders(initial_message)
+            headers["Content-Encoding"] = self.compression_encoding
+            headers["Content-Length"] = str(len(body))
+            headers.extend_header_value("vary", "Accept-Encoding")
+            set_litestar_scope_state(self.scope, SCOPE_STATE_RESPONSE_COMPRESSED, True)
+
+        await self.send(initial_message)
+        await self.send({"type": "http.response.body", "body": body, "more_body": False})
+
+    async def _start_compressed_stream(self, body: bytes, more_body: bool) -> None:
+        initial_message: HTTPResponseStartEvent = self.initial_message  # type: ignore[assignment]
+        headers = MutableScopeHeaders(initial_message)
+        headers["Content-Encoding"] = self.compression_encoding
+        headers.extend_header_value("vary", "Accept-Encoding")
+        del headers["Content-Length"]
+        set_litestar_scope_state(self.scope, SCOPE_STATE_RESPONSE_COMPRESSED, True)
+        self.started = True
+
+        await self.send(initial_message)
+        await self._send_compressed_chunk(body, more_body)
+
+    async def _send_compressed_chunk(self, body: bytes, more_body: bool) -> None:
+        if not more_body:
+            data = await self._compress_chunk(body, finish=True)
+        elif self.config.flush_policy == "chunk":
+            data = await self._compress_chunk(body)
+        elif self.config.flush_policy == "size":
+            self.unflushed_size += len(body)
+            flush = self.unflushed_size >= self.config.flush_size
+            if flush:
+                self.unflushed_size = 0
+            data = await self._compress_chunk(body, flush=flush)
         else:
-            self.compressor.close()
+            data = await self._compress_chunk(body, flush=False)
+
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
 
 
 class CompressionMiddleware(AbstractMiddleware):
@@ -116,6 +336,7 @@ class CompressionMiddleware(AbstractMiddleware):
             app=app, exclude=config.exclude, exclude_opt_key=config.exclude_opt_key, scopes={ScopeType.HTTP}
         )
         self.config = config
+        self._encodings = tuple(BACKEND_ENCODINGS[backend] for backend in config.backends)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """ASGI callable.
@@ -128,26 +349,16 @@ class CompressionMiddleware(AbstractMiddleware):
         Returns:
             None
         """
-        accept_encoding = Headers.from_scope(scope).get("accept-encoding", "")
-
-        if CompressionEncoding.BROTLI in accept_encoding and self.config.backend == "brotli":
-            await self.app(
-                scope,
-                receive,
-                self.create_compression_send_wrapper(
-                    send=send, compression_encoding=CompressionEncoding.BROTLI, scope=scope
-                ),
-            )
-            return
+        accept_encoding = AcceptEncoding(Headers.from_scope(scope).get("accept-encoding", ""))
 
-        if CompressionEncoding.GZIP in accept_encoding and (
-            self.config.backend == "gzip" or self.config.brotli_gzip_fallback
-        ):
+        if compression_encoding := accept_encoding.best_match(self._encodings):
+            # the response cache stores the responses it serves compressed with this encoding
+            set_litestar_scope_state(scope, SCOPE_STATE_COMPRESSION_ENCODING, compression_encoding)
             await self.app(
                 scope,
                 receive,
                 self.create_compression_send_wrapper(
-                    send=send, compression_encoding=CompressionEncoding.GZIP, scope=scope
+                    send=send, compression_encoding=CompressionEncoding(compression_encoding), scope=scope
                 ),
             )
             return
@@ -157,10 +368,10 @@ class CompressionMiddleware(AbstractMiddleware):
     def create_compression_send_wrapper(
         self,
         send: Send,
-        compression_encoding: Literal[CompressionEncoding.BROTLI, CompressionEncoding.GZIP],
+        compression_encoding: CompressionEncoding,
         scope: Scope,
     ) -> Send:
-        """Wrap ``send`` to handle brotli compression.
+        """Wrap ``send`` to handle compression.
 
         Args:
             send: The ASGI send function.
@@ -170,76 +381,10 @@ class CompressionMiddleware(AbstractMiddleware):
         Returns:
             An ASGI send function.
         """
-        bytes_buffer = BytesIO()
-        facade = CompressionFacade(buffer=bytes_buffer, compression_encoding=compression_encoding, config=self.config)
-
-        initial_message = Ref[Optional["HTTPResponseStartEvent"]](None)
-        started = Ref[bool](False)
-
-        async def send_wrapper(message: Message) -> None:
-            """Handle and compresses the HTTP Message with brotli.
-
-            Args:
-                message (Message): An ASGI Message.
-            """
-
-            if message["type"] == "http.response.start":
-                initial_message.value = message
-                return
-
-            if initial_message.value and message["type"] == "http.response.body":
-                body = message["body"]
-                more_body = message.get("more_body")
-
-                if not started.value:
-                    started.value = True
-                    if more_body:
-                        headers = MutableScopeHeaders(initial_message.value)
-                        headers["Content-Encoding"] = compression_encoding
-                        headers.extend_header_value("vary", "Accept-Encoding")
-                        del headers["Content-Length"]
-                        set_litestar_scope_state(scope, SCOPE_STATE_RESPONSE_COMPRESSED, True)
-
-                        facade.write(body)
-
-                        message["body"] = bytes_buffer.getvalue()
-                        bytes_buffer.seek(0)
-                        bytes_buffer.truncate()
-                        await send(initial_message.value)
-                        await send(message)
-
-                    elif len(body) >= self.config.minimum_size:
-                        facade.write(body)
-                        facade.close()
-                        body = bytes_buffer.getvalue()
-
-                        headers = MutableScopeHeaders(initial_message.value)
-                        headers["Content-Encoding"] = compression_encoding
-                        headers["Content-Length"] = str(len(body))
-                        headers.extend_header_value("vary", "Accept-Encoding")
-                        message["body"] = body
-                        set_litestar_scope_state(scope, SCOPE_STATE_RESPONSE_COMPRESSED, True)
-
-                        await send(initial_message.value)
-                        await send(message)
-
-                    else:
-                        await send(initial_message.value)
-                        await send(message)
-
-                else:
-                    facade.write(body)
-                    if not more_body:
-                        facade.close()
-
-                    message["body"] = bytes_buffer.getvalue()
-
-                    bytes_buffer.seek(0)
-                    bytes_buffer.truncate()
-
-                    if not more_body:
-                        bytes_buffer.close()
-
-                    await send(message)
+        if (extensions := scope.get("extensions")) and "http.response.zerocopysend" in extensions:
+            # the body of a file response has to be read to be compressed, so it cannot be sent by the server
+            scope["extensions"] = {
+                name: value for name, value in extensions.items() if name != "http.response.zerocopysend"
+            }
 
-        return send_wrapper
+        return _CompressionSender(send=send, compression_encoding=compression_encoding, scope=scope, config=self.config)
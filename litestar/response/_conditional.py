@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import re
+from email.utils import parsedate_to_datetime
+from hashlib import blake2b
+from typing import TYPE_CHECKING
+
+from litestar.response.base import ASGIResponse
+from litestar.response.streaming import ASGIStreamingResponse
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+
+if TYPE_CHECKING:
+    from litestar.types import ASGIApp, Scope
+
+__all__ = (
+    "add_body_etag",
+    "create_not_modified_response",
+    "is_not_modified",
+    "respond_conditionally",
+)
+
+
+_ETAG_RE = re.compile(rb'(?:W/)?("[^"]*")')
+# headers a 304 response must carry if the 200 response would have, see RFC 9110, section 15.4.5. ``last-modified``
+# is kept as well, for caches validating responses without an ``etag``
+_NOT_MODIFIED_HEADERS = frozenset(
+    (b"cache-control", b"content-location", b"date", b"etag", b"expires", b"last-modified", b"vary")
+)
+
+
+def _etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """Compare the ``etag`` of a response with the entity tags of an ``If-None-Match`` header, using the weak comparison
+    function required for ``If-None-Match``.
+    """
+    if if_none_match.strip() == b"*":
+        return True
+    if etag.startswith(b"W/"):
+        etag = etag[2:]
+    return etag in _ETAG_RE.findall(if_none_match)
+
+
+def _is_modified_since(last_modified: bytes, if_modified_since: bytes) -> bool:
+    try:
+        return parsedate_to_datetime(last_modified.decode("latin-1")) > parsedate_to_datetime(
+            if_modified_since.decode("latin-1")
+        )
+    except (TypeError, ValueError):
+        # invalid dates are ignored, see RFC 9110, section 13.1.3
+        return True
+
+
+def is_not_modified(scope: Scope, encoded_headers: list[tuple[bytes, bytes]]) -> bool:
+    """Evaluate the ``If-None-Match`` and ``If-Modified-Since`` headers of a request against the validators of a
+    response, i.e. its ``etag`` and ``last-modified`` headers.
+
+    As specified by RFC 9110, section 13.2.2, only ``GET`` and ``HEAD`` requests are evaluated, and
+    ``If-Modified-Since`` is ignored if the request has an ``If-None-Match`` header.
+
+    Args:
+        scope: The ASGI connection scope.
+        encoded_headers: The encoded headers of the response.
+
+    Returns:
+        Whether the response can be replaced with a ``304 - Not Modified`` response.
+    """
+    if scope["method"] not in {"GET", "HEAD"}:
+        return False
+
+    if_none_match: bytes | None = None
+    if_modified_since: bytes | None = None
+    for name, value in scope["headers"]:
+        if name == b"if-none-match":
+            if_none_match = value if if_none_match is None else if_none_match + b"," + value
+        elif name == b"if-modified-since":
+            if_modified_since = value
+
+    if if_none_match is None and if_modified_since is None:
+        return False
+
+    etag: bytes | None = None
+    last_modified: bytes | None = None
+    for name, value in encoded_headers:
+        if name == b"etag":
+            etag = value
+        elif name == b"last-modified":
+            last_modified = value
+
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+    if if_modified_since is not None and last_modified is not None:
+        return not _is_modified_since(last_modified, if_modified_since)
+    return False
+
+
+def create_not_modified_response(response: ASGIResponse) -> ASGIResponse:
+    """Create a ``304 - Not Modified`` response in place of a response.
+
+    Args:
+        response: The response the client has a valid copy of.
+
+    Returns:
+        An :class:`ASGIResponse <.response.ASGIResponse>` without body, carrying the validators and caching headers of
+        ``response``, as well as its background tasks.
+    """
+    not_modified_response = ASGIResponse.__new__(ASGIResponse)
+    not_modified_response.background = response.background
+    not_modified_response.body = b""
+    not_modified_response.content_length = 0
+    not_modified_response.encoded_headers = [
+        (name, value) for name, value in response.encoded_headers if name in _NOT_MODIFIED_HEADERS
+    ]
+    not_modified_response.encoding = response.encoding
+    not_modified_response.is_head_response = response.is_head_response
+    not_modified_response.status_code = HTTP_304_NOT_MODIFIED
+    return not_modified_response
+
+
+def add_body_etag(response: ASGIApp) -> None:
+    """Add an ``etag`` header, derived from a hash of its body, to a response that does not have one.
+
+    Streaming responses, whose bodies are not known in advance, and ``HEAD`` responses, which do not have a body, are
+    left as they are.
+
+    Args:
+        response: A response returned by a route handler.
+    """
+    if (
+        not isinstance(response, ASGIResponse)
+        or isinstance(response, ASGIStreamingResponse)
+        or response.is_head_response
+        or response.status_code != HTTP_200_OK
+        or any(name == b"etag" for name, _ in response.encoded_headers)
+    ):
+        return
+    etag = blake2b(response.body, digest_size=16).hexdigest()
+    response.encoded_headers.append((b"etag", f'"{etag}"'.encode("ascii")))
+
+
+def respond_conditionally(scope: Scope, response: ASGIApp) -> ASGIApp:
+    """Replace a response with a ``304 - Not Modified`` response if the request's conditional headers match it.
+
+    Args:
+        scope: The ASGI connection scope.
+        response: A response returned by a route handler.
+
+    Returns:
+        The response, or a ``304 - Not Modified`` response in its place.
+    """
+    if (
+        isinstance(response, ASGIResponse)
+        and response.status_code == HTTP_200_OK
+        and is_not_modified(scope, response.encoded_headers)
+    ):
+        return create_not_modified_response(response)
+    return response
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import re
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from litestar.types import Scope
+
+__all__ = ("get_requested_ranges",)
+
+
+_RANGE_SPEC_RE = re.compile(r"(\d*)-(\d*)", re.ASCII)
+# requests for more ranges than this, after overlapping ranges have been merged, are answered with the whole
+# representation, so that a request cannot make the server send a part for each of a large number of tiny ranges
+MAX_RANGES = 100
+
+
+def _parse_ranges(range_header: str, size: int) -> list[tuple[int, int]] | None:
+    """Parse the value of a ``Range`` header, see RFC 9110, section 14.1.
+
+    Args:
+        range_header: The value of the header.
+        size: The size of the representation in bytes.
+
+    Returns:
+        The satisfiable ranges, as tuples of their first and last byte positions, sorted and with overlapping ranges
+        merged, or ``None`` if the header is invalid or uses a unit other than ``bytes``, in which case it is ignored.
+    """
+    unit, _, range_set = range_header.partition("=")
+    if unit.strip().lower() != "bytes":
+        return None
+
+    ranges: list[tuple[int, int]] = []
+    has_specs = False
+    for spec in range_set.split(","):
+        if not (spec := spec.strip()):
+            continue
+        if not (match := _RANGE_SPEC_RE.fullmatch(spec)):
+            return None
+
+        has_specs = True
+        first, last = match.groups()
+        if not first:
+            if not last:
+                return None
+            # a suffix range, i.e. the last ``last`` bytes
+            if (suffix_length := int(last)) and size:
+                ranges.append((max(size - suffix_length, 0), size - 1))
+            continue
+
+        start = int(first)
+        if last and int(last) < start:
+            return None
+        if start < size:
+            ranges.append((start, min(int(last), size - 1) if last else size - 1))
+
+    if not has_specs:
+        return None
+
+    merged = _merge_ranges(ranges)
+    return None if len(merged) > MAX_RANGES else merged
+
+
+def _merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Sort ranges and merge those that overlap or are adjacent.
+
+    Args:
+        ranges: Ranges, as tuples of their first and last byte positions.
+
+    Returns:
+        The sorted and merged ranges.
+    """
+    ranges.sort()
+    merged: list[tuple[int, int]] = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _if_range_matches(if_range: str, etag: bytes | None, last_modified: bytes | None) -> bool:
+    """Evaluate an ``If-Range`` header, see RFC 9110, section 13.1.5.
+
+    Entity tags are compared with the strong comparison function, so weak entity tags never match. Dates must match the
+    ``last-modified`` header exactly.
+    """
+    if if_range.startswith('"'):
+        return etag is not None and not etag.startswith(b"W/") and if_range.encode("latin-1") == etag
+    if if_range.startswith("W/") or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(if_range) == parsedate_to_datetime(last_modified.decode("latin-1"))
+    except (TypeError, ValueError):
+        return False
+
+
+def get_requested_ranges(
+    scope: Scope, encoded_headers: list[tuple[bytes, bytes]], size: int
+) -> list[tuple[int, int]] | None:
+    """Get the byte ranges of a representation requested with a ``Range`` header.
+
+    Only ``GET`` requests are evaluated. The ``Range`` header is ignored if it is invalid, or if the request has an
+    ``If-Range`` header that does not match the validators of the representation, i.e. its ``etag`` and
+    ``last-modified`` headers.
+
+    Args:
+        scope: The ASGI connection scope.
+        encoded_headers: The encoded headers of the response.
+        size: The size of the representation in bytes.
+
+    Returns:
+        The requested ranges, as tuples of their first and last byte positions, an empty list if none of them can be
+        satisfied, or ``None`` if the whole representation should be sent.
+    """
+    if scope["method"] != "GET":
+        return None
+
+    range_header: bytes | None = None
+    if_range: bytes | None = None
+    for name, value in scope["headers"]:
+        if name == b"range":
+            range_header = value
+        elif name == b"if-range":
+            if_range = value
+
+    if range_header is None:
+        return None
+
+    if if_range is not None:
+        etag = next((value for name, value in encoded_headers if name == b"etag"), None)
+        last_modified = next((value for name, value in encoded_headers if name == b"last-modified"), None)
+        if not _if_range_matches(if_range.decode("latin-1").strip(), etag, last_modified):
+            return None
+
+    return _parse_ranges(range_header.decode("latin-1"), size)
@@ -3,15 +3,20 @@ from __future__ import annotations
 from email.utils import formatdate
 from inspect import iscoroutine
 from mimetypes import encodings_map, guess_type
+from secrets import token_hex
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Coroutine, Literal, cast
 from urllib.parse import quote
 from zlib import adler32
 
 from litestar.constants import ONE_MEGABYTE
+from litestar.enums import MediaType
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.file_system import BaseLocalFileSystem, FileSystemAdapter
-from litestar.response.base import Response
+from litestar.response._conditional import create_not_modified_response, is_not_modified
+from litestar.response._ranges import get_requested_ranges
+from litestar.response.base import ASGIResponse, Response
 from litestar.response.streaming import ASGIStreamingResponse
+from litestar.status_codes import HTTP_200_OK, HTTP_206_PARTIAL_CONTENT, HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
 from litestar.utils.helpers import filter_cookies, get_enum_string_value
 
 if TYPE_CHECKING:
@@ -25,13 +30,14 @@ if TYPE_CHECKING:
     from litestar.connection import Request
     from litestar.datastructures.cookie import Cookie
     from litestar.datastructures.headers import ETag
-    from litestar.enums import MediaType
     from litestar.types import (
         HTTPResponseBodyEvent,
+        HTTPResponseZeroCopySendEvent,
         PathType,
         Receive,
         ResponseCookies,
         ResponseHeaders,
+        Scope,
         Send,
         TypeEncodersMap,
     )
@@ -41,6 +47,7 @@ __all__ = (
     "ASGIFileResponse",
     "File",
     "async_file_iterator",
+    "async_file_ranges_iterator",
     "create_etag_for_file",
 )
 
@@ -67,6 +74,43 @@ async def async_file_iterator(
             yield chunk
 
 
+async def async_file_ranges_iterator(
+    file_path: PathType,
+    chunk_size: int,
+    adapter: FileSystemAdapter,
+    ranges: list[tuple[int, int]],
+    part_headers: list[bytes],
+    closing_delimiter: bytes,
+) -> AsyncGenerator[bytes, None]:
+    """Return an async generator that asynchronously reads byte ranges of a file and yields their chunks.
+
+    Args:
+        file_path: A path to a file.
+        chunk_size: The chunk size to use.
+        adapter: File system adapter class.
+        ranges: The ranges to read, as tuples of their first and last byte positions.
+        part_headers: The delimiters and headers of the parts of a ``multipart/byteranges`` body, preceding each
+            range, or an empty list if a single range is read.
+        closing_delimiter: The delimiter closing a ``multipart/byteranges`` body.
+
+    Returns:
+        An async generator.
+    """
+    async with await adapter.open(file_path) as file:
+        for index, (start, end) in enumerate(ranges):
+            if part_headers:
+                yield part_headers[index]
+            await file.seek(start)
+            remaining = end - start + 1
+            while remaining and (chunk := await file.read(min(chunk_size, remaining))):
+                remaining -= len(chunk)
+                yield chunk
+            if part_headers:
+                yield b"\r\n"
+        if closing_delimiter:
+            yield closing_delimiter
+
+
 def create_etag_for_file(path: PathType, modified_time: float, file_size: int) -> str:
     """Create an etag.
 
@@ -148,6 +192,11 @@ class ASGIFileResponse(ASGIStreamingResponse):
         self.chunk_size = chunk_size
         self.etag = etag
         self.file_path = file_path
+        self._file_headers_set = False
+        self._ranges: list[tuple[int, int]] = []
+        self._part_headers: list[bytes] = []
+        self._closing_delimiter = b""
+        self._zerocopysend = False
 
         if file_info:
             self.file_info: FileInfo | Coroutine[Any, Any, FileInfo] = file_info
@@ -159,6 +208,9 @@ class ASGIFileResponse(ASGIStreamingResponse):
     async def send_body(self, send: Send, receive: Receive) -> None:
         """Emit a stream of events correlating with the response body.
 
+        If the server supports the ``http.response.zerocopysend`` extension, and the file has an underlying OS file
+        descriptor, the file is passed to the server to be sent with ``os.sendfile``, instead of being read in chunks.
+
         Args:
             send: The ASGI send function.
             receive: The ASGI receive function.
@@ -166,7 +218,10 @@ class ASGIFileResponse(ASGIStreamingResponse):
         Returns:
             None
         """
-        if self.chunk_size < self.content_length:
+        if self._zerocopysend and self.content_length and await self._send_zerocopy(send):
+            return
+
+        if self.chunk_size < self.content_length or self.status_code == HTTP_206_PARTIAL_CONTENT:
             await super().send_body(send=send, receive=receive)
             return
 
@@ -178,15 +233,142 @@ class ASGIFileResponse(ASGIStreamingResponse):
             }
             await send(body_event)
 
-    async def start_response(self, send: Send) -> None:
-        """Emit the start event of the response. This event includes the headers and status codes.
+    async def _send_zerocopy(self, send: Send) -> bool:
+        """Send the file, or the requested ranges of it, as ``http.response.zerocopysend`` events.
+
+        Args:
+            send: The ASGI send function.
+
+        Returns:
+            ``False`` if the file has no underlying OS file descriptor, e.g. because it is opened through a file
+            system other than the local one, in which case nothing has been sent.
+        """
+        async with await self.adapter.open(self.file_path) as file:
+            try:
+                file.wrapped.fileno()
+            except (AttributeError, OSError):
+                return False
+
+            ranges = self._ranges or [(0, self.content_length - 1)]
+            for index, (start, end) in enumerate(ranges):
+                if self._part_headers:
+                    part_header_event: HTTPResponseBodyEvent = {
+                        "type": "http.response.body",
+                        "body": self._part_headers[index],
+                        "more_body": True,
+                    }
+                    await send(part_header_event)
+
+                zerocopysend_event: HTTPResponseZeroCopySendEvent = {
+                    "type": "http.response.zerocopysend",
+                    "file": file.wrapped,
+                    "offset": start,
+                    "count": end - start + 1,
+                    "more_body": bool(self._part_headers) or index < len(ranges) - 1,
+                }
+                await send(zerocopysend_event)
+
+                if self._part_headers:
+                    part_end_event: HTTPResponseBodyEvent = {
+                        "type": "http.response.body",
+                        "body": b"\r\n",
+                        "more_body": True,
+                    }
+                    await send(part_end_event)
+
+            if self._closing_delimiter:
+                closing_event: HTTPResponseBodyEvent = {
+                    "type": "http.response.body",
+                    "body": self._closing_delimiter,
+                    "more_body": False,
+                }
+                await send(closing_event)
+        return True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """ASGI callable of the ``ASGIFileResponse``.
+
+        ``GET`` and ``HEAD`` requests whose ``If-None-Match`` or ``If-Modified-Since`` headers match the file receive a
+        ``304 - Not Modified`` response instead, without the file being read. ``GET`` requests with a ``Range`` header
+        receive a ``206 - Partial Content`` response containing the requested ranges, as a ``multipart/byteranges``
+        body if there are several, or a ``416 - Range Not Satisfiable`` response if none of them can be satisfied.
 
         Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive function.
             send: The ASGI send function.
 
         Returns:
             None
         """
+        self._zerocopysend = "http.response.zerocopysend" in (scope.get("extensions") or {})
+
+        if self.status_code == HTTP_200_OK:
+            await self._set_file_headers()
+            if is_not_modified(scope, self.encoded_headers):
+                await create_not_modified_response(self)(scope, receive, send)
+                return
+
+            if (ranges := get_requested_ranges(scope, self.encoded_headers, self.content_length)) is not None:
+                if not ranges:
+                    await ASGIResponse(
+                        background=self.background,
+                        headers={"content-range": f"bytes */{self.content_length}"},
+                        media_type=MediaType.TEXT,
+                        status_code=HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                    )(scope, receive, send)
+                    return
+                self._set_ranges(ranges)
+
+        await super().__call__(scope, receive, send)
+
+    def _set_ranges(self, ranges: list[tuple[int, int]]) -> None:
+        size = self.content_length
+        headers = [(name, value) for name, value in self.encoded_headers if name != b"content-length"]
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            headers.append((b"content-range", f"bytes {start}-{end}/{size}".encode("ascii")))
+            part_headers: list[bytes] = []
+            closing_delimiter = b""
+            self.content_length = end - start + 1
+        else:
+            content_type = next(value for name, value in headers if name == b"content-type").decode("latin-1")
+            boundary = token_hex(16)
+            headers = [(name, value) for name, value in headers if name != b"content-type"]
+            headers.append((b"content-type", f"multipart/byteranges; boundary={boundary}".encode("ascii")))
+            part_headers = [
+                (
+                    f"--{boundary}\r\nContent-Type: {content_type}\r\n"
+                    f"Content-Range: bytes {start}-{end}/{size}\r\n\r\n"
+                ).encode("latin-1")
+                for start, end in ranges
+            ]
+            closing_delimiter = f"--{boundary}--".encode("ascii")
+            # each part is followed by a CRLF, which precedes the next delimiter
+            self.content_length = sum(
+                len(part_header) + end - start + 3 for part_header, (start, end) in zip(part_headers, ranges)
+            ) + len(closing_delimiter)
+
+        headers.append((b"content-length", str(self.content_length).encode("ascii")))
+        self.encoded_headers = headers
+        self.status_code = HTTP_206_PARTIAL_CONTENT
+        self._ranges = ranges
+        self._part_headers = part_headers
+        self._closing_delimiter = closing_delimiter
+        self.iterator = async_file_ranges_iterator(
+            file_path=self.file_path,
+            chunk_size=self.chunk_size,
+            adapter=self.adapter,
+            ranges=ranges,
+            part_headers=part_headers,
+            closing_delimiter=closing_delimiter,
+        )
+
+    async def _set_file_headers(self) -> None:
+        if self._file_headers_set:
+            return
+
         try:
             fs_info = self.file_info = cast(
                 "FileInfo", (await self.file_info if iscoroutine(self.file_info) else self.file_info)
@@ -199,6 +381,8 @@ class ASGIFileResponse(ASGIStreamingResponse):
 
         self.content_length = fs_info["size"]
         self.encoded_headers.append((b"content-length", str(self.content_length).encode("ascii")))
+        if self.status_code == HTTP_200_OK:
+            self.encoded_headers.append((b"accept-ranges", b"bytes"))
 
         self.encoded_headers.append((b"last-modified", formatdate(fs_info["mtime"], usegmt=True).encode("ascii")))
 
@@ -208,6 +392,18 @@ class ASGIFileResponse(ASGIStreamingResponse):
             etag = create_etag_for_file(path=self.file_path, modified_time=fs_info["mtime"], file_size=fs_info["size"])
             self.encoded_headers.append((b"etag", etag.encode("ascii")))
 
+        self._file_headers_set = True
+
+    async def start_response(self, send: Send) -> None:
+        """Emit the start event of the response. This event includes the headers and status codes.
+
+        Args:
+            send: The ASGI send function.
+
+        Returns:
+            None
+        """
+        await self._set_file_headers()
         await super().start_response(send=send)
 
 
@@ -12,7 +12,7 @@ from litestar.handlers.http_handlers import HTTPRouteHandler
 from litestar.handlers.websocket_handlers import WebsocketListener, WebsocketRouteHandler
 from litestar.routes import ASGIRoute, HTTPRoute, WebSocketRoute
 from litestar.types.empty import Empty
-from litestar.utils import find_index, is_class_and_subclass, join_paths, normalize_path, unique
+from litestar.utils import is_class_and_subclass, join_paths, normalize_path, unique
 from litestar.utils.sync import AsyncCallable
 
 __all__ = ("Router",)
@@ -49,6 +49,7 @@ class Router:
     """
 
     __slots__ = (
+        "_http_route_indices",
         "after_request",
         "after_response",
         "before_request",
@@ -64,6 +65,7 @@ class Router:
         "parameters",
         "path",
         "registered_route_handler_ids",
+        "request_max_body_size",
         "response_class",
         "response_cookies",
         "response_headers",
@@ -91,6 +93,7 @@ class Router:
         middleware: Sequence[Middleware] | None = None,
         opt: Mapping[str, Any] | None = None,
         parameters: ParametersMap | None = None,
+        request_max_body_size: int | None | EmptyType = Empty,
         response_class: ResponseType | None = None,
         response_cookies: ResponseCookies | None = None,
         response_headers: ResponseHeaders | None = None,
@@ -129,6 +132,8 @@ class Router:
                 paths.
             path: A path fragment that is prefixed to all route handlers, controllers and other routers associated
                 with the router instance.
+            request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+                '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
             response_class: A custom subclass of :class:`Response <.response.Response>` to be used as the default for
                 all route handlers, controllers and other routers associated with the router instance.
             response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>` instances.
@@ -162,11 +167,14 @@ class Router:
         self.owner: Router | None = None
         self.parameters = dict(parameters or {})
         self.path = normalize_path(path)
+        self.request_max_body_size = request_max_body_size
         self.response_class = response_class
         self.response_cookies = narrow_response_cookies(response_cookies)
         self.response_headers = narrow_response_headers(response_headers)
         self.return_dto = return_dto
         self.routes: list[HTTPRoute | ASGIRoute | WebSocketRoute] = []
+        # the index in routes of the HTTP route of each path, which is replaced when further handlers are registered
+        self._http_route_indices: dict[str, int] = {}
         self.security = list(security or [])
         self.signature_namespace = signature_namespace or {}
         self.tags = list(tags or [])
@@ -196,18 +204,9 @@ class Router:
             if http_handlers := unique(
                 [handler for handler in handlers_map.values() if isinstance(handler, HTTPRouteHandler)]
             ):
-                if existing_handlers := unique(
-                    [
-                        handler
-                        for handler in self.route_handler_method_map.get(path, {}).values()
-                        if isinstance(handler, HTTPRouteHandler)
-                    ]
-                ):
-                    http_handlers.extend(existing_handlers)
-                    existing_route_index = find_index(self.routes, lambda x: x.path == path)  # noqa: B023
-
-                    if existing_route_index == -1:  # pragma: no cover
-                        raise ImproperlyConfiguredException("unable to find_index existing route index")
+                if (existing_route_index := self._http_route_indices.get(path)) is not None:
+                    existing_route = cast("HTTPRoute", self.routes[existing_route_index])
+                    http_handlers.extend(unique(existing_route.route_handlers))
 
                     route: WebSocketRoute | ASGIRoute | HTTPRoute = HTTPRoute(
                         path=path,
@@ -216,6 +215,7 @@ class Router:
                     self.routes[existing_route_index] = route
                 else:
                     route = HTTPRoute(path=path, route_handlers=http_handlers)
+                    self._http_route_indices[path] = len(self.routes)
                     self.routes.append(route)
 
                 routes.append(route)
@@ -124,8 +124,18 @@ class BaseRoute(ABC):
         """
         raise NotImplementedError("Route subclasses must implement handle which serves as the ASGI app entry point")
 
-    def create_handler_kwargs_model(self, route_handler: BaseRouteHandler) -> KwargsModel:
-        """Create a `KwargsModel` for a given route handler."""
+    def create_handler_kwargs_model(
+        self, route_handler: BaseRouteHandler, compile_extractors: bool = False
+    ) -> KwargsModel:
+        """Create a `KwargsModel` for a given route handler.
+
+        Args:
+            route_handler: The route handler.
+            compile_extractors: Generate a function specialized for extracting the kwargs of the route handler.
+
+        Returns:
+            A `KwargsModel` instance.
+        """
 
         path_parameters = set()
         for param in self.path_parameters:
@@ -140,6 +150,7 @@ class BaseRoute(ABC):
             path_parameters=path_parameters,
             layered_parameters=route_handler.resolve_layered_parameters(),
             data_dto=route_handler.resolve_dto(),
+            compile_extractors=compile_extractors,
         )
 
     @staticmethod
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import pickle
+from functools import partial
 from itertools import chain
+from string import Formatter
 from typing import TYPE_CHECKING, Any, cast
 
+from litestar._response_cache import get_or_create_cached_response
 from litestar.constants import DEFAULT_ALLOWED_CORS_HEADERS
 from litestar.datastructures.headers import Headers
 from litestar.datastructures.upload_file import UploadFile
@@ -11,6 +13,7 @@ from litestar.enums import HttpMethod, MediaType, ScopeType
 from litestar.exceptions import ClientException, ImproperlyConfiguredException, SerializationException
 from litestar.handlers.http_handlers import HTTPRouteHandler
 from litestar.response import Response
+from litestar.response._conditional import add_body_etag, respond_conditionally
 from litestar.routes.base import BaseRoute
 from litestar.status_codes import HTTP_204_NO_CONTENT, HTTP_400_BAD_REQUEST
 
@@ -86,12 +89,18 @@ class HTTPRoute(BaseRoute):
         if form_data := scope.get("_form", {}):
             await self._cleanup_temporary_files(form_data=cast("dict[str, Any]", form_data))
 
-    def create_handler_map(self) -> None:
+    def create_handler_map(self, compile_kwargs_extractors: bool = False) -> None:
         """Parse the ``router_handlers`` of this route and return a mapping of
         http- methods and route handlers.
+
+        Args:
+            compile_kwargs_extractors: Generate a function specialized for extracting the kwargs of each route handler.
         """
         for route_handler in self.route_handlers:
-            kwargs_model = self.create_handler_kwargs_model(route_handler=route_handler)
+            self._validate_cache_tags(route_handler)
+            kwargs_model = self.create_handler_kwargs_model(
+                route_handler=route_handler, compile_extractors=compile_kwargs_extractors
+            )
             for http_method in route_handler.http_methods:
                 if self.route_handler_map.get(http_method):
                     raise ImproperlyConfiguredException(
@@ -99,6 +108,27 @@ class HTTPRoute(BaseRoute):
                     )
                 self.route_handler_map[http_method] = (route_handler, kwargs_model)
 
+    def _validate_cache_tags(self, route_handler: HTTPRouteHandler) -> None:
+        """Validate that the placeholders of the ``cache_tags`` of a route handler are path parameters of the route.
+
+        Args:
+            route_handler: The route handler.
+
+        Raises:
+            ImproperlyConfiguredException: If a placeholder is not a path parameter of the route.
+        """
+        path_parameters = {param.name for param in self.path_parameters}
+        for tag in route_handler.cache_tags:
+            for _, field_name, _, _ in Formatter().parse(tag):
+                if field_name is None:
+                    continue
+                name = field_name.partition(".")[0].partition("[")[0]
+                if name not in path_parameters:
+                    raise ImproperlyConfiguredException(
+                        f"Cache tag {tag!r} of route handler {route_handler.handler_name!r} refers to {name!r}, which is "
+                        f"not a path parameter of {self.path!r}"
+                    )
+
     async def _get_response_for_request(
         self,
         scope: Scope,
@@ -110,7 +140,8 @@ class HTTPRoute(BaseRoute):
 
         If caching is enabled and a response exist in the cache, the cached response will be returned.
         If caching is enabled and a response does not exist in the cache, the newly created
-        response will be cached.
+        response will be cached. Cached responses and responses of route handlers with ``body_etag`` enabled are
+        replaced with a ``304 - Not Modified`` response if the request's conditional headers match them.
 
         Args:
             scope: The Request's scope
@@ -121,23 +152,28 @@ class HTTPRoute(BaseRoute):
         Returns:
             An instance of Response or a compatible ASGIApp or a subclass of it
         """
-        if route_handler.cache and (
-            response := await self._get_cached_response(request=request, route_handler=route_handler)
-        ):
-            return response
-
-        response = await self._call_handler_function(
-            scope=scope, request=request, parameter_model=parameter_model, route_handler=route_handler
-        )
-
         if route_handler.cache:
-            await self._set_cached_response(
-                response=response,
+            response = await get_or_create_cached_response(
                 request=request,
                 route_handler=route_handler,
+                create_response=partial(
+                    self._call_handler_function,
+                    scope=scope,
+                    request=request,
+                    parameter_model=parameter_model,
+                    route_handler=route_handler,
+                ),
             )
+        else:
+            response = await self._call_handler_function(
+                scope=scope, request=request, parameter_model=parameter_model, route_handler=route_handler
+            )
+            if not route_handler.body_etag:
+                return response
+            add_body_etag(response)
 
-        return response
+        # cached responses carry an etag derived from their body
+        return respond_conditionally(scope, response)
 
     async def _call_handler_function(
         self, scope: Scope, request: Request, parameter_model: KwargsModel, route_handler: HTTPRouteHandler
@@ -207,47 +243,6 @@ class HTTPRoute(BaseRoute):
 
         return data, cleanup_group
 
-    @staticmethod
-    async def _get_cached_response(request: Request, route_handler: HTTPRouteHandler) -> ASGIApp | None:
-        """Retrieve and un-pickle the cached response, if existing.
-
-        Args:
-            request: The :class:`Request <litestar.connection.Request>` instance
-            route_handler: The :class:`~.handlers.HTTPRouteHandler` instance
-
-        Returns:
-            A cached response instance, if existing.
-        """
-
-        cache_config = request.app.response_cache_config
-        cache_key = (route_handler.cache_key_builder or cache_config.key_builder)(request)
-        store = cache_config.get_store_from_app(request.app)
-
-        cached_response = await store.get(key=cache_key)
-
-        if cached_response:
-            return cast("ASGIApp", pickle.loads(cached_response))  # noqa: S301
-
-        return None
-
-    @staticmethod
-    async def _set_cached_response(
-        response: Response | ASGIApp, request: Request, route_handler: HTTPRouteHandler
-    ) -> None:
-        """Pickles and caches a response object."""
-        cache_config = request.app.response_cache_config
-        cache_key = (route_handler.cache_key_builder or cache_config.key_builder)(request)
-
-        expires_in: int | None = None
-        if route_handler.cache is True:
-            expires_in = cache_config.default_expiration
-        elif route_handler.cache is not False and isinstance(route_handler.cache, int):
-            expires_in = route_handler.cache
-
-        store = cache_config.get_store_from_app(request.app)
-
-        await store.set(key=cache_key, value=pickle.dumps(response, pickle.HIGHEST_PROTOCOL), expires_in=expires_in)
-
     def create_options_handler(self, path: str) -> HTTPRouteHandler:
         """Args:
             path: The route path
@@ -1,4 +1,5 @@
 from litestar.static_files.base import StaticFiles
 from litestar.static_files.config import StaticFilesConfig
+from litestar.static_files.index import StaticFilesIndex
 
-__all__ = ("StaticFiles", "StaticFilesConfig")
+__all__ = ("StaticFiles", "StaticFilesConfig", "StaticFilesIndex")
@@ -1,28 +1,38 @@
 from __future__ import annotations
 
+from mimetypes import guess_type
 from os.path import commonpath
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, Sequence
 
-from litestar.enums import ScopeType
+from litestar.datastructures import AcceptEncoding, Headers
+from litestar.enums import CompressionEncoding, ScopeType
 from litestar.exceptions import MethodNotAllowedException, NotFoundException
 from litestar.file_system import FileSystemAdapter
 from litestar.response.file import ASGIFileResponse
-from litestar.status_codes import HTTP_404_NOT_FOUND
+from litestar.status_codes import HTTP_200_OK, HTTP_404_NOT_FOUND
 
 __all__ = ("StaticFiles",)
 
 
 if TYPE_CHECKING:
+    from litestar.static_files.index import StaticFilesIndex
     from litestar.types import Receive, Scope, Send
     from litestar.types.composite_types import PathType
     from litestar.types.file_types import FileInfo, FileSystemProtocol
 
+# the file extensions of precompressed files, by content coding
+PRECOMPRESSED_EXTENSIONS = {
+    CompressionEncoding.BROTLI: ".br",
+    CompressionEncoding.ZSTD: ".zst",
+    CompressionEncoding.GZIP: ".gz",
+}
+
 
 class StaticFiles:
     """ASGI App that handles file sending."""
 
-    __slots__ = ("is_html_mode", "directories", "adapter", "send_as_attachment")
+    __slots__ = ("is_html_mode", "directories", "adapter", "send_as_attachment", "precompressed_encodings", "index")
 
     def __init__(
         self,
@@ -30,6 +40,8 @@ class StaticFiles:
         directories: Sequence[PathType],
         file_system: FileSystemProtocol,
         send_as_attachment: bool = False,
+        precompressed_encodings: Sequence[str] = (),
+        index: StaticFilesIndex | None = None,
     ) -> None:
         """Initialize the Application.
 
@@ -39,11 +51,17 @@ class StaticFiles:
             file_system: The file_system spec to use for serving files.
             send_as_attachment: Whether to send the file with a ``content-disposition`` header of
              ``attachment`` or ``inline``
+            precompressed_encodings: Content codings of precompressed files to serve instead of the requested files,
+                in order of preference. A file precompressed with a coding accepted by the client is served from the
+                sibling of the requested file with the coding's extension, e.g. ``app.js.br`` for ``app.js``.
+            index: An index of the files in ``directories``, used instead of ``file_system`` to find and read files.
         """
-        self.adapter = FileSystemAdapter(file_system)
+        self.adapter = FileSystemAdapter(index or file_system)
+        self.index = index
         self.directories = tuple(Path(p).resolve() for p in directories)
         self.is_html_mode = is_html_mode
         self.send_as_attachment = send_as_attachment
+        self.precompressed_encodings = tuple(precompressed_encodings)
 
     async def get_fs_info(
         self, directories: Sequence[PathType], file_path: PathType
@@ -68,6 +86,62 @@ class StaticFiles:
                 continue
         return None, None
 
+    async def _get_precompressed_file(self, scope: Scope, file_path: PathType) -> tuple[Path, FileInfo, str] | None:
+        """Find the precompressed sibling of a file to serve for a request.
+
+        Args:
+            scope: ASGI scope
+            file_path: The path of the requested file
+
+        Returns:
+            The path and file info of the precompressed file, and its content coding, or ``None`` if the client does
+            not accept any of the codings a precompressed sibling exists for.
+        """
+        accept_encoding = AcceptEncoding(Headers.from_scope(scope).get("accept-encoding", ""))
+        # the sort is stable, so that encodings with the same quality value are tried in order of preference
+        encodings = sorted(
+            (encoding for encoding in self.precompressed_encodings if accept_encoding.accepts(encoding)),
+            key=accept_encoding.quality,
+            reverse=True,
+        )
+        for encoding in encodings:
+            compressed_path = Path(f"{file_path}{PRECOMPRESSED_EXTENSIONS[encoding]}")
+            try:
+                file_info = await self.adapter.info(compressed_path)
+            except FileNotFoundError:
+                continue
+            if file_info["type"] == "file":
+                return compressed_path, file_info, encoding
+        return None
+
+    async def _create_file_response(
+        self,
+        scope: Scope,
+        file_path: PathType,
+        file_info: FileInfo,
+        filename: str,
+        content_disposition_type: Literal["inline", "attachment"],
+        status_code: int = HTTP_200_OK,
+    ) -> ASGIFileResponse:
+        headers: dict[str, str] = {}
+        # files that are encoded already, e.g. archives, are served as is
+        if self.precompressed_encodings and guess_type(filename)[1] is None:
+            # the file that is served depends on the ``Accept-Encoding`` header, whether it is compressed or not
+            headers["vary"] = "accept-encoding"
+            if precompressed := await self._get_precompressed_file(scope, file_path):
+                file_path, file_info, headers["content-encoding"] = precompressed
+
+        return ASGIFileResponse(
+            file_path=file_path,
+            file_info=file_info,
+            file_system=self.adapter.file_system,
+            filename=filename,
+            headers=headers,
+            status_code=status_code,
+            content_disposition_type=content_disposition_type,
+            is_head_response=scope["method"] == "HEAD",
+        )
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """ASGI callable.
 
@@ -98,14 +172,14 @@ class StaticFiles:
             )
 
         if fs_info and fs_info["type"] == "file":
-            await ASGIFileResponse(
+            response = await self._create_file_response(
+                scope=scope,
                 file_path=resolved_path or joined_path,
                 file_info=fs_info,
-                file_system=self.adapter.file_system,
                 filename=filename,
                 content_disposition_type=content_disposition_type,
-                is_head_response=scope["method"] == "HEAD",
-            )(scope, receive, send)
+            )
+            await response(scope, receive, send)
             return
 
         if self.is_html_mode:
@@ -113,15 +187,15 @@ class StaticFiles:
             resolved_path, fs_info = await self.get_fs_info(directories=self.directories, file_path=filename)
 
             if fs_info and fs_info["type"] == "file":
-                await ASGIFileResponse(
+                response = await self._create_file_response(
+                    scope=scope,
                     file_path=resolved_path or joined_path,
                     file_info=fs_info,
-                    file_system=self.adapter.file_system,
                     filename=filename,
-                    status_code=HTTP_404_NOT_FOUND,
                     content_disposition_type=content_disposition_type,
-                    is_head_response=scope["method"] == "HEAD",
-                )(scope, receive, send)
+                    status_code=HTTP_404_NOT_FOUND,
+                )
+                await response(scope, receive, send)
                 return
 
         raise NotFoundException(
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Sequence
 
+from litestar.constants import ONE_MEGABYTE
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.file_system import BaseLocalFileSystem
 from litestar.handlers import asgi
-from litestar.static_files.base import StaticFiles
+from litestar.static_files.base import PRECOMPRESSED_EXTENSIONS, StaticFiles
+from litestar.static_files.index import StaticFilesIndex
 from litestar.utils import normalize_path
 
 __all__ = ("StaticFilesConfig",)
@@ -56,6 +58,31 @@ class StaticFilesConfig:
     """A dictionary that maps handler functions to status codes and/or exception types."""
     send_as_attachment: bool = False
     """Whether to send the file as an attachment."""
+    precompressed: bool = False
+    """Whether to serve precompressed siblings of the requested files to clients accepting their encoding.
+
+    For a request for ``app.js`` with an ``Accept-Encoding`` header allowing it, ``app.js.br``, ``app.js.zst`` or
+    ``app.js.gz`` is served with the corresponding ``Content-Encoding``, if it exists. The siblings can be generated
+    with the ``litestar static-files compress`` command.
+    """
+    precompressed_encodings: Sequence[str] = ("br", "zstd", "gzip")
+    """The content codings of precompressed files to look for, in order of preference.
+
+    The order decides between encodings the client accepts with the same quality value.
+    """
+    index: bool = False
+    """Whether to serve files from an index of ``directories``, created when the app starts up.
+
+    Files are then found without a file system call being offloaded to a thread, and small files are served from
+    memory. Files added or changed after the index has been created are only served once ``directories`` have been
+    rescanned, see ``index_rescan_interval``. Requires the default, local ``file_system``.
+    """
+    index_rescan_interval: float | None = None
+    """Interval in seconds at which ``directories`` are rescanned. If ``None``, they are only scanned at startup."""
+    index_cache_max_file_size: int = 64 * 1024
+    """Maximum size in bytes of the files the index keeps in memory."""
+    index_cache_max_size: int = 16 * ONE_MEGABYTE
+    """Maximum size in bytes of all files the index keeps in memory, the least recently used being evicted first."""
 
     def __post_init__(self) -> None:
         if not self.path:
@@ -72,6 +99,15 @@ class StaticFilesConfig:
         ):
             raise ImproperlyConfiguredException("file_system must adhere to the FileSystemProtocol type")
 
+        if unsupported_encodings := set(self.precompressed_encodings).difference(PRECOMPRESSED_EXTENSIONS):
+            raise ImproperlyConfiguredException(
+                f"precompressed_encodings must only contain {', '.join(PRECOMPRESSED_EXTENSIONS)}, "
+                f"got {', '.join(sorted(unsupported_encodings))}"
+            )
+
+        if self.index and not isinstance(self.file_system, BaseLocalFileSystem):
+            raise ImproperlyConfiguredException("index is only supported for the local file system")
+
         self.path = normalize_path(self.path)
 
     def to_static_files_app(self) -> ASGIRouteHandler:
@@ -85,6 +121,15 @@ class StaticFilesConfig:
             directories=self.directories,
             file_system=self.file_system,
             send_as_attachment=self.send_as_attachment,
+            precompressed_encodings=self.precompressed_encodings if self.precompressed else (),
+            index=StaticFilesIndex(
+                directories=self.directories,
+                rescan_interval=self.index_rescan_interval,
+                cache_max_file_size=self.index_cache_max_file_size,
+                cache_max_size=self.index_cache_max_size,
+            )
+            if self.index
+            else None,
         )
         return asgi(
             path=self.path,
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from contextlib import suppress
+from pathlib import Path
+from stat import S_ISDIR
+from typing import TYPE_CHECKING, Any, Sequence
+
+from anyio import Path as AsyncPath
+from anyio import create_task_group, open_file, sleep
+from anyio.to_thread import run_sync
+
+from litestar.constants import ONE_MEGABYTE
+
+__all__ = ("StaticFilesIndex",)
+
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from anyio import AsyncFile
+    from anyio.abc import TaskGroup
+
+    from litestar.types import PathType
+    from litestar.types.file_types import FileInfo
+
+
+class _CachedFile:
+    """A read-only, file-like view of the content of a cached file."""
+
+    __slots__ = ("_content", "_position")
+
+    def __init__(self, content: bytes) -> None:
+        self._content = content
+        self._position = 0
+
+    async def __aenter__(self) -> _CachedFile:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def read(self, size: int = -1) -> bytes:
+        end = len(self._content) if size < 0 else min(self._position + size, len(self._content))
+        chunk = self._content[self._position : end]
+        self._position = end
+        return chunk
+
+    async def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._position = offset
+        return offset
+
+
+def _create_file_info(path: str, result: os.stat_result, is_link: bool) -> FileInfo:
+    """Create a ``FileInfo`` from the result of :func:`os.stat`, as
+    :meth:`FileSystemAdapter.parse_stat_result <litestar.file_system.FileSystemAdapter.parse_stat_result>` does.
+    """
+    file_info: FileInfo = {
+        "created": result.st_ctime,
+        "gid": result.st_gid,
+        "ino": result.st_ino,
+        "islink": is_link,
+        "mode": result.st_mode,
+        "mtime": result.st_mtime,
+        "name": path,
+        "nlink": result.st_nlink,
+        "size": result.st_size,
+        "type": "directory" if S_ISDIR(result.st_mode) else "file",
+        "uid": result.st_uid,
+    }
+    if is_link:
+        file_info["destination"] = os.readlink(path).encode("utf-8")
+    return file_info
+
+
+class StaticFilesIndex:
+    """An index of the files in static files directories, holding small files in memory.
+
+    The directories are scanned when the app starts up, and optionally rescanned periodically, so that requests for
+    static files are answered from the index, without a file system call being offloaded to a thread to retrieve the
+    info of a file. Files of up to ``cache_max_file_size`` bytes are kept in a least recently used cache of at most
+    ``cache_max_size`` bytes, and are not read from the file system either while they are cached.
+
+    The index implements the :class:`FileSystemProtocol <litestar.types.FileSystemProtocol>` for the files it holds.
+    Files that do not exist at the time of a scan are not found until the next one.
+    """
+
+    __slots__ = (
+        "cache_max_file_size",
+        "cache_max_size",
+        "directories",
+        "rescan_interval",
+        "_cache",
+        "_cache_size",
+        "_entries",
+        "_task_group",
+    )
+
+    def __init__(
+        self,
+        directories: Sequence[PathType],
+        rescan_interval: float | None = None,
+        cache_max_file_size: int = 64 * 1024,
+        cache_max_size: int = 16 * ONE_MEGABYTE,
+    ) -> None:
+        """Initialize ``StaticFilesIndex``.
+
+        Args:
+            directories: The directories to index.
+            rescan_interval: Interval in seconds at which the directories are rescanned. If ``None``, they are only
+                scanned at startup.
+            cache_max_file_size: Maximum size in bytes of the files kept in memory.
+            cache_max_size: Maximum size in bytes of all files kept in memory.
+        """
+        self.directories = tuple(Path(p).resolve() for p in directories)
+        self.rescan_interval = rescan_interval
+        self.cache_max_file_size = cache_max_file_size
+        self.cache_max_size = cache_max_size
+        self._entries: dict[str, FileInfo] | None = None
+        self._cache: OrderedDict[str, bytes] = OrderedDict()
+        self._cache_size = 0
+        self._task_group: TaskGroup | None = None
+
+    def _scan(
+        self, previous_entries: dict[str, FileInfo], cache: dict[str, bytes]
+    ) -> tuple[dict[str, FileInfo], OrderedDict[str, bytes]]:
+        entries: dict[str, FileInfo] = {}
+        # directories reachable through symbolic links are only indexed once
+        visited: set[tuple[int, int]] = set()
+        for directory in self.directories:
+            try:
+                result = directory.stat()
+            except OSError:
+                continue
+            entries[str(directory)] = _create_file_info(str(directory), result, False)
+            visited.add((result.st_dev, result.st_ino))
+
+            pending = [str(directory)]
+            while pending:
+                with suppress(OSError), os.scandir(pending.pop()) as dir_entries:
+                    for dir_entry in dir_entries:
+                        try:
+                            file_info = _create_file_info(dir_entry.path, dir_entry.stat(), dir_entry.is_symlink())
+                        except OSError:
+                            # e.g. broken symbolic links
+                            continue
+
+                        entries[dir_entry.path] = file_info
+                        if file_info["type"] == "directory":
+                            result = dir_entry.stat()
+                            if (result.st_dev, result.st_ino) not in visited:
+                                visited.add((result.st_dev, result.st_ino))
+                                pending.append(dir_entry.path)
+
+        # cached files that have not changed are kept, and others are read until the cache is full
+        new_cache: OrderedDict[str, bytes] = OrderedDict()
+        cache_size = 0
+        for path, content in cache.items():
+            file_info, previous_file_info = entries.get(path), previous_entries.get(path)
+            if (
+                file_info
+                and previous_file_info
+                and file_info["mtime"] == previous_file_info["mtime"]
+                and file_info["size"] == len(content)
+            ):
+                new_cache[path] = content
+                cache_size += len(content)
+
+        for path, file_info in entries.items():
+            if (
+                path not in new_cache
+                and file_info["type"] == "file"
+                and file_info["size"] <= self.cache_max_file_size
+                and cache_size + file_info["size"] <= self.cache_max_size
+            ):
+                with suppress(OSError), open(path, "rb") as file:
+                    content = file.read()
+                    new_cache[path] = content
+                    cache_size += len(content)
+
+        return entries, new_cache
+
+    async def scan(self) -> None:
+        """Scan the directories, replacing the index.
+
+        The scan is run in a thread, since it calls the file system.
+        """
+        # the cache is copied, since it is reordered by requests while the scan is running
+        entries, cache = await run_sync(self._scan, self._entries or {}, dict(self._cache))
+        self._entries = entries
+        self._cache = cache
+        self._cache_size = sum(len(content) for content in cache.values())
+
+    async def _get_entries(self) -> dict[str, FileInfo]:
+        if self._entries is None:
+            # the index is used without having been started, e.g. because the server does not support lifespan events
+            await self.scan()
+        return self._entries  # type: ignore[return-value]
+
+    def _cache_file(self, path: str, content: bytes) -> None:
+        if len(content) > self.cache_max_file_size:
+            return
+        # the file may have been read and cached by concurrent requests
+        if (previous := self._cache.pop(path, None)) is not None:
+            self._cache_size -= len(previous)
+        self._cache[path] = content
+        self._cache_size += len(content)
+        while self._cache_size > self.cache_max_size:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_size -= len(evicted)
+
+    async def info(self, path: PathType, **kwargs: Any) -> FileInfo:
+        """Retrieve information about a given file path from the index.
+
+        Args:
+            path: A file path.
+            **kwargs: Any additional kwargs.
+
+        Returns:
+            A dictionary of file info.
+
+        Raises:
+            FileNotFoundError: If the path is not indexed.
+        """
+        if (file_info := (await self._get_entries()).get(str(path))) is None:
+            raise FileNotFoundError(path)
+        return file_info
+
+    async def open(self, file: PathType, mode: str = "rb", buffering: int = -1) -> AsyncFile | _CachedFile:
+        """Return a file-like object for a file.
+
+        Cached files are returned from memory. Other files of up to ``cache_max_file_size`` bytes are read and cached,
+        and larger files are opened from the file system.
+
+        Args:
+            file: Path to the target file.
+            mode: Mode, similar to the built ``open``.
+            buffering: Buffer size.
+        """
+        path = str(file)
+        if (content := self._cache.get(path)) is not None:
+            self._cache.move_to_end(path)
+            return _CachedFile(content)
+
+        file_info = await self.info(path)
+        if file_info["size"] <= self.cache_max_file_size:
+            content = await AsyncPath(path).read_bytes()
+            self._cache_file(path, content)
+            return _CachedFile(content)
+
+        return await open_file(file=path, mode=mode, buffering=buffering)  # type: ignore[call-overload]
+
+    async def _rescan(self, interval: float) -> None:
+        while True:
+            await sleep(interval)
+            await self.scan()
+
+    async def __aenter__(self) -> StaticFilesIndex:
+        await self.scan()
+        if self.rescan_interval:
+            self._task_group = create_task_group()
+            await self._task_group.__aenter__()
+            self._task_group.start_soon(self._rescan, self.rescan_interval)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._task_group:
+            self._task_group.cancel_scope.cancel()
+            await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
+            self._task_group = None
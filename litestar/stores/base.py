@@ -64,6 +64,17 @@ class Store(ABC):  # pragma: no cover
         """Delete all stored values."""
         raise NotImplementedError
 
+    async def delete_prefix(self, prefix: str) -> None:
+        """Delete all values whose key starts with ``prefix``.
+
+        Args:
+            prefix: Prefix of the keys of the values to delete
+
+        Raises:
+            NotImplementedError: If the store does not support deleting values by prefix
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support deleting values by prefix")
+
     @abstractmethod
     async def exists(self, key: str) -> bool:
         """Check if a given ``key`` exists."""
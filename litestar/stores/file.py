@@ -143,6 +143,22 @@ class FileStore(NamespacedStore):
         await run_sync(shutil.rmtree, self.path)
         await self.path.mkdir(exist_ok=True)
 
+    async def delete_prefix(self, prefix: str) -> None:
+        """Delete all values whose key starts with ``prefix``.
+
+        Note:
+            Since keys are stored as file names, which are derived from the keys character by character, this may
+            also delete values whose file name starts with that of ``prefix``, but whose key does not start with
+            ``prefix``.
+
+        Args:
+            prefix: Prefix of the keys of the values to delete
+        """
+        file_name_prefix = _safe_file_name(prefix)
+        async for file in self.path.iterdir():
+            if file.name.startswith(file_name_prefix) and await file.is_file():
+                await file.unlink(missing_ok=True)
+
     async def delete_expired(self) -> None:
         """Delete expired items.
 
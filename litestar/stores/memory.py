@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import anyio
@@ -17,12 +18,18 @@ if TYPE_CHECKING:
 class MemoryStore(Store):
     """In memory, thread-safe, asynchronous key/value store."""
 
-    __slots__ = ("_store", "_lock")
+    __slots__ = ("_store", "_lock", "max_size")
 
-    def __init__(self) -> None:
-        """Initialize :class:`MemoryStore`"""
-        self._store: dict[str, StorageObject] = {}
+    def __init__(self, max_size: int | None = None) -> None:
+        """Initialize :class:`MemoryStore`
+
+        Args:
+            max_size: Maximum number of values to store. If given, the least recently used values are evicted once
+                it is reached.
+        """
+        self._store: OrderedDict[str, StorageObject] = OrderedDict()
         self._lock = Lock()
+        self.max_size = max_size
 
     async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
         """Set a value.
@@ -39,6 +46,10 @@ class MemoryStore(Store):
             value = value.encode("utf-8")
         async with self._lock:
             self._store[key] = StorageObject.new(data=value, expires_in=expires_in)
+            if self.max_size is not None:
+                self._store.move_to_end(key)
+                while len(self._store) > self.max_size:
+                    self._store.popitem(last=False)
 
     async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
         """Get a value.
@@ -68,6 +79,9 @@ class MemoryStore(Store):
                 storage_obj = StorageObject.new(data=storage_obj.data, expires_in=renew_for)
                 self._store[key] = storage_obj
 
+            if self.max_size is not None:
+                self._store.move_to_end(key)
+
             return storage_obj.data
 
     async def delete(self, key: str) -> None:
@@ -86,6 +100,16 @@ class MemoryStore(Store):
         async with self._lock:
             self._store.clear()
 
+    async def delete_prefix(self, prefix: str) -> None:
+        """Delete all values whose key starts with ``prefix``.
+
+        Args:
+            prefix: Prefix of the keys of the values to delete
+        """
+        async with self._lock:
+            for key in [key for key in self._store if key.startswith(prefix)]:
+                del self._store[key]
+
     async def delete_expired(self) -> None:
         """Delete expired items.
 
@@ -94,7 +118,7 @@ class MemoryStore(Store):
         to free memory.
         """
         async with self._lock:
-            new_store = {}
+            new_store: OrderedDict[str, StorageObject] = OrderedDict()
             for i, (key, storage_obj) in enumerate(self._store.items()):
                 if not storage_obj.expired:
                     new_store[key] = storage_obj
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from datetime import timedelta
 from typing import cast
 
@@ -164,6 +165,25 @@ class RedisStore(NamespacedStore):
 
         await self._delete_all_script(keys=[], args=[f"{self.namespace}*:*"])
 
+    async def delete_prefix(self, prefix: str) -> None:
+        """Delete all values whose key starts with ``prefix`` in the virtual key namespace.
+
+        Args:
+            prefix: Prefix of the keys of the values to delete
+
+        Raises:
+            ImproperlyConfiguredException: If no namespace was configured, or if ``prefix`` is empty
+        """
+        if not self.namespace:
+            raise ImproperlyConfiguredException("Cannot perform delete operation: No namespace configured")
+        if not prefix:
+            raise ImproperlyConfiguredException("Cannot perform delete operation: No prefix given")
+
+        pattern = self._make_key(re.sub(r"([*?\[\]\\])", r"\\\1", prefix)) + "*"
+        keys = [key async for key in self._redis.scan_iter(match=pattern)]
+        if keys:
+            await self._redis.unlink(*keys)
+
     async def exists(self, key: str) -> bool:
         """Check if a given ``key`` exists."""
         return await self._redis.exists(self._make_key(key)) == 1
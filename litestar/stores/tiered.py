@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from typing import TYPE_CHECKING, Optional, Tuple
+from uuid import uuid4
+
+from anyio import Lock
+from msgspec.msgpack import decode as msgpack_decode
+from msgspec.msgpack import encode as msgpack_encode
+
+from .base import Store
+
+__all__ = ("TieredStore",)
+
+
+if TYPE_CHECKING:
+    from litestar.channels import ChannelsPlugin
+
+
+class TieredStore(Store):
+    """Two-tier key/value store, keeping values of a shared store in a fast, local store.
+
+    Values are read through the first tier (L1), typically a bounded :class:`MemoryStore <.memory.MemoryStore>`, from
+    the second tier (L2), e.g. a :class:`RedisStore <.redis.RedisStore>` shared by all workers, which is the source of
+    truth. Values are written through both tiers, and values read from L2 are kept in L1 for the time they have left
+    to live in L2.
+
+    Since L1 is local to each process, values changed or deleted by other processes may be served from L1 until they
+    expire there. This can be limited with ``max_l1_expires_in``, or prevented by passing a
+    :class:`ChannelsPlugin <litestar.channels.ChannelsPlugin>`, which is used to broadcast invalidations to the other
+    processes whenever a value is set or deleted.
+    """
+
+    __slots__ = ("l1", "l2", "max_l1_expires_in", "_channels", "_exit_stack", "_id", "_invalidation_channel", "_lock")
+
+    def __init__(
+        self,
+        l1: Store,
+        l2: Store,
+        max_l1_expires_in: int | timedelta | None = None,
+        channels: ChannelsPlugin | None = None,
+        invalidation_channel: str = "litestar_tiered_store_invalidations",
+    ) -> None:
+        """Initialize :class:`TieredStore`
+
+        Args:
+            l1: The store to keep values in locally
+            l2: The store holding the values, shared across processes
+            max_l1_expires_in: Maximum time in seconds values are kept in ``l1``
+            channels: A :class:`ChannelsPlugin <litestar.channels.ChannelsPlugin>` used to broadcast invalidations. It
+                must allow publishing to ``invalidation_channel``, e.g. by declaring it in its ``channels``
+            invalidation_channel: The channel invalidations are broadcast on
+        """
+        self.l1 = l1
+        self.l2 = l2
+        self.max_l1_expires_in = (
+            int(max_l1_expires_in.total_seconds()) if isinstance(max_l1_expires_in, timedelta) else max_l1_expires_in
+        )
+        self._channels = channels
+        self._invalidation_channel = invalidation_channel
+        self._id = uuid4().hex
+        self._exit_stack: AsyncExitStack | None = None
+        self._lock = Lock()
+
+    async def _listen_for_invalidations(self) -> None:
+        """Subscribe to the invalidations broadcast by other stores, once the channels plugin has been started."""
+        if self._channels is None or self._exit_stack is not None:
+            return
+
+        async with self._lock:
+            if self._exit_stack is None:
+                subscriber = await self._channels.subscribe(self._invalidation_channel)
+                exit_stack = AsyncExitStack()
+                # the subscriber is stopped when the plugin shuts down
+                await exit_stack.enter_async_context(subscriber.run_in_background(self._on_invalidation))
+                self._exit_stack = exit_stack
+
+    async def _on_invalidation(self, event: bytes) -> None:
+        origin, key, is_prefix = msgpack_decode(event, type=Tuple[str, Optional[str], bool])
+        if origin == self._id:
+            return
+        if key is None:
+            await self.l1.delete_all()
+        elif is_prefix:
+            await self.l1.delete_prefix(key)
+        else:
+            await self.l1.delete(key)
+
+    async def _invalidate(self, key: str | None, is_prefix: bool = False) -> None:
+        if self._channels is not None:
+            await self._listen_for_invalidations()
+            self._channels.publish(msgpack_encode((self._id, key, is_prefix)), self._invalidation_channel)
+
+    async def set(self, key: str, value: str | bytes, expires_in: int | timedelta | None = None) -> None:
+        """Set a value in both tiers.
+
+        Args:
+            key: Key to associate the value with
+            value: Value to store
+            expires_in: Time in seconds before the key is considered expired
+
+        Returns:
+            ``None``
+        """
+        await self.l2.set(key, value, expires_in=expires_in)
+        await self._invalidate(key)
+
+        if isinstance(expires_in, timedelta):
+            expires_in = int(expires_in.total_seconds())
+        if self.max_l1_expires_in is not None:
+            expires_in = min(expires_in, self.max_l1_expires_in) if expires_in else self.max_l1_expires_in
+        await self.l1.set(key, value, expires_in=expires_in)
+
+    async def get(self, key: str, renew_for: int | timedelta | None = None) -> bytes | None:
+        """Get a value from the first tier holding it.
+
+        A value found in ``l2`` only is stored in ``l1`` for the time it has left to live in ``l2``.
+
+        Args:
+            key: Key associated with the value
+            renew_for: If given and the value had an initial expiry time set, renew the
+                expiry time for ``renew_for`` seconds. If the value has not been set
+                with an expiry time this is a no-op
+
+        Returns:
+            The value associated with ``key`` if it exists and is not expired, else
+            ``None``
+        """
+        await self._listen_for_invalidations()
+
+        # renewing the expiry time must reach the source of truth
+        if not renew_for and (value := await self.l1.get(key)) is not None:
+            return value
+
+        if (value := await self.l2.get(key, renew_for=renew_for)) is None:
+            await self.l1.delete(key)
+            return None
+
+        expires_in = await self.l2.expires_in(key)
+        # stores return -1 for values without an expiry time, and ``None`` for values that have expired since
+        if expires_in is None or expires_in == 0:
+            return value
+        if expires_in < 0:
+            expires_in = self.max_l1_expires_in
+        elif self.max_l1_expires_in is not None:
+            expires_in = min(expires_in, self.max_l1_expires_in)
+
+        await self.l1.set(key, value, expires_in=expires_in)
+        return value
+
+    async def delete(self, key: str) -> None:
+        """Delete a value from both tiers.
+
+        If no such key exists, this is a no-op.
+
+        Args:
+            key: Key of the value to delete
+        """
+        await self.l2.delete(key)
+        await self.l1.delete(key)
+        await self._invalidate(key)
+
+    async def delete_all(self) -> None:
+        """Delete all stored values from both tiers."""
+        await self.l2.delete_all()
+        await self.l1.delete_all()
+        await self._invalidate(None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        """Delete all values whose key starts with ``prefix`` from both tiers.
+
+        Args:
+            prefix: Prefix of the keys of the values to delete
+        """
+        await self.l2.delete_prefix(prefix)
+        await self.l1.delete_prefix(prefix)
+        await self._invalidate(prefix, is_prefix=True)
+
+    async def exists(self, key: str) -> bool:
+        """Check if a given ``key`` exists."""
+        return await self.l1.exists(key) or await self.l2.exists(key)
+
+    async def expires_in(self, key: str) -> int | None:
+        """Get the time in seconds ``key`` expires in ``l2``. If no such ``key`` exists or no
+        expiry time was set, return ``None``.
+        """
+        return await self.l2.expires_in(key)
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from litestar.config.cors import CORSConfig
     from litestar.config.csrf import CSRFConfig
     from litestar.config.response_cache import ResponseCacheConfig
+    from litestar.config.routing import RoutingConfig
     from litestar.datastructures import CacheControlHeader, ETag, ResponseHeader, State
     from litestar.dto.interface import DTOInterface
     from litestar.events import BaseEventEmitterBackend, EventListener
@@ -90,12 +91,14 @@ def create_test_client(
     raise_server_exceptions: bool = True,
     pdb_on_exception: bool | None = None,
     request_class: type[Request] | None = None,
+    request_max_body_size: int | None = 10_000_000,
     response_cache_config: ResponseCacheConfig | None = None,
     response_class: ResponseType | None = None,
     response_cookies: ResponseCookies | None = None,
     response_headers: OptionalSequence[ResponseHeader] | None = None,
     return_dto: type[DTOInterface] | None | EmptyType = Empty,
     root_path: str = "",
+    routing_config: RoutingConfig | None = None,
     security: OptionalSequence[SecurityRequirement] | None = None,
     session_config: BaseBackendConfig | None = None,
     signature_namespace: Mapping[str, Any] | None = None,
@@ -198,6 +201,8 @@ def create_test_client(
         pdb_on_exception: Drop into the PDB when an exception occurs.
         plugins: Sequence of plugins.
         request_class: An optional subclass of :class:`Request <.connection.Request>` to use for http connections.
+        request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+            '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
         response_class: A custom subclass of :class:`Response <.response.Response>` to be used as the app's default
             response.
         response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>`.
@@ -208,6 +213,7 @@ def create_test_client(
         route_handlers: A sequence of route handlers, which can include instances of
             :class:`Router <.router.Router>`, subclasses of :class:`Controller <.controller.Controller>` or any
             callable decorated by the route handler decorators.
+        routing_config: Configures the routing of incoming connections.
         security: A sequence of dicts that will be added to the schema of all route handlers in the application.
             See
             :data:`SecurityRequirement <.openapi.spec.SecurityRequirement>` for details.
@@ -265,12 +271,14 @@ def create_test_client(
         pdb_on_exception=pdb_on_exception,
         plugins=plugins,
         request_class=request_class,
+        request_max_body_size=request_max_body_size,
         response_cache_config=response_cache_config,
         response_class=response_class,
         response_cookies=response_cookies,
         response_headers=response_headers,
         return_dto=return_dto,
         route_handlers=route_handlers,
+        routing_config=routing_config,
         security=security,
         signature_namespace=signature_namespace,
         state=state,
@@ -332,12 +340,14 @@ def create_async_test_client(
     plugins: OptionalSequence[PluginProtocol] | None = None,
     raise_server_exceptions: bool = True,
     request_class: type[Request] | None = None,
+    request_max_body_size: int | None = 10_000_000,
     response_cache_config: ResponseCacheConfig | None = None,
     response_class: ResponseType | None = None,
     response_cookies: ResponseCookies | None = None,
     response_headers: OptionalSequence[ResponseHeader] | None = None,
     return_dto: type[DTOInterface] | None | EmptyType = Empty,
     root_path: str = "",
+    routing_config: RoutingConfig | None = None,
     security: OptionalSequence[SecurityRequirement] | None = None,
     session_config: BaseBackendConfig | None = None,
     signature_namespace: Mapping[str, Any] | None = None,
@@ -440,6 +450,8 @@ def create_async_test_client(
         pdb_on_exception: Drop into the PDB when an exception occurs.
         plugins: Sequence of plugins.
         request_class: An optional subclass of :class:`Request <.connection.Request>` to use for http connections.
+        request_max_body_size: Maximum allowed size of the request body in bytes. If this size is exceeded, a
+            '413 - Request Entity Too Large' error response is returned. ``None`` disables the limit.
         response_class: A custom subclass of :class:`Response <.response.Response>` to be used as the app's default
             response.
         response_cookies: A sequence of :class:`Cookie <.datastructures.Cookie>`.
@@ -450,6 +462,7 @@ def create_async_test_client(
         route_handlers: A sequence of route handlers, which can include instances of
             :class:`Router <.router.Router>`, subclasses of :class:`Controller <.controller.Controller>` or any
             callable decorated by the route handler decorators.
+        routing_config: Configures the routing of incoming connections.
         security: A sequence of dicts that will be added to the schema of all route handlers in the application.
             See
             :data:`SecurityRequirement <.openapi.spec.SecurityRequirement>` for details.
@@ -507,12 +520,14 @@ def create_async_test_client(
         pdb_on_exception=pdb_on_exception,
         plugins=plugins,
         request_class=request_class,
+        request_max_body_size=request_max_body_size,
         response_cache_config=response_cache_config,
         response_class=response_class,
         response_cookies=response_cookies,
         response_headers=response_headers,
         return_dto=return_dto,
         route_handlers=route_handlers,
+        routing_config=routing_config,
         security=security,
         signature_namespace=signature_namespace,
         state=state,
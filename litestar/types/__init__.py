@@ -7,6 +7,7 @@ from .asgi_types import (
     HTTPRequestEvent,
     HTTPResponseBodyEvent,
     HTTPResponseStartEvent,
+    HTTPResponseZeroCopySendEvent,
     HTTPScope,
     HTTPSendMessage,
     HTTPServerPushEvent,
@@ -113,6 +114,7 @@ __all__ = (
     "HTTPRequestEvent",
     "HTTPResponseBodyEvent",
     "HTTPResponseStartEvent",
+    "HTTPResponseZeroCopySendEvent",
     "HTTPScope",
     "HTTPSendMessage",
     "HTTPServerPushEvent",
@@ -59,6 +59,7 @@ __all__ = (
     "HTTPRequestEvent",
     "HTTPResponseBodyEvent",
     "HTTPResponseStartEvent",
+    "HTTPResponseZeroCopySendEvent",
     "HTTPScope",
     "HTTPSendMessage",
     "HTTPServerPushEvent",
@@ -189,6 +190,18 @@ class HTTPResponseBodyEvent(TypedDict):
     more_body: bool
 
 
+class HTTPResponseZeroCopySendEvent(TypedDict):
+    """ASGI `http.response.zerocopysend` event, sent if the server supports the ``http.response.zerocopysend``
+    extension.
+    """
+
+    type: Literal["http.response.zerocopysend"]
+    file: Any
+    offset: int
+    count: int
+    more_body: bool
+
+
 class HTTPServerPushEvent(HeaderScope):
     """ASGI `http.response.push` event."""
 
@@ -315,6 +328,7 @@ LifeSpanReceiveMessage: TypeAlias = Union[
 HTTPSendMessage: TypeAlias = Union[
     HTTPResponseStartEvent,
     HTTPResponseBodyEvent,
+    HTTPResponseZeroCopySendEvent,
     HTTPServerPushEvent,
     HTTPDisconnectEvent,
 ]
@@ -28,6 +28,7 @@ from litestar.stores.base import Store
 from litestar.stores.file import FileStore
 from litestar.stores.memory import MemoryStore
 from litestar.stores.redis import RedisStore
+from litestar.stores.tiered import TieredStore
 from litestar.testing import RequestFactory
 
 if TYPE_CHECKING:
@@ -96,7 +97,12 @@ def file_store(tmp_path: Path) -> FileStore:
     return FileStore(path=tmp_path)
 
 
-@pytest.fixture(params=["redis_store", "memory_store", "file_store"])
+@pytest.fixture()
+def tiered_store(file_store: FileStore) -> TieredStore:
+    return TieredStore(l1=MemoryStore(max_size=100), l2=file_store)
+
+
+@pytest.fixture(params=["redis_store", "memory_store", "file_store", "tiered_store"])
 def store(request: FixtureRequest) -> Store:
     return cast("Store", request.getfixturevalue(request.param))
 
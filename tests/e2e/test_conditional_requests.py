@@ -0,0 +1,78 @@
+from itertools import count
+
+from litestar import get, post
+from litestar.datastructures import ETag
+from litestar.response import Stream
+from litestar.status_codes import HTTP_200_OK, HTTP_304_NOT_MODIFIED
+from litestar.testing import create_test_client
+
+
+def test_body_etag() -> None:
+    values = iter(["first", "first", "first", "second", "second"])
+
+    @get("/", body_etag=True, sync_to_thread=False)
+    def handler() -> str:
+        return next(values)
+
+    with create_test_client([handler]) as client:
+        response = client.get("/")
+        etag = response.headers["etag"]
+        assert response.text == "first"
+
+        not_modified_response = client.get("/", headers={"if-none-match": etag})
+        assert not_modified_response.status_code == HTTP_304_NOT_MODIFIED
+        assert not_modified_response.content == b""
+        assert not_modified_response.headers["etag"] == etag
+
+        assert client.get("/", headers={"if-none-match": f"W/{etag}"}).status_code == HTTP_304_NOT_MODIFIED
+
+        # the body has changed
+        response = client.get("/", headers={"if-none-match": etag})
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "second"
+        assert response.headers["etag"] != etag
+
+
+def test_body_etag_keeps_existing_etag() -> None:
+    @get("/", body_etag=True, etag=ETag(value="v1"), sync_to_thread=False)
+    def handler() -> str:
+        return "content"
+
+    with create_test_client([handler]) as client:
+        assert client.get("/").headers["etag"] == '"v1"'
+        assert client.get("/", headers={"if-none-match": '"v1"'}).status_code == HTTP_304_NOT_MODIFIED
+
+
+def test_body_etag_ignores_streams_and_other_methods() -> None:
+    @get("/stream", body_etag=True, sync_to_thread=False)
+    def stream_handler() -> Stream:
+        return Stream(iter([b"streamed"]))
+
+    @post("/", body_etag=True, status_code=HTTP_200_OK, sync_to_thread=False)
+    def post_handler() -> str:
+        return "content"
+
+    with create_test_client([stream_handler, post_handler]) as client:
+        assert "etag" not in client.get("/stream").headers
+
+        etag = client.post("/").headers["etag"]
+        assert client.post("/", headers={"if-none-match": etag}).status_code == HTTP_200_OK
+
+
+def test_cached_response_not_modified() -> None:
+    counter = count()
+
+    @get("/cached", cache=True, sync_to_thread=False)
+    def handler() -> int:
+        return next(counter)
+
+    with create_test_client([handler]) as client:
+        response = client.get("/cached")
+        etag = response.headers["etag"]
+
+        # served from the cache
+        not_modified_response = client.get("/cached", headers={"if-none-match": etag})
+        assert not_modified_response.status_code == HTTP_304_NOT_MODIFIED
+        assert not_modified_response.content == b""
+
+        assert client.get("/cached", headers={"if-none-match": '"other"'}).text == response.text
@@ -1,21 +1,38 @@
+import gzip
+import pickle
 import random
+import time
 from datetime import timedelta
-from typing import TYPE_CHECKING, Optional
+from itertools import count
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 from unittest.mock import MagicMock
+from urllib.parse import urlencode
 from uuid import uuid4
 
+import anyio
 import pytest
 
-from litestar import Litestar, Request, get
-from litestar.config.response_cache import CACHE_FOREVER, ResponseCacheConfig
+from litestar import Litestar, MediaType, Request, Response, Router, delete, get
+from litestar.background_tasks import BackgroundTask
+from litestar.config.compression import CompressionConfig
+from litestar.config.response_cache import (
+    CACHE_FOREVER,
+    CacheVaryBy,
+    ResponseCacheConfig,
+    default_cache_key_builder,
+)
+from litestar.datastructures import Cookie
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.middleware import AbstractMiddleware, compression
+from litestar.response import Stream
 from litestar.stores.base import Store
 from litestar.stores.memory import MemoryStore
-from litestar.testing import TestClient, create_test_client
+from litestar.testing import RequestFactory, TestClient, create_test_client
 
 if TYPE_CHECKING:
     from freezegun.api import FrozenDateTimeFactory
 
-    from litestar import Response
+    from litestar.types import HTTPRequestEvent, Message, Receive, Scope, Send
 
 
 @pytest.fixture()
@@ -23,7 +40,7 @@ def mock() -> MagicMock:
     return MagicMock(return_value=str(random.random()))
 
 
-def after_request_handler(response: "Response") -> "Response":
+def after_request_handler(response: Response) -> Response:
     response.headers["unique-identifier"] = str(uuid4())
     return response
 
@@ -142,6 +159,74 @@ async def test_custom_cache_key(sync_to_thread: bool, anyio_backend: str, mock:
         assert await store.exists("/cached:::cached")
 
 
+@pytest.mark.parametrize(
+    "query_string",
+    [
+        b"",
+        b"a=1",
+        b"b=2&a=1&a=0&c",
+        b"b=2&&a=1&",
+        b"=1&a.b-c_d~=x",
+        b"a=1=2",
+        b"a=%20b&b=+",
+        b"b=%C3%A9&a=%e9",
+        b"a=\xc3\xa9",
+        b"a[]=1&a[]=2",
+    ],
+)
+def test_default_cache_key_builder(query_string: bytes) -> None:
+    request = RequestFactory().get("/path")
+    request.scope["query_string"] = query_string
+
+    query_params = sorted(request.query_params.dict().items(), key=lambda x: x[0])
+    assert default_cache_key_builder(request) == request.url.path + urlencode(query_params, doseq=True)
+
+
+def test_cache_vary_by() -> None:
+    @get(
+        "/cached",
+        cache=True,
+        cache_vary_by=CacheVaryBy(headers=["Accept"], cookies=["theme"], auth=lambda user: user["id"]),
+        sync_to_thread=False,
+    )
+    def handler(request: Request) -> str:
+        return f"{request.headers.get('accept')} {request.cookies.get('theme')} {request.scope.get('user')}"
+
+    user_id = "1"
+
+    class AuthMiddleware(AbstractMiddleware):
+        async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+            scope["user"] = {"id": user_id, "name": "foo"}
+            await self.app(scope, receive, send)
+
+    with create_test_client([handler], middleware=[AuthMiddleware]) as client:
+        first_response = client.get("/cached", headers={"Accept": "text/plain"})
+        assert client.get("/cached", headers={"Accept": "text/plain"}).text == first_response.text
+        assert client.get("/cached", headers={"Accept": "text/html"}).text != first_response.text
+
+        client.cookies["theme"] = "dark"
+        assert client.get("/cached", headers={"Accept": "text/plain"}).text != first_response.text
+
+        del client.cookies["theme"]
+        user_id = "2"
+        assert client.get("/cached", headers={"Accept": "text/plain"}).text != first_response.text
+        user_id = "1"
+        assert client.get("/cached", headers={"Accept": "text/plain"}).text == first_response.text
+
+
+def test_cache_vary_by_does_not_store_values_in_keys(memory_store: MemoryStore) -> None:
+    @get("/cached", cache=True, cache_vary_by=CacheVaryBy(headers=["Authorization"]), sync_to_thread=False)
+    def handler() -> None:
+        return None
+
+    with create_test_client([handler], stores={"response_cache": memory_store}) as client:
+        client.get("/cached", headers={"Authorization": "Bearer secret"})
+
+    (key,) = memory_store._store
+    assert key.startswith("/cached|")
+    assert "secret" not in key
+
+
 async def test_non_default_store_name(mock: MagicMock) -> None:
     @get(cache=True)
     def handler() -> str:
@@ -180,3 +265,333 @@ async def test_with_stores(store: Store, mock: MagicMock) -> None:
         assert response_two.text == mock.return_value
 
         assert mock.call_count == 1
+
+
+def test_cached_response_is_restored_without_background(mock: MagicMock) -> None:
+    background_mock = MagicMock()
+
+    @get("/cached", cache=True, sync_to_thread=False)
+    def handler() -> Response[str]:
+        return Response(
+            mock(),
+            status_code=202,
+            headers={"x-custom": "value"},
+            cookies=[Cookie(key="session", value="abc")],
+            background=BackgroundTask(background_mock),
+        )
+
+    with create_test_client([handler]) as client:
+        first_response = client.get("/cached")
+        second_response = client.get("/cached")
+
+    assert mock.call_count == 1
+    assert background_mock.call_count == 1
+    assert second_response.status_code == first_response.status_code == 202
+    assert second_response.headers.multi_items() == first_response.headers.multi_items()
+    assert second_response.cookies["session"] == "abc"
+    assert second_response.content == first_response.content
+
+
+async def test_pickled_response_is_not_loaded(memory_store: MemoryStore, mock: MagicMock) -> None:
+    @get("/cached", cache=True, sync_to_thread=False)
+    def handler() -> str:
+        return mock()  # type: ignore[no-any-return]
+
+    pickled_value = pickle.dumps({"legacy": True}, pickle.HIGHEST_PROTOCOL)
+    await memory_store.set("/cached", pickled_value)
+
+    with create_test_client([handler], stores={"response_cache": memory_store}) as client:
+        first_response = client.get("/cached")
+        second_response = client.get("/cached")
+
+    assert first_response.text == second_response.text == mock.return_value
+    assert mock.call_count == 1
+    assert await memory_store.get("/cached") != pickled_value
+
+
+async def test_streaming_response_is_not_cached(memory_store: MemoryStore) -> None:
+    def iterator() -> Iterator[bytes]:
+        yield b"streamed"
+
+    @get("/cached", cache=True, sync_to_thread=False)
+    def handler() -> Stream:
+        return Stream(iterator)
+
+    with create_test_client([handler], stores={"response_cache": memory_store}) as client:
+        assert client.get("/cached").text == "streamed"
+        assert client.get("/cached").text == "streamed"
+
+    assert not await memory_store.exists("/cached")
+
+
+async def call_app(app: Litestar, path: str) -> bytes:
+    """Call ``app`` directly, so that concurrent calls are handled concurrently."""
+    body = b""
+
+    async def receive() -> "HTTPRequestEvent":
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: "Message") -> None:
+        nonlocal body
+        if message["type"] == "http.response.body":
+            body += message["body"]
+
+    await app(RequestFactory(app=app).get(path).scope, receive, send)  # type: ignore[arg-type]
+    return body
+
+
+@pytest.mark.parametrize("coalesce_requests, expected_call_count", [(True, 1), (False, 5)])
+async def test_coalesce_requests(coalesce_requests: bool, expected_call_count: int, mock: MagicMock) -> None:
+    release = anyio.Event()
+
+    @get("/cached", cache=True)
+    async def handler() -> str:
+        await release.wait()
+        return mock()  # type: ignore[no-any-return]
+
+    app = Litestar([handler], response_cache_config=ResponseCacheConfig(coalesce_requests=coalesce_requests))
+    bodies = []
+
+    async def request() -> None:
+        bodies.append(await call_app(app, "/cached"))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(request)
+        await anyio.sleep(0.01)
+        release.set()
+
+    assert mock.call_count == expected_call_count
+    assert bodies == [mock.return_value.encode()] * 5
+
+
+async def test_coalesce_requests_per_app() -> None:
+    release = anyio.Event()
+    call_count = 0
+
+    @get("/cached", cache=True)
+    async def handler() -> str:
+        nonlocal call_count
+        call_count += 1
+        await release.wait()
+        return "cached"
+
+    # the apps' stores are distinct, so requests to one app must not wait for a response created by the other
+    apps = [Litestar([handler]), Litestar([handler])]
+
+    async with anyio.create_task_group() as tg:
+        for app in apps:
+            tg.start_soon(call_app, app, "/cached")
+        await anyio.sleep(0.01)
+        assert call_count == 2
+        release.set()
+
+    assert not any(app.response_cache_config._flights for app in apps)
+
+
+async def test_coalesced_requests_call_handler_for_uncacheable_response() -> None:
+    release = anyio.Event()
+    call_count = 0
+
+    def iterator() -> Iterator[bytes]:
+        yield b"streamed"
+
+    @get("/cached", cache=True)
+    async def handler() -> Stream:
+        nonlocal call_count
+        call_count += 1
+        await release.wait()
+        return Stream(iterator)
+
+    app = Litestar([handler])
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(call_app, app, "/cached")
+        await anyio.sleep(0.01)
+        assert call_count == 1
+        release.set()
+
+    assert call_count == 3
+
+
+def test_stale_while_revalidate(frozen_datetime: "FrozenDateTimeFactory") -> None:
+    values = iter(["first", "second", "third"])
+
+    @get("/cached", cache=10, sync_to_thread=False)
+    def handler() -> str:
+        return next(values)
+
+    with create_test_client([handler], response_cache_config=ResponseCacheConfig(stale_while_revalidate=30)) as client:
+        assert client.get("/cached").text == "first"
+        frozen_datetime.tick(delta=timedelta(seconds=5))
+        assert client.get("/cached").text == "first"
+
+        # the stale response is served and revalidated once it has been sent
+        frozen_datetime.tick(delta=timedelta(seconds=6))
+        assert client.get("/cached").text == "first"
+        assert client.get("/cached").text == "second"
+
+        # the response is not served once it has been stale for longer than the revalidation window
+        frozen_datetime.tick(delta=timedelta(seconds=41))
+        assert client.get("/cached").text == "third"
+        assert not client.app.response_cache_config._revalidations
+
+
+def test_stale_while_revalidate_drops_overdue_revalidations(frozen_datetime: "FrozenDateTimeFactory") -> None:
+    @get("/cached", cache=10, sync_to_thread=False)
+    def handler() -> str:
+        return "cached"
+
+    app = Litestar([handler], response_cache_config=ResponseCacheConfig(stale_while_revalidate=30))
+    revalidations = app.response_cache_config._revalidations
+
+    with TestClient(app) as client:
+        client.get("/cached")
+        frozen_datetime.tick(delta=timedelta(seconds=11))
+        # a revalidation whose background task never ran, since its stale response was not sent
+        revalidations["/other"] = time.time() - 31
+
+        client.get("/cached")
+
+    assert not revalidations
+
+
+def test_invalidate_cached_responses_by_tag() -> None:
+    counter = count()
+
+    @get("/users/{user_id:int}", cache=True, cache_tags=["users", "user:{user_id}"], sync_to_thread=False)
+    def get_user(user_id: int) -> str:
+        return f"{user_id}-{next(counter)}"
+
+    @delete("/cache")
+    async def invalidate(request: Request, tag: str) -> None:
+        await request.app.invalidate_cached_responses(tags=[tag])
+
+    with create_test_client([get_user, invalidate]) as client:
+        assert client.get("/users/1").text == "1-0"
+        assert client.get("/users/2").text == "2-1"
+        assert client.get("/users/1").text == "1-0"
+
+        client.delete("/cache", params={"tag": "user:1"})
+        assert client.get("/users/1").text == "1-2"
+        assert client.get("/users/2").text == "2-1"
+
+        client.delete("/cache", params={"tag": "users"})
+        assert client.get("/users/1").text == "1-3"
+        assert client.get("/users/2").text == "2-4"
+        assert client.get("/users/1").text == "1-3"
+
+
+def test_invalidate_cached_responses_by_prefix() -> None:
+    counter = count()
+
+    @get(["/users/{user_id:int}", "/orders/{order_id:int}"], cache=True, sync_to_thread=False)
+    def handler() -> int:
+        return next(counter)
+
+    @delete("/cache")
+    async def invalidate(request: Request, prefix: str) -> None:
+        await request.app.invalidate_cached_responses(prefix=prefix)
+
+    with create_test_client([handler, invalidate]) as client:
+        assert client.get("/users/1").text == "0"
+        assert client.get("/orders/1").text == "1"
+
+        client.delete("/cache", params={"prefix": "/users/"})
+        assert client.get("/users/1").text == "2"
+        assert client.get("/orders/1").text == "1"
+
+
+async def test_invalidate_cached_responses_by_prefix_unsupported_store() -> None:
+    class PrefixlessStore(MemoryStore):
+        delete_prefix = Store.delete_prefix
+
+    app = Litestar([], stores={"response_cache": PrefixlessStore()})
+
+    with pytest.raises(ImproperlyConfiguredException):
+        await app.invalidate_cached_responses(prefix="/users/")
+
+
+@pytest.mark.parametrize("cache_tags", (["user:{id}"], ["user:{}"], ["user:{user.id}"]))
+def test_cache_tags_not_path_parameters_raise(cache_tags: list) -> None:
+    @get("/users/{user_id:int}", cache=True, cache_tags=cache_tags, sync_to_thread=False)
+    def get_user(user_id: int) -> None:
+        return None
+
+    with pytest.raises(ImproperlyConfiguredException):
+        Litestar([get_user])
+
+
+def test_cache_tags_with_path_parameters_of_router() -> None:
+    @get("/", cache=True, cache_tags=["user:{user_id}"], sync_to_thread=False)
+    def get_user(user_id: int) -> int:
+        return user_id
+
+    with create_test_client(Router("/users/{user_id:int}", route_handlers=[get_user])) as client:
+        assert client.get("/users/1").text == "1"
+
+
+def test_cache_tags_without_cache_raise() -> None:
+    @get("/users/{user_id:int}", cache_tags=["user:{user_id}"], sync_to_thread=False)
+    def get_user(user_id: int) -> None:
+        return None
+
+    with pytest.raises(ImproperlyConfiguredException):
+        Litestar([get_user])
+
+
+def test_cache_compressed_variants(monkeypatch: pytest.MonkeyPatch) -> None:
+    counter = count()
+    compressors = MagicMock()
+
+    class CompressionFacade(compression.CompressionFacade):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            compressors()
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(compression, "CompressionFacade", CompressionFacade)
+
+    @get("/", cache=True, media_type=MediaType.TEXT, sync_to_thread=False)
+    def handler() -> str:
+        return f"{next(counter)}" + "_litestar_" * 100
+
+    with create_test_client([handler], compression_config=CompressionConfig(backend="brotli")) as client:
+        first_response = client.get("/", headers={"accept-encoding": "gzip"})
+        assert first_response.headers["content-encoding"] == "gzip"
+        assert first_response.headers["vary"] == "Accept-Encoding"
+        assert first_response.text.startswith("0")
+        assert compressors.call_count == 1
+
+        # hits are served compressed, without running a compressor
+        response = client.get("/", headers={"accept-encoding": "gzip;q=0.5"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == first_response.headers["etag"]
+        assert int(response.headers["content-length"]) == len(gzip.compress(response.content))
+        assert response.text.startswith("0")
+        assert compressors.call_count == 1
+
+        # each encoding is a separate variant with its own etag
+        response = client.get("/", headers={"accept-encoding": "br"})
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["etag"] != first_response.headers["etag"]
+        assert response.text.startswith("1")
+
+        response = client.get("/", headers={"accept-encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.text.startswith("2")
+
+        assert client.get("/", headers={"accept-encoding": "br"}).text.startswith("1")
+        assert compressors.call_count == 2
+
+
+def test_cache_compressed_variants_of_small_responses() -> None:
+    @get("/", cache=True, media_type=MediaType.TEXT, sync_to_thread=False)
+    def handler() -> str:
+        return "_litestar_"
+
+    with create_test_client([handler], compression_config=CompressionConfig(backend="gzip")) as client:
+        for _ in range(2):
+            response = client.get("/", headers={"accept-encoding": "gzip"})
+            assert "content-encoding" not in response.headers
+            assert response.text == "_litestar_"
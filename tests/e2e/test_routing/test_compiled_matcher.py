@@ -0,0 +1,135 @@
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from litestar import MediaType, asgi, get, post
+from litestar.config.routing import RoutingConfig
+from litestar.response.base import ASGIResponse
+from litestar.testing import create_test_client
+from litestar.types import Receive, Scope, Send
+
+
+@get("/", media_type=MediaType.TEXT)
+def root() -> str:
+    return "root"
+
+
+@get("/static/path", media_type=MediaType.TEXT)
+def static_path() -> str:
+    return "static"
+
+
+@get("/users/{user_id:int}", media_type=MediaType.TEXT)
+def user(user_id: int) -> str:
+    return f"user {user_id}"
+
+
+@post("/users/{user_id:int}", media_type=MediaType.TEXT)
+def update_user(user_id: int) -> str:
+    return f"updated {user_id}"
+
+
+@get("/users/{user_id:int}/posts/{post_id:str}", media_type=MediaType.TEXT)
+def user_post(user_id: int, post_id: str) -> str:
+    return f"user {user_id} post {post_id}"
+
+
+@get("/users/{user_id:int}/posts/latest", media_type=MediaType.TEXT)
+def latest_user_post(user_id: int) -> str:
+    return f"user {user_id} latest"
+
+
+@get("/files/{file_path:path}", media_type=MediaType.TEXT)
+def file_path_handler(file_path: Path) -> str:
+    return str(file_path)
+
+
+@get("/{slug:str}", media_type=MediaType.TEXT)
+def slug_handler(slug: str) -> str:
+    return f"slug {slug}"
+
+
+@asgi("/mount", is_mount=True)
+async def mount(scope: Scope, receive: Receive, send: Send) -> None:
+    await ASGIResponse(body=f"mount {scope['path']}".encode(), media_type=MediaType.TEXT)(scope, receive, send)
+
+
+ROUTE_HANDLERS = [
+    root,
+    static_path,
+    user,
+    update_user,
+    user_post,
+    latest_user_post,
+    file_path_handler,
+    slug_handler,
+    mount,
+]
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("GET", "/"),
+        ("GET", "/static/path"),
+        ("GET", "/static/path/"),
+        ("GET", "/static/other"),
+        ("GET", "/users/1"),
+        ("POST", "/users/1"),
+        ("DELETE", "/users/1"),
+        ("GET", "/users/abc"),
+        ("GET", "/users/1/posts/abc"),
+        ("GET", "/users/1/posts/latest"),
+        ("GET", "/users/1/posts/abc/comments"),
+        ("GET", "/users/1/comments"),
+        ("GET", "/files/a/b/c.txt"),
+        ("GET", "/files"),
+        ("GET", "/some-slug"),
+        ("GET", "/some-slug/nested"),
+        ("GET", "/mount"),
+        ("GET", "/mount/sub/path"),
+        ("GET", "//users//2//"),
+    ],
+)
+def test_compiled_matcher_resolves_like_trie(method: str, path: str) -> None:
+    results: Dict[bool, Any] = {}
+    for compiled_matcher in (False, True):
+        with create_test_client(
+            ROUTE_HANDLERS, routing_config=RoutingConfig(compiled_matcher=compiled_matcher)
+        ) as client:
+            response = client.request(method, path)
+            results[compiled_matcher] = (response.status_code, response.text)
+
+    assert results[True] == results[False]
+
+
+def test_compiled_matcher_picks_up_registered_routes() -> None:
+    @get("/late/{value:int}", media_type=MediaType.TEXT)
+    def late(value: int) -> str:
+        return str(value)
+
+    with create_test_client(root, routing_config=RoutingConfig(compiled_matcher=True)) as client:
+        assert client.get("/late/1").status_code == 404
+        client.app.register(late)
+        response = client.get("/late/1")
+        assert response.status_code == 200
+        assert response.text == "1"
+
+
+def test_compiled_matcher_updates_compiled_nodes_on_registration() -> None:
+    @get("/users/{user_id:int}/settings", media_type=MediaType.TEXT)
+    def settings(user_id: int) -> str:
+        return f"settings {user_id}"
+
+    @get("/{slug:str}/{value:int}", media_type=MediaType.TEXT)
+    def slug_value(slug: str, value: int) -> str:
+        return f"{slug} {value}"
+
+    with create_test_client(ROUTE_HANDLERS, routing_config=RoutingConfig(compiled_matcher=True)) as client:
+        client.app.register(settings)
+        client.app.register(slug_value)
+
+        assert client.get("/users/1/settings").text == "settings 1"
+        assert client.get("/users/1").text == "user 1"
+        assert client.get("/some-slug/2").text == "some-slug 2"
@@ -5,7 +5,7 @@ import pytest
 from litestar import Litestar, MediaType, asgi, get, websocket
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.response.base import ASGIResponse
-from litestar.status_codes import HTTP_200_OK
+from litestar.status_codes import HTTP_200_OK, HTTP_404_NOT_FOUND
 from litestar.testing import create_test_client
 
 if TYPE_CHECKING:
@@ -92,3 +92,38 @@ def test_does_not_support_asgi_handlers_on_same_level_as_websockets() -> None:
 
     with pytest.raises(ImproperlyConfiguredException):
         Litestar(route_handlers=[asgi_handler, regular_handler])
+
+
+async def _echo_path(scope: "Scope", receive: "Receive", send: "Send") -> None:
+    response = ASGIResponse(body=scope["path"].encode(), media_type=MediaType.TEXT)
+    await response(scope, receive, send)
+
+
+def test_mount_resolution_respects_segment_boundaries() -> None:
+    with create_test_client(route_handlers=[asgi("/static", is_mount=True)(_echo_path)]) as client:
+        response = client.get("/static/file.css")
+        assert response.status_code == HTTP_200_OK
+        assert response.text == "/file.css/"
+
+        assert client.get("/staticfiles/file.css").status_code == HTTP_404_NOT_FOUND
+        assert client.get("/assets/static/file.css").status_code == HTTP_404_NOT_FOUND
+
+
+def test_mount_resolution_uses_longest_prefix() -> None:
+    @asgi("/assets", is_mount=True, name="assets")
+    async def assets_handler(scope: "Scope", receive: "Receive", send: "Send") -> None:
+        await ASGIResponse(body=f"assets {scope['path']}".encode(), media_type=MediaType.TEXT)(scope, receive, send)
+
+    @asgi("/assets/images", is_mount=True, name="images")
+    async def images_handler(scope: "Scope", receive: "Receive", send: "Send") -> None:
+        await ASGIResponse(body=f"images {scope['path']}".encode(), media_type=MediaType.TEXT)(scope, receive, send)
+
+    @get("/assets/version/{version:int}", media_type=MediaType.TEXT)
+    def version_handler(version: int) -> str:
+        return f"version {version}"
+
+    with create_test_client(route_handlers=[assets_handler, images_handler, version_handler]) as client:
+        assert client.get("/assets/app.js").text == "assets /app.js/"
+        assert client.get("/assets/images/logo.png").text == "images /logo.png/"
+        assert client.get("/assets/imagesfoo").text == "assets /imagesfoo/"
+        assert client.get("/assets/version/2").text == "version 2"
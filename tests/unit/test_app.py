@@ -162,7 +162,7 @@ def test_app_config_object_used(app_config_object: AppConfig, monkeypatch: pytes
     for field in fields(AppConfig):
         if field.name == "response_cache_config":
             property_mock = PropertyMock(return_value=ResponseCacheConfig())
-        if field.name in ["event_emitter_backend", "response_cache_config"]:
+        if field.name in ["event_emitter_backend", "response_cache_config", "routing_config"]:
             property_mock = PropertyMock(return_value=Mock())
         else:
             # default iterable return value allows the mock properties that need to be iterated over in
@@ -7,9 +7,11 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from pytest_mock import MockerFixture
 
-from litestar import Litestar, asgi
+from litestar import Litestar, asgi, get
 from litestar._asgi.asgi_router import ASGIRouter
+from litestar.config.routing import RoutingConfig
 from litestar.exceptions import ImproperlyConfiguredException
+from litestar.response.base import ASGIResponse
 from litestar.testing import TestClient, create_test_client
 
 if TYPE_CHECKING:
@@ -190,3 +192,97 @@ async def test_lifespan_shutdown_failure(mock_format_exc: MagicMock) -> None:
 
     assert send.call_count == 2
     assert send.call_args_list[1][0][0] == {"type": "lifespan.shutdown.failed", "message": mock_format_exc.return_value}
+
+
+@get("/static", sync_to_thread=False)
+def static_handler() -> None:
+    return None
+
+
+@get("/items/{item_id:int}", sync_to_thread=False)
+def item_handler(item_id: int) -> None:
+    return None
+
+
+def test_routing_cache_caches_static_routes() -> None:
+    with create_test_client([static_handler, item_handler]) as client:
+        for _ in range(3):
+            assert client.get("/static").status_code == 200
+
+        info = client.app.routing_cache_info
+        assert info.hits == 2
+        assert info.misses == 1
+        assert info.bypasses == 0
+        assert info.currsize == 1
+
+
+def test_routing_cache_does_not_cache_path_parameters() -> None:
+    with create_test_client([static_handler, item_handler]) as client:
+        for item_id in range(3):
+            assert client.get(f"/items/{item_id}").status_code == 200
+
+        info = client.app.routing_cache_info
+        assert info.hits == 0
+        assert info.misses == 0
+        assert info.bypasses == 3
+        assert info.currsize == 0
+
+
+def test_routing_cache_evictions() -> None:
+    @get(["/a", "/b", "/c"], sync_to_thread=False)
+    def handler() -> None:
+        return None
+
+    with create_test_client(handler, routing_config=RoutingConfig(cache_size=2)) as client:
+        for path in ("/a", "/b", "/c", "/a"):
+            assert client.get(path).status_code == 200
+
+        info = client.app.routing_cache_info
+        assert info.evictions == 2
+        assert info.currsize == info.maxsize == 2
+
+
+def test_routing_cache_disabled() -> None:
+    with create_test_client(static_handler, routing_config=RoutingConfig(cache_size=0)) as client:
+        for _ in range(2):
+            assert client.get("/static").status_code == 200
+
+        info = client.app.routing_cache_info
+        assert info.hits == 0
+        assert info.misses == 2
+        assert info.currsize == 0
+
+
+def test_routing_cache_invalidated_on_registration() -> None:
+    async def mount_handler(scope: Scope, receive: Receive, send: Send) -> None:
+        await ASGIResponse(body=b"mount")(scope, receive, send)
+
+    @get("/mount/sub", sync_to_thread=False)
+    def sub_handler() -> str:
+        return "sub"
+
+    @get("/mount/{value:int}/items", sync_to_thread=False)
+    def items_handler(value: int) -> str:
+        return "items"
+
+    with create_test_client([asgi("/mount", is_mount=True)(mount_handler), static_handler]) as client:
+        for path in ("/mount/sub", "/mount/other", "/mount/1/items", "/static"):
+            assert client.get(path).status_code == 200
+        assert client.app.routing_cache_info.currsize == 4
+
+        client.app.register(sub_handler)
+        assert client.app.routing_cache_info.currsize == 3
+        assert client.get("/mount/sub").text == "sub"
+
+        client.app.register(items_handler)
+        assert client.app.routing_cache_info.currsize == 1
+        assert client.get("/mount/1/items").text == "items"
+
+
+def test_add_mount_route_after_path_parameter_route_disallowed() -> None:
+    async def handler(scope: Scope, receive: Receive, send: Send) -> None:
+        return None
+
+    app = Litestar(route_handlers=[asgi("/mount-path/{id:str}")(handler)])
+    with pytest.raises(ImproperlyConfiguredException):
+        app.register(asgi("/mount-path", is_static=True)(handler))
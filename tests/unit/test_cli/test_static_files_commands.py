@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import gzip
+import os
+from typing import TYPE_CHECKING
+
+import brotli
+
+from litestar import Litestar
+from litestar.cli.commands.static_files import compress_static_files
+from litestar.cli.main import litestar_group as cli_command
+from litestar.static_files.config import StaticFilesConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from click.testing import CliRunner
+
+    from tests.unit.test_cli.conftest import CreateAppFileFixture
+
+
+def test_compress_static_files(tmp_path: Path) -> None:
+    content = b"console.log('litestar');\n" * 100
+    tmp_path.joinpath("app.js").write_bytes(content)
+    tmp_path.joinpath("small.js").write_bytes(b"console.log('small');")
+    tmp_path.joinpath("archive.tar.gz").write_bytes(gzip.compress(content))
+    tmp_path.joinpath("random.bin").write_bytes(os.urandom(2000))
+    app = Litestar(
+        static_files_config=[
+            StaticFilesConfig(
+                path="/static", directories=[tmp_path], precompressed=True, precompressed_encodings=["br", "gzip"]
+            )
+        ]
+    )
+
+    assert compress_static_files(app) == {"generated": 2, "up_to_date": 0, "not_smaller": 2}
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "app.js",
+        "app.js.br",
+        "app.js.gz",
+        "archive.tar.gz",
+        "random.bin",
+        "small.js",
+    ]
+    assert brotli.decompress(tmp_path.joinpath("app.js.br").read_bytes()) == content
+    assert gzip.decompress(tmp_path.joinpath("app.js.gz").read_bytes()) == content
+
+    assert compress_static_files(app) == {"generated": 0, "up_to_date": 2, "not_smaller": 2}
+    assert compress_static_files(app, force=True) == {"generated": 2, "up_to_date": 0, "not_smaller": 2}
+    # compressing small files does not pay off
+    assert compress_static_files(app, minimum_size=1) == {"generated": 0, "up_to_date": 2, "not_smaller": 4}
+
+
+def test_compress_static_files_command(
+    runner: CliRunner, create_app_file: CreateAppFileFixture, tmp_project_dir: Path
+) -> None:
+    tmp_project_dir.joinpath("static").mkdir()
+    tmp_project_dir.joinpath("static", "app.js").write_text("console.log('litestar');\n" * 100)
+    create_app_file(
+        "static_app.py",
+        content="""
+from litestar import Litestar
+from litestar.static_files.config import StaticFilesConfig
+
+app = Litestar(
+    static_files_config=[
+        StaticFilesConfig(path="/static", directories=["static"], precompressed=True, precompressed_encodings=["gzip"])
+    ]
+)
+""",
+    )
+
+    result = runner.invoke(cli_command, ["--app", "static_app:app", "static-files", "compress"])
+
+    assert result.exit_code == 0, result.output
+    assert "Generated 1 precompressed files" in result.output
+    assert tmp_project_dir.joinpath("static", "app.js.gz").exists()
+
+
+def test_compress_static_files_command_without_precompressed_static_files(
+    runner: CliRunner, create_app_file: CreateAppFileFixture
+) -> None:
+    create_app_file("no_static_app.py")
+
+    result = runner.invoke(cli_command, ["--app", "no_static_app:app", "static-files", "compress"])
+
+    assert result.exit_code == 1
+    assert "No static files are served precompressed" in result.output
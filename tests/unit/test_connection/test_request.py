@@ -9,14 +9,15 @@ from unittest.mock import patch
 
 import pytest
 
-from litestar import MediaType, Request, get
+from litestar import Controller, MediaType, Request, Router, get, post
 from litestar.connection.base import empty_send
 from litestar.datastructures import Address, Cookie
-from litestar.exceptions import InternalServerException, SerializationException
+from litestar.exceptions import InternalServerException, RequestEntityTooLargeException, SerializationException
 from litestar.middleware import MiddlewareProtocol
 from litestar.response.base import ASGIResponse
 from litestar.serialization import encode_json, encode_msgpack
 from litestar.static_files.config import StaticFilesConfig
+from litestar.status_codes import HTTP_201_CREATED, HTTP_413_REQUEST_ENTITY_TOO_LARGE
 from litestar.testing import TestClient, create_test_client
 
 if TYPE_CHECKING:
@@ -401,6 +402,68 @@ def test_chunked_encoding() -> None:
     assert response.json() == {"body": "foobar"}
 
 
+@pytest.mark.parametrize("chunked", (False, True))
+def test_request_max_body_size(chunked: bool) -> None:
+    @post("/", request_max_body_size=6)
+    async def handler(body: bytes) -> bytes:
+        return body
+
+    def post_body() -> Generator[bytes, None, None]:
+        yield b"foo"
+        yield b"bar"
+        yield b"baz"
+
+    with create_test_client(handler) as client:
+        response = client.post("/", content=b"foobar")
+        assert response.status_code == HTTP_201_CREATED
+
+        response = client.post("/", content=post_body() if chunked else b"foobarbaz")
+        assert response.status_code == HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+async def test_request_max_body_size_content_length_rejected_before_receiving() -> None:
+    @post("/", request_max_body_size=6)
+    async def handler(body: bytes) -> None:
+        ...
+
+    async def receive() -> dict:
+        raise AssertionError("the body should not be received")
+
+    scope = {"type": "http", "method": "POST", "path": "/", "headers": [(b"content-length", b"9")]}
+    request = Request[Any, Any, Any]({**scope, "route_handler": handler}, receive)  # type: ignore[arg-type]
+    with pytest.raises(RequestEntityTooLargeException):
+        await request.body()
+
+
+def test_request_max_body_size_layers() -> None:
+    class MyController(Controller):
+        path = "/controller"
+        request_max_body_size = 30
+
+        @post("/")
+        async def controller_handler(self, body: bytes) -> None:
+            ...
+
+        @post("/limited", request_max_body_size=10)
+        async def limited_handler(self, body: bytes) -> None:
+            ...
+
+    @post("/")
+    async def handler(body: bytes) -> None:
+        ...
+
+    router = Router("/router", route_handlers=[MyController, handler], request_max_body_size=None)
+
+    with create_test_client([handler, router], request_max_body_size=15) as client:
+        for path, status_code in (
+            ("/", HTTP_413_REQUEST_ENTITY_TOO_LARGE),
+            ("/router", HTTP_201_CREATED),
+            ("/router/controller", HTTP_201_CREATED),
+            ("/router/controller/limited", HTTP_413_REQUEST_ENTITY_TOO_LARGE),
+        ):
+            assert client.post(path, content=b"x" * 20).status_code == status_code
+
+
 def test_request_send_push_promise() -> None:
     async def app(scope: "Scope", receive: "Receive", send: "Send") -> None:
         # the server is push-enabled
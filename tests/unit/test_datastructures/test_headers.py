@@ -7,6 +7,7 @@ from pytest import FixtureRequest
 from litestar import MediaType
 from litestar.datastructures import (
     Accept,
+    AcceptEncoding,
     CacheControlHeader,
     ETag,
     Headers,
@@ -372,3 +373,33 @@ def test_accept_best_match(accept_value: str, provided_types: List[str], best_ma
 def test_accept_accepts() -> None:
     accept = Accept("text/plain;q=0.8,text/html")
     assert accept.accepts(MediaType.TEXT)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding_value,provided_encodings,best_match",
+    (
+        ("gzip", ["br", "gzip"], "gzip"),
+        ("gzip, br", ["br", "gzip"], "br"),
+        ("gzip, br", ["gzip", "br"], "gzip"),
+        ("gzip;q=1.0, br;q=0.5", ["br", "gzip"], "gzip"),
+        ("GZIP", ["gzip"], "gzip"),
+        ("*", ["br", "gzip"], "br"),
+        ("*, br;q=0", ["br", "gzip"], "gzip"),
+        ("gzip;q=0", ["gzip"], None),
+        ("gzip;q=invalid", ["gzip"], "gzip"),
+        ("identity", ["br", "gzip"], None),
+        ("", ["br", "gzip"], None),
+    ),
+)
+def test_accept_encoding_best_match(
+    accept_encoding_value: str, provided_encodings: List[str], best_match: Optional[str]
+) -> None:
+    assert AcceptEncoding(accept_encoding_value).best_match(provided_encodings) == best_match
+
+
+def test_accept_encoding_accepts() -> None:
+    accept_encoding = AcceptEncoding("gzip;q=0.5, br;q=0")
+    assert accept_encoding.accepts("gzip")
+    assert accept_encoding.quality("gzip") == 0.5
+    assert not accept_encoding.accepts("br")
+    assert not accept_encoding.accepts("zstd")
@@ -0,0 +1,83 @@
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from litestar import Request, get, post
+from litestar.config.routing import RoutingConfig
+from litestar.params import Parameter
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from litestar.testing import create_test_client
+
+
+@get("/items/{item_id:int}", sync_to_thread=False)
+def get_item(
+    request: Request,
+    item_id: int,
+    token: str = Parameter(header="X-API-KEY"),
+    session: Optional[str] = Parameter(cookie="session", required=False),
+    tags: Optional[List[str]] = Parameter(query="tag", required=False),
+    page: int = 1,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    assert request.url.path.startswith("/items")
+    return {"item_id": item_id, "token": token, "session": session, "tags": tags, "page": page, "limit": limit}
+
+
+@post("/items", sync_to_thread=False)
+def create_item(data: Dict[str, Any], name: str) -> Dict[str, Any]:
+    return {"data": data, "name": name}
+
+
+@pytest.mark.parametrize(
+    "url, headers, cookies",
+    [
+        ("/items/1", {"X-API-KEY": "abc"}, {}),
+        ("/items/1?tag=a&tag=b&page=2&limit=3", {"X-API-KEY": "abc"}, {"session": "s"}),
+        ("/items/1?page=2", {}, {}),
+        ("/items/1?page=abc", {"X-API-KEY": "abc"}, {}),
+    ],
+)
+def test_compiled_kwargs_extractors_resolve_like_extractors(
+    url: str, headers: Dict[str, str], cookies: Dict[str, str]
+) -> None:
+    results = {}
+    for compiled_kwargs_extractors in (False, True):
+        with create_test_client(
+            get_item, routing_config=RoutingConfig(compiled_kwargs_extractors=compiled_kwargs_extractors)
+        ) as client:
+            response = client.get(url, headers=headers, cookies=cookies)
+            results[compiled_kwargs_extractors] = (response.status_code, response.json())
+
+    assert results[True] == results[False]
+
+
+def test_compiled_kwargs_extractors_missing_required_parameter() -> None:
+    with create_test_client(get_item, routing_config=RoutingConfig(compiled_kwargs_extractors=True)) as client:
+        response = client.get("/items/1")
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert (
+            response.json()["detail"] == "Missing required parameter x-api-key for url http://testserver.local/items/1"
+        )
+
+    with create_test_client(create_item, routing_config=RoutingConfig(compiled_kwargs_extractors=True)) as client:
+        response = client.post("/items", json={"a": 1})
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert "Missing required parameter name" in response.json()["detail"]
+
+
+def test_compiled_kwargs_extractors_data() -> None:
+    with create_test_client(create_item, routing_config=RoutingConfig(compiled_kwargs_extractors=True)) as client:
+        response = client.post("/items?name=item", json={"a": 1})
+        assert response.status_code == HTTP_201_CREATED
+        assert response.json() == {"data": {"a": 1}, "name": "item"}
+
+
+def test_compiled_kwargs_extractors_not_created_by_default() -> None:
+    with create_test_client(get_item) as client:
+        route_handler, kwargs_model = client.app.routes[0].route_handler_map["GET"]  # type: ignore[union-attr]
+        assert kwargs_model.compiled_extractor is None
+
+    with create_test_client(get_item, routing_config=RoutingConfig(compiled_kwargs_extractors=True)) as client:
+        route_handler, kwargs_model = client.app.routes[0].route_handler_map["GET"]  # type: ignore[union-attr]
+        assert kwargs_model.compiled_extractor is not None
+        assert client.get("/items/1", headers={"X-API-KEY": "abc"}).status_code == HTTP_200_OK
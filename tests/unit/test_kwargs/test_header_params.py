@@ -4,10 +4,11 @@ from uuid import uuid4
 import pytest
 from pydantic import UUID4
 
-from litestar import get
+from litestar import Litestar, get
+from litestar.config.routing import RoutingConfig
 from litestar.params import Parameter, ParameterKwarg
 from litestar.status_codes import HTTP_200_OK, HTTP_400_BAD_REQUEST
-from litestar.testing import create_test_client
+from litestar.testing import RequestFactory, create_test_client
 
 
 @pytest.mark.parametrize(
@@ -55,3 +56,32 @@ def test_header_param_example() -> None:
     with create_test_client(my_method, debug=True) as client:
         response = client.get(f"/users/{uuid4()}/", headers={"X-API-KEY": test_token})
         assert response.status_code == HTTP_200_OK
+
+
+@pytest.mark.parametrize("compiled_kwargs_extractors", (False, True))
+def test_header_and_cookie_params_are_decoded_lazily(compiled_kwargs_extractors: bool) -> None:
+    @get("/", sync_to_thread=False)
+    def handler(
+        token: str = Parameter(header="X-API-KEY"),
+        session: str = Parameter(cookie="session"),
+        theme: Optional[str] = Parameter(cookie="theme", required=False),
+    ) -> None:
+        return None
+
+    app = Litestar(
+        route_handlers=[handler],
+        openapi_config=None,
+        routing_config=RoutingConfig(compiled_kwargs_extractors=compiled_kwargs_extractors),
+    )
+    _, kwargs_model = app.routes[0].route_handler_map["GET"]  # type: ignore[union-attr]
+    request = RequestFactory(app=app).get(
+        "/", headers={"x-api-key": "abc", "accept": "text/html"}, cookies="session=s1; other=%20o"
+    )
+
+    assert kwargs_model.to_kwargs(request) == {"token": "abc", "session": "s1", "theme": None}
+    assert "_headers" not in request.scope
+    assert "_cookies" not in request.scope
+
+    assert request.headers["accept"] == "text/html"
+    assert request.cookies == {"session": "s1", "other": " o"}
+    assert kwargs_model.to_kwargs(request) == {"token": "abc", "session": "s1", "theme": None}
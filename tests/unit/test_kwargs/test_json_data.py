@@ -1,7 +1,16 @@
-from litestar import post
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from litestar import Request, post
+from litestar._kwargs import extractors
+from litestar._kwargs.extractors import create_typed_data_extractor
+from litestar.di import Provide
+from litestar.enums import RequestEncodingType
 from litestar.params import Body
-from litestar.status_codes import HTTP_201_CREATED
-from litestar.testing import create_test_client
+from litestar.status_codes import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from litestar.testing import RequestFactory, create_test_client
 
 from . import Form
 
@@ -24,3 +33,95 @@ def test_empty_dict_allowed() -> None:
     with create_test_client(test_method) as client:
         response = client.post("/test", json={})
         assert response.status_code == HTTP_201_CREATED
+
+
+@dataclass
+class Person:
+    name: str
+    age: int
+
+
+def test_request_body_decoded_into_data_type() -> None:
+    @post(path="/test", signature_namespace={"Person": Person})
+    def test_method(data: List[Person], request: Request) -> None:
+        assert data == [Person(name="Moishe Zuchmir", age=30)]
+        assert "_json" not in request.scope
+
+    with create_test_client(test_method) as client:
+        route_handler, kwargs_model = client.app.routes[0].route_handler_map["POST"]  # type: ignore[union-attr]
+        assert kwargs_model.expected_data_type == List[Person]
+
+        response = client.post("/test", json=[{"name": "Moishe Zuchmir", "age": 30}])
+        assert response.status_code == HTTP_201_CREATED
+
+
+def test_request_body_requiring_conversion() -> None:
+    @post(path="/test", signature_namespace={"Person": Person})
+    def test_method(data: Person) -> None:
+        assert data == Person(name="Moishe Zuchmir", age=30)
+
+    with create_test_client(test_method) as client:
+        response = client.post("/test", json={"name": "Moishe Zuchmir", "age": "30"})
+        assert response.status_code == HTTP_201_CREATED
+
+
+def test_request_body_validation_error() -> None:
+    @post(path="/test", signature_namespace={"Person": Person})
+    def test_method(data: Person) -> None:
+        ...
+
+    with create_test_client(test_method) as client:
+        response = client.post("/test", json={"name": "Moishe Zuchmir", "age": "thirty"})
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.json()["extra"] == [{"key": "age", "message": "Expected `int`, got `str`", "source": "body"}]
+
+
+def test_optional_request_body_empty() -> None:
+    @post(path="/test", signature_namespace={"Person": Person})
+    def test_method(data: Optional[Person]) -> None:
+        assert data is None
+
+    with create_test_client(test_method) as client:
+        assert client.post("/test").status_code == HTTP_201_CREATED
+
+
+def test_request_body_shared_with_dependency_not_decoded_into_data_type() -> None:
+    def get_name(data: Dict[str, Any]) -> str:
+        return str(data["name"])
+
+    @post(path="/test", dependencies={"name": Provide(get_name, sync_to_thread=False)}, sync_to_thread=False)
+    def test_method(data: Person, name: str) -> str:
+        assert data == Person(name=name, age=30)
+        return name
+
+    with create_test_client(test_method, signature_namespace={"Person": Person}) as client:
+        route_handler, kwargs_model = client.app.routes[0].route_handler_map["POST"]  # type: ignore[union-attr]
+        assert kwargs_model.expected_data_type is None
+
+        response = client.post("/test", json={"name": "Moishe Zuchmir", "age": 30})
+        assert response.status_code == HTTP_201_CREATED
+        assert response.text == "Moishe Zuchmir"
+
+
+class _Opaque:
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+async def test_typed_data_extractor_does_not_hide_unexpected_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    def dec_hook(type_: Any, value: Any) -> Any:
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(extractors, "dec_hook", dec_hook)
+    extractor = create_typed_data_extractor(_Opaque, RequestEncodingType.JSON)
+    assert extractor is not None
+
+    with pytest.raises(RuntimeError):
+        await extractor(RequestFactory().post(data={"value": 1}))
+
+
+async def test_typed_data_extractor_falls_back_on_validation_errors() -> None:
+    extractor = create_typed_data_extractor(Dict[str, int], RequestEncodingType.JSON)
+    assert extractor is not None
+
+    assert await extractor(RequestFactory().post(data={"value": "1"})) == {"value": "1"}
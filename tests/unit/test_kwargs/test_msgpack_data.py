@@ -1,4 +1,6 @@
-from litestar import post
+from dataclasses import dataclass
+
+from litestar import Request, post
 from litestar.enums import RequestEncodingType
 from litestar.params import Body
 from litestar.serialization import encode_msgpack
@@ -22,3 +24,19 @@ def test_request_body_msgpack() -> None:
     with create_test_client([test_header, test_annotated]) as client:
         response = client.post("/annotated", content=encode_msgpack(test_data))
         assert response.status_code == HTTP_201_CREATED
+
+
+def test_request_body_msgpack_decoded_into_data_type() -> None:
+    @dataclass
+    class Person:
+        name: str
+        age: int
+
+    @post(path="/test", signature_namespace={"Person": Person})
+    def test_method(request: Request, data: Person = Body(media_type=RequestEncodingType.MESSAGEPACK)) -> None:
+        assert data == Person(name="Moishe Zuchmir", age=30)
+        assert "_msgpack" not in request.scope
+
+    with create_test_client(test_method) as client:
+        response = client.post("/test", content=encode_msgpack({"name": "Moishe Zuchmir", "age": 30}))
+        assert response.status_code == HTTP_201_CREATED
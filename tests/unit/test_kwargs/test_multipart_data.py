@@ -3,15 +3,18 @@ from collections import defaultdict
 from os import path
 from os.path import dirname, join, realpath
 from pathlib import Path
-from typing import Any, DefaultDict, Dict, List, Optional, Type
+from typing import Any, AsyncIterator, DefaultDict, Dict, List, Optional, Type
 
 import pytest
 from msgspec import convert
 from pydantic import BaseConfig, BaseModel
 
-from litestar import Request, post
+from litestar import Request, _multipart, post
+from litestar._multipart import parse_multipart_form
+from litestar.constants import ONE_MEGABYTE
 from litestar.datastructures.upload_file import UploadFile
 from litestar.enums import RequestEncodingType
+from litestar.exceptions import ValidationException
 from litestar.params import Body
 from litestar.status_codes import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
 from litestar.testing import create_test_client
@@ -444,3 +447,96 @@ def test_multipart_form_part_limit_body_param_precedence() -> None:
         data = {str(i): "a" for i in range(route_limit + 1)}
         response = client.post("/", files=data)
         assert response.status_code == HTTP_400_BAD_REQUEST
+
+
+MULTIPART_BODY = (
+    b"preamble\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="name"\r\n'
+    b"\r\n"
+    b"Moishe Zuchmir\r\n"
+    b"--boundary\r\n"
+    b'Content-Disposition: form-data; name="file"; filename="file.txt"\r\n'
+    b"Content-Type: text/plain\r\n"
+    b"\r\n"
+    b"\r\n--boundar\r\n-- boundary is not a delimiter\r\n"
+    b"--boundary--\r\n"
+    b"epilogue"
+)
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 7, 64, len(MULTIPART_BODY)))
+async def test_parse_multipart_form_chunked(chunk_size: int) -> None:
+    async def stream() -> AsyncIterator[bytes]:
+        for i in range(0, len(MULTIPART_BODY), chunk_size):
+            yield MULTIPART_BODY[i : i + chunk_size]
+
+    form = await parse_multipart_form(stream(), boundary=b"boundary")
+
+    assert form["name"] == "Moishe Zuchmir"
+    assert form["file"].filename == "file.txt"
+    assert form["file"].headers == {"content-disposition": "form-data", "content-type": "text/plain"}
+    assert await form["file"].read() == b"\r\n--boundar\r\n-- boundary is not a delimiter"
+
+
+def test_multipart_request_large_file_spooled_to_disk() -> None:
+    file_data = bytes(range(256)) * (3 * ONE_MEGABYTE // 256)
+
+    @post("/")
+    async def handler(data: UploadFile = Body(media_type=RequestEncodingType.MULTI_PART)) -> None:
+        assert data.rolled_to_disk
+        assert await data.read() == file_data
+
+    with create_test_client(route_handlers=[handler]) as client:
+        response = client.post("/", files={"file": ("file.bin", file_data, "application/octet-stream")})
+        assert response.status_code == HTTP_201_CREATED
+
+
+async def test_parse_multipart_form_padding_limit() -> None:
+    async def stream() -> AsyncIterator[bytes]:
+        yield b"--boundary"
+        while True:
+            yield b" " * 1024
+
+    with pytest.raises(ValidationException):
+        await parse_multipart_form(stream(), boundary=b"boundary")
+
+
+async def test_parse_multipart_form_closes_upload_files_on_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    upload_files: List[UploadFile] = []
+
+    class RecordingUploadFile(UploadFile):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            upload_files.append(self)
+
+    monkeypatch.setattr(_multipart, "UploadFile", RecordingUploadFile)
+
+    async def stream() -> AsyncIterator[bytes]:
+        yield (
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="first"; filename="first.txt"\r\n'
+            b"\r\n"
+            b"first\r\n"
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="second"; filename="second.txt"\r\n'
+            b"\r\n"
+            b"sec"
+        )
+        raise RuntimeError("client disconnected")
+
+    with pytest.raises(RuntimeError):
+        await parse_multipart_form(stream(), boundary=b"boundary")
+
+    assert len(upload_files) == 2
+    assert all(upload_file.file.closed for upload_file in upload_files)
+
+
+async def test_parse_multipart_form_field_size_limit() -> None:
+    async def stream() -> AsyncIterator[bytes]:
+        yield b'--boundary\r\nContent-Disposition: form-data; name="value"\r\n\r\n'
+        while True:
+            yield b"x" * 64 * 1024
+
+    with pytest.raises(ValidationException):
+        await parse_multipart_form(stream(), boundary=b"boundary")
@@ -1,14 +1,18 @@
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
-from litestar import MediaType, asgi, get
+from litestar import MediaType, asgi, get, websocket
 from litestar.datastructures.headers import MutableScopeHeaders
+from litestar.enums import ScopeType
 from litestar.exceptions import ValidationException
 from litestar.middleware import AbstractMiddleware, DefineMiddleware
+from litestar.middleware._utils import should_bypass_middleware
 from litestar.response.base import ASGIResponse
 from litestar.status_codes import HTTP_400_BAD_REQUEST
 from litestar.testing import create_test_client
 
 if TYPE_CHECKING:
+    from litestar.connection import WebSocket
     from litestar.types import Message, Receive, Scope, Send
 
 
@@ -141,3 +145,81 @@ def test_exclude_by_opt_key() -> None:
     with create_test_client(handler, middleware=[DefineMiddleware(SubclassMiddleware)]) as client:
         response = client.get("/")
         assert "test" not in response.headers
+
+
+def test_middleware_bypassed_at_build_time_is_not_in_stack() -> None:
+    class SubclassMiddleware(AbstractMiddleware):
+        exclude = r"^/excluded"
+        exclude_opt_key = "exclude_route"
+
+        async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+            await self.app(scope, receive, send)
+
+    @get("/excluded")
+    def excluded_handler() -> None:
+        return None
+
+    @get("/opted-out", exclude_route=True)
+    def opted_out_handler() -> None:
+        return None
+
+    @get("/included")
+    def included_handler() -> None:
+        return None
+
+    @get("/{param:str}")
+    def param_handler(param: str) -> None:
+        return None
+
+    @websocket("/ws")
+    async def websocket_handler(socket: "WebSocket") -> None:
+        await socket.close()
+
+    class HTTPOnlyMiddleware(SubclassMiddleware):
+        scopes = {ScopeType.HTTP}
+
+    with create_test_client(
+        [excluded_handler, opted_out_handler, included_handler, param_handler, websocket_handler],
+        middleware=[DefineMiddleware(SubclassMiddleware), DefineMiddleware(HTTPOnlyMiddleware)],
+    ) as client:
+        route_middleware = {
+            handler.handler_name: names for (_, handler), names in client.app.asgi_router.route_middleware.items()
+        }
+        assert route_middleware["excluded_handler"] == []
+        assert route_middleware["opted_out_handler"] == []
+        assert route_middleware["included_handler"] == ["SubclassMiddleware", "HTTPOnlyMiddleware"]
+        assert route_middleware["param_handler"] == ["SubclassMiddleware", "HTTPOnlyMiddleware"]
+        assert route_middleware["websocket_handler"] == ["SubclassMiddleware"]
+
+
+def test_per_request_check_skipped_when_resolved_at_build_time() -> None:
+    class SubclassMiddleware(AbstractMiddleware):
+        exclude = r"^/excluded"
+
+        async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+            async def _send(message: "Message") -> None:
+                if message["type"] == "http.response.start":
+                    MutableScopeHeaders(message).add("test", "123")
+                await send(message)
+
+            await self.app(scope, receive, _send)
+
+    @get("/included")
+    def included_handler() -> None:
+        return None
+
+    @get("/{param:str}")
+    def param_handler(param: str) -> None:
+        return None
+
+    with patch(
+        "litestar.middleware.base.should_bypass_middleware", wraps=should_bypass_middleware
+    ) as mock_should_bypass, create_test_client(
+        [included_handler, param_handler], middleware=[DefineMiddleware(SubclassMiddleware)]
+    ) as client:
+        assert client.get("/included").headers["test"] == "123"
+        mock_should_bypass.assert_not_called()
+
+        assert "test" not in client.get("/excluded").headers
+        assert client.get("/other").headers["test"] == "123"
+        assert mock_should_bypass.call_count == 2
@@ -1,14 +1,19 @@
-from typing import AsyncIterator, Callable, Literal
+import gzip
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, List, Literal, Optional, Tuple
 from unittest.mock import MagicMock
 
 import pytest
+import zstandard
 
 from litestar import MediaType, WebSocket, get, websocket
 from litestar.config.compression import CompressionConfig
 from litestar.enums import CompressionEncoding
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.handlers import HTTPRouteHandler
+from litestar.middleware import compression
 from litestar.middleware.compression import CompressionMiddleware
+from litestar.response.file import File
 from litestar.response.streaming import Stream
 from litestar.status_codes import HTTP_200_OK
 from litestar.testing import create_test_client
@@ -193,3 +198,217 @@ async def test_compression_streaming_response_emitted_messages(
     # second body message with more_body=True will be empty if zlib buffers output and is not flushed
     await wrapped_send(HTTPResponseBodyEvent(type="http.response.body", body=b"abc", more_body=True))
     assert mock.mock_calls[-1].args[0]["body"]
+
+
+async def test_compression_disables_zerocopysend(create_scope: Callable[..., Scope], mock_asgi_app: ASGIApp) -> None:
+    scope = create_scope(extensions={"http.response.zerocopysend": {}, "http.response.trailers": {}})
+
+    CompressionMiddleware(mock_asgi_app, CompressionConfig(backend="gzip")).create_compression_send_wrapper(
+        MagicMock(), CompressionEncoding.GZIP, scope
+    )
+    assert scope["extensions"] == {"http.response.trailers": {}}
+
+
+@pytest.mark.parametrize(
+    "media_type, should_compress",
+    (
+        ("image/png", False),
+        ("video/mp4", False),
+        ("application/zip", False),
+        ("image/svg+xml", True),
+        ("text/html; charset=utf-8", True),
+    ),
+)
+def test_compression_skips_excluded_media_types(media_type: str, should_compress: bool) -> None:
+    @get("/", media_type=media_type)
+    def handler() -> bytes:
+        return b"_litestar_" * 4000
+
+    with create_test_client(route_handlers=[handler], compression_config=CompressionConfig(backend="gzip")) as client:
+        response = client.get("/", headers={"accept-encoding": "gzip"})
+        assert response.content == b"_litestar_" * 4000
+        assert (response.headers.get("content-encoding") == "gzip") is should_compress
+
+
+def test_compression_skips_small_file_responses(tmp_path: Path) -> None:
+    path = tmp_path / "small.txt"
+    path.write_text("_litestar_")
+
+    @get("/")
+    def handler() -> File:
+        return File(path=path, chunk_size=2)
+
+    with create_test_client(route_handlers=[handler], compression_config=CompressionConfig(backend="gzip")) as client:
+        response = client.get("/", headers={"accept-encoding": "gzip"})
+        assert response.text == "_litestar_"
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-length"] == "10"
+
+
+async def _send_compressed(config: CompressionConfig, chunks: List[bytes], scope: Scope, app: ASGIApp) -> List[Message]:
+    messages: List[Message] = []
+
+    async def fake_send(message: Message) -> None:
+        messages.append(message)
+
+    wrapped_send = CompressionMiddleware(app, config).create_compression_send_wrapper(
+        fake_send, CompressionEncoding.GZIP, scope
+    )
+    await wrapped_send(HTTPResponseStartEvent(type="http.response.start", status=200, headers={}))
+    for i, chunk in enumerate(chunks, start=1):
+        await wrapped_send(HTTPResponseBodyEvent(type="http.response.body", body=chunk, more_body=i < len(chunks)))
+    return messages
+
+
+@pytest.mark.parametrize(
+    "flush_policy, flush_size, expected_body_messages",
+    (("chunk", 16 * 1024, 5), ("size", 200, 4), ("none", 16 * 1024, 2)),
+)
+async def test_compression_flush_policy(
+    flush_policy: Literal["chunk", "size", "none"],
+    flush_size: int,
+    expected_body_messages: int,
+    create_scope: Callable[..., Scope],
+    mock_asgi_app: ASGIApp,
+) -> None:
+    chunks = [b"_litestar_" * 10] * 5
+    config = CompressionConfig(backend="gzip", minimum_size=1, flush_policy=flush_policy, flush_size=flush_size)
+
+    messages = await _send_compressed(config, chunks, create_scope(), mock_asgi_app)
+
+    start_message, *body_messages = messages
+    assert dict(start_message["headers"])[b"content-encoding"] == b"gzip"
+    assert len(body_messages) == expected_body_messages
+    assert gzip.decompress(b"".join(message["body"] for message in body_messages)) == b"".join(chunks)
+
+
+async def test_compression_holds_back_small_streams(create_scope: Callable[..., Scope], mock_asgi_app: ASGIApp) -> None:
+    config = CompressionConfig(backend="gzip", minimum_size=100, flush_policy="none")
+
+    start_message, body_message = await _send_compressed(config, [b"abc", b"def"], create_scope(), mock_asgi_app)
+    assert b"content-encoding" not in dict(start_message["headers"])
+    assert body_message["body"] == b"abcdef"
+
+    start_message, *body_messages = await _send_compressed(
+        config, [b"abc", b"d" * 100, b"ef"], create_scope(), mock_asgi_app
+    )
+    assert dict(start_message["headers"])[b"content-encoding"] == b"gzip"
+    assert gzip.decompress(b"".join(message["body"] for message in body_messages)) == b"abc" + b"d" * 100 + b"ef"
+
+
+@pytest.mark.parametrize("flush_size, should_raise", ((0, True), (-1, True), (1, False)))
+def test_config_flush_size_validation(flush_size: int, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="gzip", flush_size=flush_size)
+    else:
+        CompressionConfig(backend="gzip", flush_size=flush_size)
+
+
+def test_zstd_compressed_response(handler: HTTPRouteHandler) -> None:
+    with create_test_client(route_handlers=[handler], compression_config=CompressionConfig(backend="zstd")) as client:
+        response = client.get("/", headers={"accept-encoding": "zstd"})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-encoding"] == "zstd"
+        assert int(response.headers["content-length"]) < 40000
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(response.content) == b"_litestar_" * 4000
+
+
+def test_zstd_streaming_response() -> None:
+    @get("/streaming-response")
+    def streaming_handler() -> Stream:
+        return Stream(streaming_iter(content=b"_litestar_" * 400, count=10))
+
+    with create_test_client(
+        route_handlers=[streaming_handler], compression_config=CompressionConfig(backend="zstd")
+    ) as client:
+        response = client.get("/streaming-response", headers={"accept-encoding": "zstd"})
+        assert response.headers["content-encoding"] == "zstd"
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(response.content) == b"_litestar_" * 4000
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, fallback_backends, expected_encoding",
+    (
+        ("gzip, zstd, br", None, "br"),
+        ("gzip, zstd", None, "gzip"),
+        ("gzip, zstd", ["zstd", "gzip"], "zstd"),
+        ("gzip, zstd;q=0.5", ["zstd", "gzip"], "gzip"),
+        ("br;q=0, gzip", None, "gzip"),
+        ("*", None, "br"),
+        ("deflate", ["zstd", "gzip"], None),
+    ),
+)
+def test_compression_encoding_negotiation(
+    accept_encoding: str,
+    fallback_backends: Optional[List[Literal["gzip", "brotli", "zstd"]]],
+    expected_encoding: Optional[str],
+    handler: HTTPRouteHandler,
+) -> None:
+    config = CompressionConfig(backend="brotli", fallback_backends=fallback_backends)
+    with create_test_client(route_handlers=[handler], compression_config=config) as client:
+        response = client.get("/", headers={"accept-encoding": accept_encoding})
+        assert response.headers.get("content-encoding") == expected_encoding
+
+
+@pytest.mark.parametrize(
+    "backend, brotli_gzip_fallback, fallback_backends, expected_backends",
+    (
+        ("brotli", True, None, ("brotli", "gzip")),
+        ("brotli", False, None, ("brotli",)),
+        ("gzip", True, None, ("gzip",)),
+        ("zstd", True, ["brotli", "zstd", "gzip"], ("zstd", "brotli", "gzip")),
+    ),
+)
+def test_config_backends(
+    backend: Literal["gzip", "brotli", "zstd"],
+    brotli_gzip_fallback: bool,
+    fallback_backends: Optional[List[Literal["gzip", "brotli", "zstd"]]],
+    expected_backends: Tuple[str, ...],
+) -> None:
+    config = CompressionConfig(
+        backend=backend, brotli_gzip_fallback=brotli_gzip_fallback, fallback_backends=fallback_backends
+    )
+    assert config.backends == expected_backends
+
+
+@pytest.mark.parametrize("offload_minimum_size, expected_offloaded", ((None, 0), (1000, 3), (500, 5)))
+async def test_compression_offloads_large_bodies(
+    offload_minimum_size: Optional[int],
+    expected_offloaded: int,
+    create_scope: Callable[..., Scope],
+    mock_asgi_app: ASGIApp,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    offloaded: List[bytes] = []
+
+    async def run_sync(func: Callable[..., bytes], body: bytes, *args: Any) -> bytes:
+        offloaded.append(body)
+        return func(body, *args)
+
+    monkeypatch.setattr(compression, "run_sync", run_sync)
+    config = CompressionConfig(backend="gzip", offload_minimum_size=offload_minimum_size)
+    chunks = [b"a" * 1000, b"b" * 100, b"c" * 500, b"d" * 1000, b"e" * 1000, b"f" * 500]
+
+    messages = await _send_compressed(config, chunks, create_scope(), mock_asgi_app)
+
+    assert len(offloaded) == expected_offloaded
+    assert gzip.decompress(b"".join(message["body"] for message in messages[1:])) == b"".join(chunks)
+
+
+@pytest.mark.parametrize("zstd_level, should_raise", ((0, True), (1, False), (22, False), (23, True)))
+def test_config_zstd_level_validation(zstd_level: int, should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="zstd", zstd_level=zstd_level)
+    else:
+        CompressionConfig(backend="zstd", zstd_level=zstd_level)
+
+
+@pytest.mark.parametrize("offload_minimum_size, should_raise", ((0, True), (None, False), (1, False)))
+def test_config_offload_minimum_size_validation(offload_minimum_size: Optional[int], should_raise: bool) -> None:
+    if should_raise:
+        with pytest.raises(ImproperlyConfiguredException):
+            CompressionConfig(backend="gzip", offload_minimum_size=offload_minimum_size)
+    else:
+        CompressionConfig(backend="gzip", offload_minimum_size=offload_minimum_size)
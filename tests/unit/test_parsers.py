@@ -1,3 +1,4 @@
+import inspect
 from typing import Any, Dict, Tuple
 from urllib.parse import urlencode
 
@@ -5,8 +6,11 @@ import pytest
 
 from litestar import HttpMethod
 from litestar._parsers import (
+    ParserCache,
     _parse_headers,
     parse_cookie_string,
+    parse_cookie_values,
+    parse_header_values,
     parse_headers,
     parse_query_string,
     parse_url_encoded_form_data,
@@ -17,7 +21,7 @@ from litestar.testing import RequestFactory, create_test_client
 
 def test_parse_form_data() -> None:
     result = parse_url_encoded_form_data(
-        encoded_data=urlencode(
+        urlencode(
             [
                 ("value", "10"),
                 ("value", "12"),
@@ -41,7 +45,7 @@ def test_parse_form_data() -> None:
 
 def test_parse_utf8_form_data() -> None:
     result = parse_url_encoded_form_data(
-        encoded_data=urlencode(
+        urlencode(
             [
                 ("value", "äüß"),
             ]
@@ -50,7 +54,7 @@ def test_parse_utf8_form_data() -> None:
     assert result == {"value": "äüß"}
 
 
-@pytest.mark.parametrize(
+cookie_strings_parametrization = pytest.mark.parametrize(
     "cookie_string, expected",
     (
         ("ABC    = 123;   efg  =   456", {"ABC": "123", "efg": "456"}),
@@ -68,10 +72,26 @@ def test_parse_utf8_form_data() -> None:
         ),
     ),
 )
+
+
+@cookie_strings_parametrization
 def test_parse_cookie_string(cookie_string: str, expected: Dict[str, str]) -> None:
     assert parse_cookie_string(cookie_string) == expected
 
 
+@cookie_strings_parametrization
+def test_parse_cookie_values(cookie_string: str, expected: Dict[str, str]) -> None:
+    assert parse_cookie_values(cookie_string, frozenset(expected)) == expected
+    name = next(iter(expected))
+    assert parse_cookie_values(cookie_string, frozenset((name, "missing"))) == {name: expected[name]}
+
+
+def test_parse_header_values() -> None:
+    headers = [[b"host", b"localhost"], [b"x-foo", "äüß".encode()], [b"x-bar", b"1"], [b"x-foo", b"last"]]
+    assert parse_header_values(headers, frozenset((b"x-foo", b"missing"))) == {"x-foo": "last"}
+    assert parse_header_values(headers, frozenset((b"host", b"x-bar"))) == {"host": "localhost", "x-bar": "1"}
+
+
 def test_parse_query_string() -> None:
     query: Dict[str, Any] = {
         "value": "10",
@@ -130,3 +150,61 @@ def test_parse_headers() -> None:
     # does raise an error
     with pytest.raises(TypeError):
         _parse_headers(headers)  # type: ignore[arg-type]
+
+
+def test_parser_cache_hits() -> None:
+    cache = ParserCache(maxsize=1024 * 1024, max_entry_size=100)
+    parse = cache.cached(len)(lambda value: value.upper())
+
+    assert parse("abc") == "ABC"
+    assert parse("abc") == "ABC"
+    assert cache.info()[:3] == (1, 1, 0)
+
+
+def test_parser_cache_does_not_cache_large_inputs() -> None:
+    cache = ParserCache(maxsize=1024 * 1024, max_entry_size=100)
+    parse = cache.cached(len)(lambda value: value.upper())
+
+    parse("a" * 101)
+    parse("a" * 101)
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (0, 2, 0)
+
+
+def test_parser_cache_evicts_to_stay_within_budget() -> None:
+    cache = ParserCache(maxsize=2000, max_entry_size=100)
+    parse = cache.cached(len)(lambda value: value.upper())
+
+    parse("frequent")
+    for i in range(100):
+        parse(f"value-{i}")
+        parse("frequent")
+
+    info = cache.info()
+    assert 0 < info.currsize <= 2000
+    assert info.evictions > 0
+    # an entry that is referenced between evictions is given a second chance
+    assert info.misses == 101
+
+
+def test_parser_cache_preserves_parser_signature() -> None:
+    assert inspect.signature(parse_url_encoded_form_data) == inspect.signature(parse_url_encoded_form_data.__wrapped__)
+    assert parse_url_encoded_form_data.__name__ == "parse_url_encoded_form_data"
+
+
+def test_parser_cache_configure() -> None:
+    cache = ParserCache(maxsize=1024 * 1024, max_entry_size=100)
+    parse = cache.cached(len)(lambda value: value.upper())
+
+    for i in range(10):
+        parse(f"value-{i}")
+    assert cache.info().currsize > 500
+
+    cache.configure(maxsize=500, max_entry_size=200)
+    info = cache.info()
+    assert 0 < info.currsize <= info.maxsize == 500
+    assert info.evictions > 0
+
+    parse("a" * 150)
+    parse("a" * 150)
+    assert cache.info().hits == 1
@@ -1,21 +1,31 @@
 import os
 from email.utils import formatdate
+from io import BytesIO
 from os import stat, urandom
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
+from anyio import Event
 from fsspec.implementations.local import LocalFileSystem
 
-from litestar import get
+from litestar import get, post
+from litestar.config.compression import CompressionConfig
 from litestar.connection.base import empty_send
-from litestar.datastructures import ETag
+from litestar.datastructures import CacheControlHeader, ETag
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.file_system import BaseLocalFileSystem, FileSystemAdapter
+from litestar.response._ranges import MAX_RANGES, _parse_ranges
 from litestar.response.file import ASGIFileResponse, File, async_file_iterator
-from litestar.status_codes import HTTP_200_OK
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_206_PARTIAL_CONTENT,
+    HTTP_304_NOT_MODIFIED,
+    HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+)
 from litestar.testing import create_test_client
-from litestar.types import FileSystemProtocol
+from litestar.types import FileSystemProtocol, Message
 
 
 @pytest.mark.parametrize("content_disposition_type", ("inline", "attachment"))
@@ -276,3 +286,275 @@ async def test_file_response_with_missing_file_raises_error(tmpdir: Path) -> Non
     with pytest.raises(ImproperlyConfiguredException):
         asgi_response = ASGIFileResponse(file_path=path, filename="404.txt")
         await asgi_response.start_response(empty_send)
+
+
+def test_file_response_not_modified(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+
+    @get("/", cache_control=CacheControlHeader(max_age=60))
+    def handler() -> File:
+        return File(path=path)
+
+    with create_test_client(handler) as client:
+        response = client.get("/")
+        etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+        for headers in ({"if-none-match": etag}, {"if-none-match": f'"other", W/{etag}'}, {"if-none-match": "*"}):
+            not_modified_response = client.get("/", headers=headers)
+            assert not_modified_response.status_code == HTTP_304_NOT_MODIFIED
+            assert not_modified_response.content == b""
+            assert not_modified_response.headers["etag"] == etag
+            assert not_modified_response.headers["cache-control"] == "max-age=60"
+            assert "content-length" not in not_modified_response.headers
+            assert "content-type" not in not_modified_response.headers
+
+        assert client.get("/", headers={"if-modified-since": last_modified}).status_code == HTTP_304_NOT_MODIFIED
+        # If-None-Match takes precedence over If-Modified-Since
+        assert (
+            client.get("/", headers={"if-none-match": '"other"', "if-modified-since": last_modified}).status_code
+            == HTTP_200_OK
+        )
+        assert client.get("/", headers={"if-none-match": '"other"'}).status_code == HTTP_200_OK
+        assert (
+            client.get(
+                "/", headers={"if-modified-since": formatdate(path.stat().st_mtime - 10, usegmt=True)}
+            ).status_code
+            == HTTP_200_OK
+        )
+        assert client.get("/", headers={"if-modified-since": "invalid"}).status_code == HTTP_200_OK
+
+
+def test_file_response_conditional_headers_ignored_for_other_methods(tmpdir: Path) -> None:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(b"content")
+
+    @post("/")
+    def handler() -> File:
+        return File(path=path)
+
+    with create_test_client(handler) as client:
+        etag = client.post("/").headers["etag"]
+        response = client.post("/", headers={"if-none-match": etag})
+        assert response.status_code == HTTP_201_CREATED
+        assert response.content == b"content"
+
+
+@pytest.mark.parametrize(
+    "range_header, expected_ranges",
+    [
+        ("bytes=0-4", [(0, 4)]),
+        ("bytes=95-", [(95, 99)]),
+        ("bytes=-5", [(95, 99)]),
+        ("bytes=-500", [(0, 99)]),
+        ("bytes=90-500", [(90, 99)]),
+        ("BYTES = 0-1 , 5-6,", [(0, 1), (5, 6)]),
+        ("bytes=5-6,0-1", [(0, 1), (5, 6)]),
+        ("bytes=0-4,3-8,9-9", [(0, 9)]),
+        ("bytes=100-", []),
+        ("bytes=-0", []),
+        ("bytes=5-4", None),
+        ("bytes=-", None),
+        ("bytes=a-b", None),
+        ("bytes=", None),
+        ("items=0-4", None),
+    ],
+)
+def test_parse_ranges(range_header: str, expected_ranges: Optional[List[Tuple[int, int]]]) -> None:
+    assert _parse_ranges(range_header, 100) == expected_ranges
+
+
+def test_parse_ranges_limits_number_of_ranges() -> None:
+    range_header = "bytes=" + ",".join(f"{i * 2}-{i * 2}" for i in range(MAX_RANGES + 1))
+    assert _parse_ranges(range_header, 1000) is None
+    assert len(_parse_ranges(range_header.rsplit(",", 1)[0], 1000) or []) == MAX_RANGES
+
+
+@pytest.fixture()
+def range_file(tmpdir: Path) -> Path:
+    path = Path(tmpdir / "file.txt")
+    path.write_bytes(bytes(range(256)) * 4)
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [3, 1024 * 1024])
+def test_file_response_single_range(range_file: Path, chunk_size: int) -> None:
+    content = range_file.read_bytes()
+
+    @get("/", media_type="application/octet-stream")
+    def handler() -> File:
+        return File(path=range_file, chunk_size=chunk_size)
+
+    with create_test_client(handler) as client:
+        assert client.get("/").headers["accept-ranges"] == "bytes"
+
+        response = client.get("/", headers={"range": "bytes=10-19"})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert response.content == content[10:20]
+        assert response.headers["content-range"] == f"bytes 10-19/{len(content)}"
+        assert response.headers["content-length"] == "10"
+        assert response.headers["content-type"] == "application/octet-stream"
+
+        response = client.get("/", headers={"range": "bytes=-10"})
+        assert response.content == content[-10:]
+
+
+def test_file_response_multiple_ranges(range_file: Path) -> None:
+    content = range_file.read_bytes()
+
+    @get("/", media_type="text/plain")
+    def handler() -> File:
+        return File(path=range_file, chunk_size=7)
+
+    with create_test_client(handler) as client:
+        response = client.get("/", headers={"range": "bytes=0-9, 500-"})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert response.headers["content-length"] == str(len(response.content))
+
+        media_type, boundary = response.headers["content-type"].split("; boundary=")
+        assert media_type == "multipart/byteranges"
+        parts = response.content.split(f"--{boundary}".encode())
+        assert parts[0] == b""
+        assert parts[-1] == b"--"
+        assert parts[1:-1] == [
+            (
+                "\r\nContent-Type: text/plain; charset=utf-8\r\n"
+                f"Content-Range: bytes {start}-{end}/{len(content)}\r\n\r\n"
+            ).encode()
+            + content[start : end + 1]
+            + b"\r\n"
+            for start, end in ((0, 9), (500, len(content) - 1))
+        ]
+
+
+def test_file_response_range_not_satisfiable(range_file: Path) -> None:
+    @get("/")
+    def handler() -> File:
+        return File(path=range_file)
+
+    with create_test_client(handler) as client:
+        response = client.get("/", headers={"range": "bytes=5000-"})
+        assert response.status_code == HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE
+        assert response.headers["content-range"] == "bytes */1024"
+        assert response.content == b""
+
+
+def test_file_response_if_range(range_file: Path) -> None:
+    @get("/")
+    def handler() -> File:
+        return File(path=range_file)
+
+    with create_test_client(handler) as client:
+        response = client.get("/")
+        etag, last_modified = response.headers["etag"], response.headers["last-modified"]
+
+        for if_range in (etag, last_modified):
+            response = client.get("/", headers={"range": "bytes=0-1", "if-range": if_range})
+            assert response.status_code == HTTP_206_PARTIAL_CONTENT
+
+        for if_range in ('"other"', f"W/{etag}", formatdate(range_file.stat().st_mtime - 10, usegmt=True)):
+            response = client.get("/", headers={"range": "bytes=0-1", "if-range": if_range})
+            assert response.status_code == HTTP_200_OK
+            assert len(response.content) == 1024
+
+
+def test_file_response_range_is_not_compressed(range_file: Path) -> None:
+    @get("/")
+    def handler() -> File:
+        return File(path=range_file)
+
+    with create_test_client(handler, compression_config=CompressionConfig(backend="gzip", minimum_size=1)) as client:
+        response = client.get("/", headers={"range": "bytes=0-99", "accept-encoding": "gzip"})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert "content-encoding" not in response.headers
+        assert response.content == range_file.read_bytes()[:100]
+
+
+async def _send_with_zerocopysend(response: ASGIFileResponse, headers: Optional[Dict[str, str]] = None) -> List[Any]:
+    """Call the response like a server supporting the ``http.response.zerocopysend`` extension, returning the
+    messages it sent, with the files of ``http.response.zerocopysend`` messages replaced by the bytes they refer to.
+    """
+    scope: Any = {
+        "type": "http",
+        "method": "GET",
+        "headers": [(name.encode(), value.encode()) for name, value in (headers or {}).items()],
+        "extensions": {"http.response.zerocopysend": {}},
+    }
+    messages: List[Any] = []
+    complete = Event()
+
+    async def receive() -> Any:
+        await complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.zerocopysend":
+            message = {**message, "file": os.pread(message["file"].fileno(), message["count"], message["offset"])}
+        if message["type"] != "http.response.start" and not message["more_body"]:
+            complete.set()
+        messages.append(message)
+
+    await response(scope, receive, send)
+    return messages
+
+
+async def test_file_response_zerocopysend(range_file: Path) -> None:
+    content = range_file.read_bytes()
+
+    messages = await _send_with_zerocopysend(ASGIFileResponse(file_path=range_file, chunk_size=100))
+    assert messages[0]["status"] == HTTP_200_OK
+    assert messages[1:] == [
+        {"type": "http.response.zerocopysend", "file": content, "offset": 0, "count": 1024, "more_body": False}
+    ]
+
+    messages = await _send_with_zerocopysend(ASGIFileResponse(file_path=range_file), {"range": "bytes=10-19"})
+    assert messages[0]["status"] == HTTP_206_PARTIAL_CONTENT
+    assert messages[1:] == [
+        {"type": "http.response.zerocopysend", "file": content[10:20], "offset": 10, "count": 10, "more_body": False}
+    ]
+
+
+async def test_file_response_zerocopysend_multiple_ranges(range_file: Path) -> None:
+    content = range_file.read_bytes()
+
+    response = ASGIFileResponse(file_path=range_file)
+    messages = await _send_with_zerocopysend(response, {"range": "bytes=0-9, 500-"})
+    assert messages[0]["status"] == HTTP_206_PARTIAL_CONTENT
+    assert [message["type"] for message in messages[1:]] == [
+        "http.response.body",
+        "http.response.zerocopysend",
+        "http.response.body",
+        "http.response.body",
+        "http.response.zerocopysend",
+        "http.response.body",
+        "http.response.body",
+    ]
+    assert [message["more_body"] for message in messages[1:]] == [True] * 6 + [False]
+
+    body = b"".join(message.get("body", message.get("file")) for message in messages[1:])
+    assert len(body) == response.content_length
+    _, boundary = dict(messages[0]["headers"])[b"content-type"].decode().split("; boundary=")
+    parts = body.split(f"--{boundary}".encode())
+    assert [part.rsplit(b"\r\n\r\n", 1)[1] for part in parts[1:-1]] == [content[:10] + b"\r\n", content[500:] + b"\r\n"]
+    assert parts[-1] == b"--"
+
+
+class MemoryFileSystem:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def info(self, path: Any, **kwargs: Any) -> Any:
+        return {"name": str(path), "size": len(self.content), "type": "file", "mtime": 0.0}
+
+    def open(self, file: Any, mode: str, buffering: int = -1) -> BytesIO:
+        return BytesIO(self.content)
+
+
+@pytest.mark.parametrize("chunk_size", [100, 1024 * 1024])
+async def test_file_response_zerocopysend_falls_back_without_file_descriptor(chunk_size: int) -> None:
+    content = urandom(1000)
+    response = ASGIFileResponse(file_path="file", file_system=MemoryFileSystem(content), chunk_size=chunk_size)
+
+    messages = await _send_with_zerocopysend(response)
+    assert {message["type"] for message in messages[1:]} == {"http.response.body"}
+    assert b"".join(message["body"] for message in messages[1:]) == content
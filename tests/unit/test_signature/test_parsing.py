@@ -1,6 +1,6 @@
 from types import ModuleType
 from typing import Any, Callable, Iterable, List, Optional, Sequence, Union
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pydantic import BaseModel
@@ -8,6 +8,7 @@ from typing_extensions import Annotated
 
 from litestar import get
 from litestar._signature import SignatureModel
+from litestar.exceptions import InternalServerException, ValidationException
 from litestar.params import Body, Parameter
 from litestar.status_codes import HTTP_200_OK, HTTP_204_NO_CONTENT
 from litestar.testing import RequestFactory, TestClient, create_test_client
@@ -164,3 +165,70 @@ def test_union_constraint_handling() -> None:
 
     assert response.status_code == 200
     mock.assert_called_once_with("foo")
+
+
+class _Service:
+    pass
+
+
+def test_parse_values_without_conversion() -> None:
+    def fn(request: Any, a: str, service: _Service, b: str = "default") -> None:
+        pass
+
+    model = SignatureModel.create(
+        fn=fn, dependency_name_set={"service"}, parsed_signature=ParsedSignature.from_fn(fn, {"_Service": _Service})
+    )
+    assert model._unconverted_fields is not None
+    assert set(model._unconverted_fields) == {"request", "a", "service", "b"}
+    assert model._converted_fields_model is None
+
+    request = RequestFactory().get()
+    service = _Service()
+    with patch("litestar._signature.model.convert") as mock_convert:
+        result = model.parse_values_from_connection_kwargs(connection=request, request=request, a="a", service=service)
+    mock_convert.assert_not_called()
+    assert result == {"request": request, "a": "a", "service": service, "b": "default"}
+
+
+def test_parse_values_converts_only_required_fields() -> None:
+    def fn(a: str, b: int, service: _Service) -> None:
+        pass
+
+    model = SignatureModel.create(
+        fn=fn, dependency_name_set={"service"}, parsed_signature=ParsedSignature.from_fn(fn, {"_Service": _Service})
+    )
+    assert model._unconverted_fields is not None
+    assert set(model._unconverted_fields) == {"service"}
+    assert model._converted_fields_model is not None
+
+    service = _Service()
+    result = model.parse_values_from_connection_kwargs(connection=RequestFactory().get(), a="a", b="1", service=service)
+    assert result == {"a": "a", "b": 1, "service": service}
+
+
+def test_parse_values_without_conversion_falls_back_to_validation() -> None:
+    def fn(a: str, service: _Service) -> None:
+        pass
+
+    model = SignatureModel.create(
+        fn=fn, dependency_name_set={"service"}, parsed_signature=ParsedSignature.from_fn(fn, {"_Service": _Service})
+    )
+    with pytest.raises(ValidationException) as exc_info:
+        model.parse_values_from_connection_kwargs(connection=RequestFactory().get(), a=1, service=_Service())
+    assert exc_info.value.extra == [{"key": "a", "message": "Expected `str`, got `int`"}]
+
+    with pytest.raises(InternalServerException):
+        model.parse_values_from_connection_kwargs(connection=RequestFactory().get(), a="a", service=object())
+
+
+def test_parse_values_without_conversion_does_not_hide_unexpected_errors() -> None:
+    def fn(a: str, service: _Service) -> None:
+        pass
+
+    model = SignatureModel.create(
+        fn=fn, dependency_name_set={"service"}, parsed_signature=ParsedSignature.from_fn(fn, {"_Service": _Service})
+    )
+    with patch.object(model, "_parse_values_without_struct", side_effect=RuntimeError("bug")), pytest.raises(
+        RuntimeError
+    ):
+        model.parse_values_from_connection_kwargs(connection=RequestFactory().get(), a="a", service=_Service())
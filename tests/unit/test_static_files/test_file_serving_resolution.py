@@ -8,9 +8,10 @@ import pytest
 from fsspec.implementations.local import LocalFileSystem
 
 from litestar import MediaType, get
+from litestar.config.compression import CompressionConfig
 from litestar.file_system import BaseLocalFileSystem
 from litestar.static_files.config import StaticFilesConfig
-from litestar.status_codes import HTTP_200_OK
+from litestar.status_codes import HTTP_200_OK, HTTP_206_PARTIAL_CONTENT, HTTP_304_NOT_MODIFIED, HTTP_404_NOT_FOUND
 from litestar.testing import create_test_client
 
 if TYPE_CHECKING:
@@ -219,3 +220,99 @@ def test_service_from_relative_path_using_path(tmpdir: "Path") -> None:
         response = client.get("/static/test.txt")
         assert response.status_code == HTTP_200_OK
         assert response.text == "content"
+
+
+def test_static_files_not_modified(tmpdir: "Path") -> None:
+    path = tmpdir / "test.txt"
+    path.write_text("content", "utf-8")
+    static_files_config = StaticFilesConfig(path="/static", directories=[tmpdir])
+
+    with create_test_client([], static_files_config=[static_files_config]) as client:
+        etag = client.get("/static/test.txt").headers["etag"]
+        for method in ("GET", "HEAD"):
+            response = client.request(method, "/static/test.txt", headers={"if-none-match": etag})
+            assert response.status_code == HTTP_304_NOT_MODIFIED
+            assert response.content == b""
+
+
+def test_static_files_html_mode_404_ignores_conditional_headers(tmpdir: "Path") -> None:
+    path = tmpdir / "404.html"
+    path.write_text("not found", "utf-8")
+    static_files_config = StaticFilesConfig(path="/static", directories=[tmpdir], html_mode=True)
+
+    with create_test_client([], static_files_config=[static_files_config]) as client:
+        etag = client.get("/static/missing.txt").headers["etag"]
+        response = client.get("/static/missing.txt", headers={"if-none-match": etag})
+        assert response.status_code == HTTP_404_NOT_FOUND
+        assert response.text == "not found"
+
+
+def test_static_files_range(tmpdir: "Path") -> None:
+    path = tmpdir / "test.txt"
+    path.write_text("0123456789", "utf-8")
+    static_files_config = StaticFilesConfig(path="/static", directories=[tmpdir])
+
+    with create_test_client([], static_files_config=[static_files_config]) as client:
+        response = client.get("/static/test.txt", headers={"range": "bytes=2-4"})
+        assert response.status_code == HTTP_206_PARTIAL_CONTENT
+        assert response.text == "234"
+        assert response.headers["content-range"] == "bytes 2-4/10"
+
+        # ranges only apply to GET requests
+        response = client.head("/static/test.txt", headers={"range": "bytes=2-4"})
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-length"] == "10"
+
+
+def test_static_files_precompressed(tmp_path: Path) -> None:
+    tmp_path.joinpath("app.js").write_text("original", "utf-8")
+    tmp_path.joinpath("app.js.br").write_bytes(brotli.compress(b"brotli"))
+    tmp_path.joinpath("app.js.gz").write_bytes(gzip.compress(b"gzip"))
+    static_files_config = StaticFilesConfig(path="/static", directories=[tmp_path], precompressed=True)
+
+    with create_test_client([], static_files_config=[static_files_config]) as client:
+        response = client.get("/static/app.js", headers={"accept-encoding": "gzip, br"})
+        assert response.text == "brotli"
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["content-type"].startswith(mimetypes.guess_type("app.js")[0])
+        assert response.headers["vary"] == "accept-encoding"
+        brotli_etag = response.headers["etag"]
+
+        response = client.get("/static/app.js", headers={"accept-encoding": "gzip, br;q=0.5"})
+        assert response.text == "gzip"
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] != brotli_etag
+
+        response = client.get("/static/app.js", headers={"accept-encoding": "zstd"})
+        assert response.text == "original"
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "accept-encoding"
+        assert response.headers["etag"] != brotli_etag
+
+        response = client.get("/static/app.js", headers={"accept-encoding": "br", "if-none-match": brotli_etag})
+        assert response.status_code == HTTP_304_NOT_MODIFIED
+
+
+def test_static_files_precompressed_disabled(tmp_path: Path) -> None:
+    tmp_path.joinpath("app.js").write_text("original", "utf-8")
+    tmp_path.joinpath("app.js.br").write_bytes(brotli.compress(b"brotli"))
+    static_files_config = StaticFilesConfig(path="/static", directories=[tmp_path])
+
+    with create_test_client([], static_files_config=[static_files_config]) as client:
+        response = client.get("/static/app.js", headers={"accept-encoding": "br"})
+        assert response.text == "original"
+        assert "content-encoding" not in response.headers
+        assert "vary" not in response.headers
+
+
+def test_static_files_precompressed_are_not_compressed_again(tmp_path: Path) -> None:
+    tmp_path.joinpath("app.js").write_text("original" * 100, "utf-8")
+    tmp_path.joinpath("app.js.gz").write_bytes(gzip.compress(b"gzip" * 100))
+    static_files_config = StaticFilesConfig(path="/static", directories=[tmp_path], precompressed=True)
+
+    with create_test_client(
+        [], static_files_config=[static_files_config], compression_config=CompressionConfig(backend="gzip")
+    ) as client:
+        response = client.get("/static/app.js", headers={"accept-encoding": "gzip"})
+        assert response.text == "gzip" * 100
+        assert response.headers["content-encoding"] == "gzip"
@@ -0,0 +1,141 @@
+from pathlib import Path
+from typing import Any
+
+import anyio
+import pytest
+
+from litestar.exceptions import ImproperlyConfiguredException
+from litestar.static_files import StaticFilesConfig, StaticFilesIndex
+from litestar.status_codes import HTTP_200_OK, HTTP_206_PARTIAL_CONTENT, HTTP_304_NOT_MODIFIED, HTTP_404_NOT_FOUND
+from litestar.testing import create_test_client
+
+
+@pytest.fixture()
+def static_dir(tmp_path: Path) -> Path:
+    tmp_path.joinpath("small.txt").write_text("small")
+    tmp_path.joinpath("large.txt").write_bytes(b"x" * 100)
+    tmp_path.joinpath("sub").mkdir()
+    tmp_path.joinpath("sub", "index.html").write_text("<html></html>")
+    return tmp_path
+
+
+def test_static_files_index(static_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    static_files_config = StaticFilesConfig(
+        path="/static", directories=[static_dir], html_mode=True, index=True, index_cache_max_file_size=20
+    )
+
+    with create_test_client([], static_files_config=[static_files_config]) as client:
+        static_dir.joinpath("new.txt").write_text("new")
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise AssertionError("the thread pool was used")
+
+        # indexed files that are kept in memory are served without file system calls
+        with monkeypatch.context() as patch:
+            patch.setattr(anyio.to_thread, "run_sync", fail)
+            response = client.get("/static/small.txt")
+            assert response.status_code == HTTP_200_OK
+            assert response.text == "small"
+
+            response = client.get("/static/sub/")
+            assert response.status_code == HTTP_200_OK
+            assert response.text == "<html></html>"
+
+            etag = client.get("/static/small.txt").headers["etag"]
+            response = client.get("/static/small.txt", headers={"if-none-match": etag})
+            assert response.status_code == HTTP_304_NOT_MODIFIED
+
+            response = client.get("/static/small.txt", headers={"range": "bytes=1-2"})
+            assert response.status_code == HTTP_206_PARTIAL_CONTENT
+            assert response.text == "ma"
+
+            # files created after the scan are not indexed
+            assert client.get("/static/new.txt").status_code == HTTP_404_NOT_FOUND
+
+        response = client.get("/static/large.txt")
+        assert response.status_code == HTTP_200_OK
+        assert response.content == b"x" * 100
+
+
+def test_static_files_index_etags_match_file_system(static_dir: Path) -> None:
+    configs = [
+        StaticFilesConfig(path="/indexed", directories=[static_dir], index=True),
+        StaticFilesConfig(path="/static", directories=[static_dir]),
+    ]
+
+    with create_test_client([], static_files_config=configs) as client:
+        for file in ("small.txt", "large.txt"):
+            indexed_response, response = client.get(f"/indexed/{file}"), client.get(f"/static/{file}")
+            assert indexed_response.headers["etag"] == response.headers["etag"]
+            assert indexed_response.headers["last-modified"] == response.headers["last-modified"]
+
+
+def test_static_files_index_rescan(static_dir: Path, anyio_backend: str) -> None:
+    async def main() -> None:
+        async with StaticFilesIndex(directories=[static_dir], rescan_interval=0.01) as index:
+            with pytest.raises(FileNotFoundError):
+                await index.info(static_dir / "new.txt")
+
+            static_dir.joinpath("new.txt").write_text("new")
+            static_dir.joinpath("small.txt").write_text("changed")
+            await anyio.sleep(0.1)
+
+            assert (await index.info(static_dir / "new.txt"))["size"] == 3
+            async with await index.open(static_dir / "small.txt") as file:
+                assert await file.read() == b"changed"
+
+        # the rescan is stopped when the index is exited
+        assert index._task_group is None
+
+    anyio.run(main, backend=anyio_backend)
+
+
+async def test_static_files_index_cache_eviction(tmp_path: Path) -> None:
+    for name in ("a", "b", "c"):
+        tmp_path.joinpath(name).write_bytes(name.encode() * 10)
+
+    index = StaticFilesIndex(directories=[tmp_path], cache_max_file_size=10, cache_max_size=20)
+    await index.scan()
+    assert len(index._cache) == 2
+    assert index._cache_size == 20
+
+    for name in ("a", "b", "c"):
+        async with await index.open(tmp_path / name) as file:
+            assert await file.read() == name.encode() * 10
+        # the least recently used files are evicted
+        assert list(index._cache)[-1] == str(tmp_path / name)
+        assert index._cache_size == 20
+
+
+async def test_static_files_index_cache_concurrent_opens(tmp_path: Path) -> None:
+    for name in ("a", "b", "c"):
+        tmp_path.joinpath(name).write_bytes(name.encode() * 1000)
+
+    index = StaticFilesIndex(directories=[tmp_path], cache_max_file_size=1000, cache_max_size=2500)
+    await index.scan()
+    assert len(index._cache) == 2
+    (path,) = {str(tmp_path / name) for name in ("a", "b", "c")} - set(index._cache)
+
+    async def open_file() -> None:
+        async with await index.open(path) as file:
+            assert len(await file.read()) == 1000
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(open_file)
+
+    assert len(index._cache) == 2
+    assert list(index._cache)[-1] == path
+    assert index._cache_size == 2000
+
+
+def test_static_files_index_requires_local_file_system(tmp_path: Path) -> None:
+    class FileSystem:
+        def info(self) -> None:
+            return
+
+        def open(self) -> None:
+            return
+
+    with pytest.raises(ImproperlyConfiguredException):
+        StaticFilesConfig(path="/static", directories=[tmp_path], file_system=FileSystem(), index=True)
@@ -28,6 +28,11 @@ def test_config_validation_of_path(tmpdir: "Path") -> None:
         StaticFilesConfig(path="/{param:int}", directories=[tmpdir])
 
 
+def test_config_validation_of_precompressed_encodings(tmpdir: "Path") -> None:
+    with pytest.raises(ImproperlyConfiguredException):
+        StaticFilesConfig(path="/static", directories=[tmpdir], precompressed=True, precompressed_encodings=["deflate"])
+
+
 def test_config_validation_of_file_system(tmpdir: "Path") -> None:
     class FSWithoutOpen:
         def info(self) -> None:
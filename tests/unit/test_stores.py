@@ -4,21 +4,25 @@ import math
 import shutil
 import string
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Callable, cast
 from unittest.mock import MagicMock, Mock, patch
 
+import anyio
 import pytest
 from _pytest.fixtures import FixtureRequest
 from freezegun.api import FakeDatetime, FrozenDateTimeFactory  # type: ignore[attr-defined]
 from msgspec.msgpack import decode as decode_msgpack
 from pytest_mock import MockerFixture
 
+from litestar.channels import ChannelsPlugin
+from litestar.channels.backends.memory import MemoryChannelsBackend
 from litestar.exceptions import ImproperlyConfiguredException
 from litestar.serialization import encode_msgpack
 from litestar.stores.file import FileStore
 from litestar.stores.memory import MemoryStore
 from litestar.stores.redis import RedisStore
 from litestar.stores.registry import StoreRegistry
+from litestar.stores.tiered import TieredStore
 
 if TYPE_CHECKING:
     from redis.asyncio import Redis
@@ -151,6 +155,20 @@ async def test_delete_all(store: Store) -> None:
         assert await store.get(key) is None
 
 
+async def test_delete_prefix(store: Store) -> None:
+    await store.set("users:1", b"value")
+    await store.set("users:2", b"value", expires_in=10)
+    await store.set("user", b"value")
+    await store.set("orders:1", b"value")
+
+    await store.delete_prefix("users:")
+
+    assert await store.get("users:1") is None
+    assert await store.get("users:2") is None
+    assert await store.get("user") == b"value"
+    assert await store.get("orders:1") == b"value"
+
+
 @pytest.mark.usefixtures("patch_storage_obj_frozen_datetime")
 async def test_expires_in(store: Store, frozen_datetime: FrozenDateTimeFactory) -> None:
     if not isinstance(store, RedisStore):
@@ -223,6 +241,19 @@ async def test_redis_delete_all_no_namespace_raises(fake_redis: Redis) -> None:
         await redis_store.delete_all()
 
 
+@pytest.mark.parametrize("namespace, prefix", ((None, "users:"), (None, ""), ("LITESTAR", "")))
+async def test_redis_delete_prefix_without_namespace_or_prefix_raises(
+    fake_redis: Redis, namespace: str | None, prefix: str
+) -> None:
+    redis_store = RedisStore(redis=fake_redis, namespace=namespace)
+    await redis_store.set("users:1", b"value")
+
+    with pytest.raises(ImproperlyConfiguredException):
+        await redis_store.delete_prefix(prefix)
+
+    assert await redis_store.get("users:1") == b"value"
+
+
 def test_redis_namespaced_key(redis_store: RedisStore) -> None:
     assert redis_store.namespace == "LITESTAR"
     assert redis_store._make_key("foo") == "LITESTAR:foo"
@@ -356,3 +387,83 @@ def test_registry_register_exist_override(memory_store: MemoryStore) -> None:
 
     registry.register("foo", memory_store, allow_override=True)
     assert registry.get("foo") is memory_store
+
+
+async def test_memory_max_size_evicts_least_recently_used() -> None:
+    store = MemoryStore(max_size=2)
+    await store.set("foo", b"foo")
+    await store.set("bar", b"bar")
+    await store.get("foo")
+    await store.set("baz", b"baz")
+
+    assert await store.get("foo") == b"foo"
+    assert await store.get("bar") is None
+    assert await store.get("baz") == b"baz"
+
+
+@pytest.mark.usefixtures("patch_storage_obj_frozen_datetime")
+async def test_tiered_read_through_propagates_expiry(frozen_datetime: FrozenDateTimeFactory) -> None:
+    l1, l2 = MemoryStore(), MemoryStore()
+    store = TieredStore(l1=l1, l2=l2)
+    await l2.set("foo", b"bar", expires_in=10)
+
+    assert await store.get("foo") == b"bar"
+    assert await l1.get("foo") == b"bar"
+    assert await l1.expires_in("foo") == 10
+
+    await l2.set("foo", b"changed", expires_in=10)
+    assert await store.get("foo") == b"bar"
+
+    frozen_datetime.tick(10)
+    assert await l1.get("foo") is None
+    assert await store.get("foo") is None
+
+
+async def test_tiered_write_through() -> None:
+    l1, l2 = MemoryStore(), MemoryStore()
+    store = TieredStore(l1=l1, l2=l2)
+
+    await store.set("foo", b"bar", expires_in=10)
+    assert await l1.get("foo") == await l2.get("foo") == b"bar"
+
+    await store.delete("foo")
+    assert await l1.get("foo") is None
+    assert await l2.get("foo") is None
+
+
+@pytest.mark.usefixtures("patch_storage_obj_frozen_datetime")
+@pytest.mark.parametrize("expires_in", [None, 60])
+async def test_tiered_max_l1_expires_in(expires_in: int | None, frozen_datetime: FrozenDateTimeFactory) -> None:
+    l1, l2 = MemoryStore(), MemoryStore()
+    store = TieredStore(l1=l1, l2=l2, max_l1_expires_in=5)
+    await store.set("written", b"bar", expires_in=expires_in)
+    await l2.set("read", b"bar", expires_in=expires_in)
+    await store.get("read")
+
+    assert await l1.expires_in("written") == 5
+    assert await l1.expires_in("read") == 5
+
+
+async def wait_until(condition: Callable[[], bool]) -> None:
+    with anyio.fail_after(1):
+        while not condition():
+            await anyio.sleep(0.001)
+
+
+async def test_tiered_invalidation_broadcast() -> None:
+    channels = ChannelsPlugin(backend=MemoryChannelsBackend(), channels=["invalidations"])
+    l2 = MemoryStore()
+    store_one = TieredStore(l1=MemoryStore(), l2=l2, channels=channels, invalidation_channel="invalidations")
+    store_two = TieredStore(l1=MemoryStore(), l2=l2, channels=channels, invalidation_channel="invalidations")
+
+    async with channels:
+        await store_one.set("foo", b"one")
+        assert await store_two.get("foo") == b"one"
+
+        await store_one.set("foo", b"two")
+        await wait_until(lambda: store_two.l1._store.get("foo") is None)  # type: ignore[attr-defined]
+        assert await store_two.get("foo") == b"two"
+
+        await store_two.delete_all()
+        await wait_until(lambda: not store_one.l1._store)  # type: ignore[attr-defined]
+        assert await store_one.get("foo") is None
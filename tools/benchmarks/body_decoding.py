@@ -0,0 +1,95 @@
+"""Compare decoding JSON request bodies into builtins and converting them with decoding them directly into the type of
+the ``data`` kwarg.
+
+Run with ``python -m tools.benchmarks.body_decoding [--sizes 1 5] [--rounds 5]``, sizes being in megabytes.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, List
+
+from litestar import Litestar, Request, post
+from litestar._kwargs.extractors import json_extractor
+from litestar.serialization import encode_json
+from litestar.testing import RequestFactory
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--sizes", type=int, nargs="+", default=[1, 5])
+parser.add_argument("--rounds", type=int, default=5)
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+    tags: List[str]  # noqa: UP006
+    price: float
+
+
+def create_body(size: int) -> bytes:
+    item = {"id": 0, "name": "item", "tags": ["a", "b", "c"], "price": 1.5}
+    item_size = len(encode_json(item)) + 1
+    return encode_json([{**item, "id": i} for i in range(size * 1024 * 1024 // item_size)])
+
+
+def measure(
+    app: Litestar, body: bytes, extract_data: Callable[[Request], Coroutine[Any, Any, Any]], rounds: int
+) -> tuple[float, float]:
+    route_handler, _ = app.routes[0].route_handler_map["POST"]  # type: ignore[union-attr]
+    signature_model = route_handler.signature_model
+    request_factory = RequestFactory(app=app)
+
+    async def parse(request: Request) -> None:
+        data = await extract_data(request)
+        signature_model.parse_values_from_connection_kwargs(connection=request, data=data)  # type: ignore[union-attr]
+
+    def create_request() -> Request:
+        request = request_factory.post("/")
+        request._body = body
+        return request
+
+    elapsed: list[float] = []
+    for _ in range(rounds):
+        request = create_request()
+        start = time.perf_counter()
+        asyncio.run(parse(request))
+        elapsed.append(time.perf_counter() - start)
+
+    # tracing allocations slows down decoding considerably, so peak memory is measured separately
+    request = create_request()
+    tracemalloc.start()
+    asyncio.run(parse(request))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(elapsed) * 1000, peak / 1024 / 1024
+
+
+def main() -> None:
+    args = parser.parse_args()
+
+    @post("/", sync_to_thread=False)
+    def handler(data: List[Item]) -> None:  # noqa: UP006
+        return None
+
+    app = Litestar(route_handlers=[handler], openapi_config=None)
+    _, kwargs_model = app.routes[0].route_handler_map["POST"]  # type: ignore[union-attr]
+
+    async def typed_extract_data(request: Request) -> Any:
+        values: dict[str, Any] = {}
+        kwargs_model.extractors[0](values, request)
+        return await values["data"]
+
+    print(f"{'size MB':>7} {'builtins ms':>12} {'typed ms':>9} {'builtins peak MB':>17} {'typed peak MB':>14}")
+    for size in args.sizes:
+        body = create_body(size)
+        builtins_ms, builtins_peak = measure(app, body, json_extractor, args.rounds)
+        typed_ms, typed_peak = measure(app, body, typed_extract_data, args.rounds)
+        print(f"{size:>7} {builtins_ms:>12.1f} {typed_ms:>9.1f} {builtins_peak:>17.1f} {typed_peak:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
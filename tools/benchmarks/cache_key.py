@@ -0,0 +1,54 @@
+"""Compare building response cache keys from the decoded query parameters with sorting the raw query string.
+
+Run with ``python -m tools.benchmarks.cache_key [--params 0 3 10] [--requests 20000]``.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import urlencode
+
+from litestar.config.response_cache import default_cache_key_builder
+from litestar.testing import RequestFactory
+
+if TYPE_CHECKING:
+    from litestar import Request
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--params", type=int, nargs="+", default=[0, 3, 10])
+parser.add_argument("--requests", type=int, default=20_000)
+
+
+def decoding_cache_key_builder(request: Request[Any, Any, Any]) -> str:
+    query_params: list[tuple[str, Any]] = list(request.query_params.dict().items())
+    query_params.sort(key=lambda x: x[0])
+    return request.url.path + urlencode(query_params, doseq=True)
+
+
+def measure(param_count: int, request_count: int, key_builder: Callable[[Request[Any, Any, Any]], str]) -> float:
+    request_factory = RequestFactory()
+    # unique query strings per request, so that parsing is not served from the parser cache
+    requests = [
+        request_factory.get("/items", query_params={f"filter_{n}": f"v{n}-{i}" for n in range(param_count)})
+        for i in range(request_count)
+    ]
+
+    start = time.perf_counter()
+    for request in requests:
+        key_builder(request)
+    return (time.perf_counter() - start) / request_count * 1e9
+
+
+def main() -> None:
+    args = parser.parse_args()
+
+    print(f"{'params':>6} {'decoding ns/op':>15} {'raw ns/op':>10} {'speedup':>8}")
+    for param_count in args.params:
+        decoding_ns = measure(param_count, args.requests, decoding_cache_key_builder)
+        raw_ns = measure(param_count, args.requests, default_cache_key_builder)
+        print(f"{param_count:>6} {decoding_ns:>15.0f} {raw_ns:>10.0f} {decoding_ns / raw_ns:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Measure the latency of small responses while large responses are compressed, with and without offloading the
+compression of large bodies to a worker thread.
+
+Small and large requests are sent to an app with the compression middleware concurrently, through its ASGI interface.
+The latency percentiles of the small requests, including the time they would have waited for the event loop, are
+reported for each backend.
+
+Run with ``python -m tools.benchmarks.compression_offload [--size-mb 5] [--large-requests 4] [--small-requests 200]``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Literal
+
+from litestar import Litestar, get
+from litestar.config.compression import CompressionConfig
+from litestar.middleware.compression import BACKEND_ENCODINGS
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--size-mb", type=float, default=5)
+parser.add_argument("--large-requests", type=int, default=4)
+parser.add_argument("--small-requests", type=int, default=200)
+parser.add_argument("--brotli-quality", type=int, default=11)
+
+
+def create_app(config: CompressionConfig, size: int) -> Litestar:
+    large_body = [{"id": i, "name": f"item-{i}", "tags": ["litestar", "compression"]} for i in range(size // 60)]
+
+    @get("/large", sync_to_thread=False)
+    def large() -> list[dict[str, Any]]:
+        return large_body
+
+    @get("/small", sync_to_thread=False)
+    def small() -> dict[str, str]:
+        return {"hello": "world"}
+
+    return Litestar([large, small], compression_config=config, openapi_config=None)
+
+
+async def request(app: Litestar, path: str, encoding: str) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", encoding.encode())],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+        "state": {},
+    }
+    done = asyncio.Event()
+
+    async def receive() -> dict[str, Any]:
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.body" and not message.get("more_body"):
+            done.set()
+
+    start = time.perf_counter()
+    await app(scope, receive, send)  # type: ignore[arg-type]
+    return time.perf_counter() - start
+
+
+async def measure(app: Litestar, encoding: str, large_requests: int, small_requests: int) -> list[float]:
+    async def small_requests_loop() -> list[float]:
+        latencies = []
+        for _ in range(small_requests):
+            # the time a request would have waited for the event loop is part of its latency
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            delay = time.perf_counter() - start - 0.001
+            latencies.append(delay + await request(app, "/small", encoding))
+        return latencies
+
+    large = [asyncio.create_task(request(app, "/large", encoding)) for _ in range(large_requests)]
+    latencies = await small_requests_loop()
+    await asyncio.gather(*large)
+    return latencies
+
+
+def main() -> None:
+    args = parser.parse_args()
+    size = int(args.size_mb * 1024 * 1024)
+    backends: tuple[Literal["gzip", "brotli", "zstd"], ...] = ("gzip", "brotli", "zstd")
+
+    print(f"{'backend':>8} {'offload':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for backend in backends:
+        for offload_minimum_size in (None, 256 * 1024):
+            config = CompressionConfig(
+                backend=backend,
+                brotli_quality=args.brotli_quality,
+                minimum_size=1,
+                offload_minimum_size=offload_minimum_size,
+            )
+            app = create_app(config, size)
+            latencies = asyncio.run(measure(app, BACKEND_ENCODINGS[backend], args.large_requests, args.small_requests))
+            percentiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"{backend:>8} {'yes' if offload_minimum_size else 'no':>8} {percentiles[49] * 1000:>8.2f} "
+                f"{percentiles[98] * 1000:>8.2f} {max(latencies) * 1000:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare sending a file over a socket in chunks read into memory with sending it with ``os.sendfile``.
+
+The chunked strategy is what servers do with ``http.response.body`` events emitted by file responses, the zero-copy
+one what servers supporting the ``http.response.zerocopysend`` extension do. The throughput and the CPU time spent by
+the sending thread per GB sent are reported.
+
+Run with ``python -m tools.benchmarks.file_sending [--size-mb 256] [--chunk-size-kb 1024] [--rounds 5]``.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import tempfile
+import threading
+import time
+from typing import BinaryIO, Callable
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--size-mb", type=int, default=256)
+parser.add_argument("--chunk-size-kb", type=int, default=1024)
+parser.add_argument("--rounds", type=int, default=5)
+
+
+def send_chunked(file: BinaryIO, sock: socket.socket, size: int, chunk_size: int) -> None:
+    file.seek(0)
+    while chunk := file.read(chunk_size):
+        sock.sendall(chunk)
+
+
+def send_zerocopy(file: BinaryIO, sock: socket.socket, size: int, chunk_size: int) -> None:
+    offset = 0
+    while offset < size:
+        offset += os.sendfile(sock.fileno(), file.fileno(), offset, size - offset)
+
+
+def drain(sock: socket.socket) -> None:
+    buffer = bytearray(1024 * 1024)
+    while sock.recv_into(buffer):
+        pass
+
+
+def measure(
+    send: Callable[[BinaryIO, socket.socket, int, int], None], file: BinaryIO, size: int, chunk_size: int
+) -> tuple[float, float]:
+    sender, receiver = socket.socketpair()
+    reader = threading.Thread(target=drain, args=(receiver,))
+    reader.start()
+
+    start, start_cpu = time.perf_counter(), time.thread_time()
+    send(file, sender, size, chunk_size)
+    elapsed, cpu = time.perf_counter() - start, time.thread_time() - start_cpu
+
+    sender.close()
+    reader.join()
+    receiver.close()
+    return size / elapsed / 1e6, cpu / size * 1e9
+
+
+def main() -> None:
+    args = parser.parse_args()
+    size = args.size_mb * 1024 * 1024
+    chunk_size = args.chunk_size_kb * 1024
+
+    with tempfile.TemporaryFile() as file:
+        file.write(os.urandom(size))
+        file.flush()
+
+        print(f"{'strategy':>9} {'MB/s':>8} {'CPU s/GB':>9}")
+        for name, send in (("chunked", send_chunked), ("zerocopy", send_zerocopy)):
+            results = [measure(send, file, size, chunk_size) for _ in range(args.rounds)]
+            throughput = max(result[0] for result in results)
+            cpu_per_gb = min(result[1] for result in results)
+            print(f"{name:>9} {throughput:>8.0f} {cpu_per_gb:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compare extracting header and cookie parameters from fully parsed headers and cookies with decoding only the
+declared ones.
+
+Run with ``python -m tools.benchmarks.headers [--headers 10 30 50] [--cookies 20] [--requests 20000]``.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from typing_extensions import Annotated  # noqa: TCH002
+
+from litestar import Litestar, get
+from litestar.params import Parameter  # noqa: TCH001
+from litestar.testing import RequestFactory
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--headers", type=int, nargs="+", default=[10, 30, 50])
+parser.add_argument("--cookies", type=int, default=20)
+parser.add_argument("--requests", type=int, default=20_000)
+
+
+@get("/", sync_to_thread=False)
+def handler(
+    token: Annotated[str, Parameter(header="x-api-key")],
+    session: Annotated[str, Parameter(cookie="session")],
+) -> None:
+    return None
+
+
+def measure(header_count: int, cookie_count: int, request_count: int, materialize: bool) -> float:
+    app = Litestar(route_handlers=[handler], openapi_config=None)
+    _, kwargs_model = app.routes[0].route_handler_map["GET"]  # type: ignore[union-attr]
+    request_factory = RequestFactory(app=app)
+
+    # unique values per request, as sent by browsers, so that parsing is not served from the parser cache
+    requests = [
+        request_factory.get(
+            "/",
+            headers={
+                "x-api-key": "key",
+                "x-request-id": str(i),
+                **{f"x-header-{n}": f"value-{n}" for n in range(header_count - 2)},
+            },
+            cookies="; ".join([f"session=s{i}", *(f"cookie_{n}=%22value%20{n}%22" for n in range(cookie_count))]),
+        )
+        for i in range(request_count)
+    ]
+
+    start = time.perf_counter()
+    for request in requests:
+        if materialize:
+            _ = request.cookies
+        kwargs_model.to_kwargs(request)
+    return (time.perf_counter() - start) / request_count * 1e9
+
+
+def main() -> None:
+    args = parser.parse_args()
+
+    print(f"{'headers':>7} {'materialized ns/op':>19} {'lazy ns/op':>11} {'speedup':>8}")
+    for header_count in args.headers:
+        materialized_ns = measure(header_count, args.cookies, args.requests, materialize=True)
+        lazy_ns = measure(header_count, args.cookies, args.requests, materialize=False)
+        print(f"{header_count:>7} {materialized_ns:>19.0f} {lazy_ns:>11.0f} {materialized_ns / lazy_ns:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compare kwargs extraction of the generic extractors with the compiled kwargs extractors.
+
+Run with ``python -m tools.benchmarks.kwargs [--params 5 10 15] [--requests 20000]``.
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import time
+from typing import Any, Callable
+
+from litestar import Litestar, get
+from litestar.config.routing import RoutingConfig
+from litestar.params import Parameter
+from litestar.testing import RequestFactory
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--params", type=int, nargs="+", default=[5, 10, 15])
+parser.add_argument("--requests", type=int, default=20_000)
+
+
+def create_handler_fn(param_count: int) -> tuple[Callable[..., None], str]:
+    """Create a handler function receiving ``param_count`` path, query, header and cookie parameters."""
+    parameters = [inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation="Request")]
+    path_components = ["items"]
+    for i in range(param_count):
+        name, kind = f"param_{i}", i % 4
+        if kind == 0:
+            path_components.append(f"{{{name}:str}}")
+            default: Any = inspect.Parameter.empty
+        elif kind == 1:
+            default = inspect.Parameter.empty
+        elif kind == 2:
+            default = Parameter(header=f"x-param-{i}")
+        else:
+            default = Parameter(cookie=name, required=False)
+        parameters.append(inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=default, annotation="str"))
+
+    def handler(**kwargs: Any) -> None:
+        return None
+
+    handler.__signature__ = inspect.Signature(parameters, return_annotation="None")  # type: ignore[attr-defined]
+    handler.__annotations__ = {parameter.name: parameter.annotation for parameter in parameters} | {"return": "None"}
+    return handler, "/" + "/".join(path_components)
+
+
+def measure(param_count: int, request_count: int, compiled_kwargs_extractors: bool) -> float:
+    handler_fn, path = create_handler_fn(param_count)
+    app = Litestar(
+        route_handlers=[get(path, sync_to_thread=False, signature_namespace={"Request": Any})(handler_fn)],
+        openapi_config=None,
+        routing_config=RoutingConfig(compiled_kwargs_extractors=compiled_kwargs_extractors),
+    )
+    _, kwargs_model = app.routes[0].route_handler_map["GET"]  # type: ignore[union-attr]
+
+    request_factory = RequestFactory(app=app)
+    names = [f"param_{i}" for i in range(param_count)]
+    requests = [
+        request_factory.get(
+            "/",
+            path_params={name: "value" for i, name in enumerate(names) if i % 4 == 0},
+            query_params={name: "value" for i, name in enumerate(names) if i % 4 == 1},
+            headers={f"x-param-{i}": "value" for i in range(param_count) if i % 4 == 2},
+            cookies="; ".join(f"{name}=value" for i, name in enumerate(names) if i % 4 == 3),
+        )
+        for _ in range(request_count)
+    ]
+
+    start = time.perf_counter()
+    for request in requests:
+        kwargs_model.to_kwargs(request)
+    return (time.perf_counter() - start) / request_count * 1e9
+
+
+def main() -> None:
+    args = parser.parse_args()
+
+    print(f"{'params':>6} {'extractors ns/op':>17} {'compiled ns/op':>15} {'speedup':>8}")
+    for param_count in args.params:
+        extractors_ns = measure(param_count, args.requests, compiled_kwargs_extractors=False)
+        compiled_ns = measure(param_count, args.requests, compiled_kwargs_extractors=True)
+        print(f"{param_count:>6} {extractors_ns:>17.0f} {compiled_ns:>15.0f} {extractors_ns / compiled_ns:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
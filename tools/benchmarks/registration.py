@@ -0,0 +1,63 @@
+"""Measure the time it takes to register route handlers on an application.
+
+Run with ``python -m tools.benchmarks.registration [--handlers 1000 2500 5000]``.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import TYPE_CHECKING
+
+from litestar import Litestar, get
+from litestar.config.routing import RoutingConfig
+
+if TYPE_CHECKING:
+    from litestar.handlers import HTTPRouteHandler
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--handlers", type=int, nargs="+", default=[1_000, 2_500, 5_000])
+parser.add_argument("--compiled-matcher", action="store_true")
+
+
+def create_handlers(handler_count: int) -> list[HTTPRouteHandler]:
+    def handler() -> None:
+        return None
+
+    def param_handler(item_id: int) -> None:
+        return None
+
+    return [
+        get(
+            f"/tenant-{i}/items/{{item_id:int}}" if i % 2 else f"/tenant-{i}/items",
+            name=f"handler-{i}",
+            sync_to_thread=False,
+        )(param_handler if i % 2 else handler)
+        for i in range(handler_count)
+    ]
+
+
+def main() -> None:
+    args = parser.parse_args()
+
+    print(f"{'handlers':>8} {'startup s':>10} {'us/handler':>11} {'register 100 ms':>16}")
+    for handler_count in args.handlers:
+        handlers = create_handlers(handler_count + 100)
+
+        start = time.perf_counter()
+        app = Litestar(
+            route_handlers=handlers[:handler_count],
+            openapi_config=None,
+            routing_config=RoutingConfig(compiled_matcher=args.compiled_matcher),
+        )
+        startup = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for handler in handlers[handler_count:]:
+            app.register(handler)
+        register_ms = (time.perf_counter() - start) * 1e3
+
+        print(f"{handler_count:>8} {startup:>10.2f} {startup / handler_count * 1e6:>11.0f} {register_ms:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare the hit latency and stored size of pickled cached responses with the msgspec cached response records.
+
+Run with ``python -m tools.benchmarks.response_cache [--sizes 1 100 1024] [--rounds 2000]``, sizes being in kilobytes.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import pickle
+import time
+from typing import TYPE_CHECKING, Callable
+
+from litestar import Litestar, Response
+from litestar._response_cache import decode_cached_response, encode_cached_response
+from litestar.background_tasks import BackgroundTask
+from litestar.datastructures import Cookie
+from litestar.stores.memory import MemoryStore
+from litestar.testing import RequestFactory
+
+if TYPE_CHECKING:
+    from litestar.response.base import ASGIResponse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1024])
+parser.add_argument("--rounds", type=int, default=2000)
+
+
+async def log() -> None:
+    return None
+
+
+def create_response(size: int) -> ASGIResponse:
+    app = Litestar(openapi_config=None)
+    response = Response(
+        b"x" * size * 1024,
+        media_type="application/octet-stream",
+        headers={f"x-header-{i}": f"value-{i}" for i in range(10)},
+        cookies=[Cookie(key="session", value="abc"), Cookie(key="theme", value="dark")],
+        background=BackgroundTask(log),
+    )
+    return response.to_asgi_response(app=app, request=RequestFactory(app=app).get("/"))  # type: ignore[return-value]
+
+
+def measure(store: MemoryStore, key: str, decode: Callable[[bytes], ASGIResponse | None], rounds: int) -> float:
+    async def hit() -> None:
+        value = await store.get(key)
+        assert value is not None
+        decode(value)
+
+    async def run() -> float:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await hit()
+        return (time.perf_counter() - start) / rounds * 1e6
+
+    return asyncio.run(run())
+
+
+def main() -> None:
+    args = parser.parse_args()
+    store = MemoryStore()
+
+    print(f"{'size KB':>7} {'pickle us':>10} {'msgspec us':>11} {'pickle bytes':>13} {'msgspec bytes':>14}")
+    for size in args.sizes:
+        response = create_response(size)
+        pickled = pickle.dumps(response, pickle.HIGHEST_PROTOCOL)
+        encoded = encode_cached_response(response)
+        assert encoded is not None
+        asyncio.run(store.set("pickle", pickled))
+        asyncio.run(store.set("msgspec", encoded))
+
+        pickle_us = measure(store, "pickle", pickle.loads, args.rounds)
+        msgspec_us = measure(store, "msgspec", decode_cached_response, args.rounds)
+        print(f"{size:>7} {pickle_us:>10.1f} {msgspec_us:>11.1f} {len(pickled):>13} {len(encoded):>14}")
+
+
+if __name__ == "__main__":
+    main()
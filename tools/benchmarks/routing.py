@@ -0,0 +1,78 @@
+"""Compare path resolution of the routing trie with the compiled route matcher.
+
+Run with ``python -m tools.benchmarks.routing [--routes 1000 10000 50000] [--lookups 20000]``.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable
+
+from litestar._asgi.routing_trie.compiler import compile_route_trie
+from litestar._asgi.routing_trie.traversal import traverse_compiled_route_map, traverse_route_map
+from litestar._asgi.routing_trie.types import ASGIHandlerTuple, PathParameterSentinel, RouteTrieNode, create_node
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--routes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+parser.add_argument("--lookups", type=int, default=20_000)
+parser.add_argument("--seed", type=int, default=0)
+
+SERVICES = 50
+
+
+def _add_route(root_node: RouteTrieNode, components: list[str]) -> None:
+    current_node = root_node
+    for component in components:
+        key: str | type[PathParameterSentinel] = component
+        if component.startswith("{"):
+            current_node.is_path_param_node = True
+            key = PathParameterSentinel
+        if key not in current_node.children:
+            current_node.children[key] = create_node()
+        current_node.child_keys = set(current_node.children.keys())
+        current_node = current_node.children[key]
+    current_node.asgi_handlers["GET"] = ASGIHandlerTuple(asgi_app=None, handler=None)  # type: ignore[arg-type]
+
+
+def build_trie(route_count: int) -> tuple[RouteTrieNode, list[str]]:
+    root_node = create_node()
+    paths: list[str] = []
+    for i in range(route_count):
+        service, resource = f"service-{i % SERVICES}", f"resource-{i // SERVICES}"
+        _add_route(root_node, ["api", "v1", service, resource, "{id:int}", "items", "{item_id:str}"])
+        paths.append(f"/api/v1/{service}/{resource}/{i}/items/item-{i}")
+    return root_node, paths
+
+
+def measure(matcher: Callable[[str], object], paths: list[str]) -> float:
+    start = time.perf_counter()
+    for path in paths:
+        matcher(path)
+    return (time.perf_counter() - start) / len(paths) * 1e9
+
+
+def main() -> None:
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print(f"{'routes':>8} {'trie ns/op':>12} {'compiled ns/op':>16} {'speedup':>8} {'compile ms':>11}")
+    for route_count in args.routes:
+        root_node, paths = build_trie(route_count)
+        lookups = [rng.choice(paths) for _ in range(args.lookups)]
+
+        start = time.perf_counter()
+        compiled_root_node = compile_route_trie(root_node)
+        compile_ms = (time.perf_counter() - start) * 1e3
+
+        trie_ns = measure(lambda path, node=root_node: traverse_route_map(root_node=node, path=path), lookups)
+        compiled_ns = measure(
+            lambda path, node=compiled_root_node: traverse_compiled_route_map(root_node=node, path=path), lookups
+        )
+        print(
+            f"{route_count:>8} {trie_ns:>12.0f} {compiled_ns:>16.0f} {trie_ns / compiled_ns:>7.2f}x {compile_ms:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()